@@ -3,60 +3,60 @@ Common Utilities
 
 This module provides common utility functions for path management, string formatting, etc.
 
+The names are imported from their submodules on first access, so importing this package does not
+load them.
+
 Copyright 2025 Daniel Robert Jackson
 """
 
-from .d_base_types  import (
-    format_number, to_number,
-    is_float_basic, is_basic_int, is_float, is_int, is_not_base10_int, is_number, is_scinot,
-    flt_bsc_rxs, flt_bsc_rgx, flt_rxs, flt_rgx,
-    int_bas_rxs, int_bas_rgx, int_bsc_rxs, int_bsc_rgx, int_rxs, int_rgx,
-    num_rxs, num_rgx,
-    sci_rxs, sci_rgx)
-from .d_intervals   import (
-    check_valid_interval_values,
-    extract_interval_elements,
-    format_interval,
-    is_float_interval, is_int_interval, is_interval_str,
-    to_interval,
-    interval_rxs, interval_rgx
-    )
-from .d_paths       import BaseProjectPaths
-from .d_times       import format_run_time
-
-__all__ = [
-    "BaseProjectPaths",
-    "check_valid_interval_values",
-    "extract_interval_elements",
-    "flt_bsc_rxs",
-    "flt_bsc_rgx",
-    "flt_rxs",
-    "flt_rgx",
-    "format_interval",
-    "format_number",
-    "format_run_time",
-    "interval_rxs",
-    "interval_rgx",
-    "int_bas_rxs",
-    "int_bas_rgx",
-    "int_bsc_rxs",
-    "int_bsc_rgx",
-    "int_rxs",
-    "int_rgx",
-    "is_float_basic",
-    "is_basic_int",
-    "is_float",
-    "is_float_interval",
-    "is_int",
-    "is_int_interval",
-    "is_interval_str",
-    "is_non_decimal",
-    "is_number",
-    "is_scinot",
-    "num_rxs",
-    "num_rgx",
-    "sci_rxs",
-    "sci_rgx",
-    "to_interval",
-    "to_number"
-]
+"""
+Standard Libraries
+"""
+from importlib import import_module
+from typing    import Any, Dict, Final, List
+
+_LAZY_ATTRS: Final[Dict[str, str]] = {
+    "BaseProjectPaths": ".d_paths",
+    "format_number":    ".types.strings.d_numbers",
+    "format_run_time":  ".types.strings.d_times",
+    "is_int":           ".types.strings.d_numbers",
+    "is_number":        ".types.strings.d_numbers",
+    "to_number":        ".types.strings.d_numbers",
+}
+"""
+Map of each public name to the submodule it is imported from on first access.
+"""
+
+__all__ = list(_LAZY_ATTRS)
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a public name from its submodule on first access.
+
+    The result is cached in the package globals, so later lookups never reach this function
+    again.
+
+    Args:
+        name (str): The name of the attribute being looked up.
+
+    Returns:
+        Any: The imported attribute.
+
+    Raises:
+        AttributeError: If the name is not a public name of this package.
+    """
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    """
+    List the package attributes, including the lazily imported ones.
+
+    Returns:
+        List[str]: The sorted attribute names.
+    """
+    return sorted({*globals(), *_LAZY_ATTRS})
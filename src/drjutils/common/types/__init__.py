@@ -22,7 +22,7 @@ from .sentinel import (
     require,
     resolve,
 )
-from .type_utils  import (
+from .type_checks import (
     T, Many, OneOrMany,
     set_name, set_name_if,
     set_docstring, set_docstring_if,
@@ -38,7 +38,7 @@ __all__ = [
     "default_factory",
     "require",
     "resolve",
-    # type_utils
+    # type_checks
     "T",
     "Many",
     "OneOrMany",
@@ -23,10 +23,16 @@ This module provides common utility functions for boolean values and their repre
 |----------------|------------------------------------|
 | `BooleanAlias` | Base class for boolean-like enums. |
 
+### Functions
+
+| Function Name   | Description                                             |
+|-----------------|---------------------------------------------------------|
+| `case_variants` | Lower, title and upper case spellings of alias words.   |
+
 Copyright 2025 Daniel Robert Jackson
 """
 
-from .boolean_alias import BooleanAlias
+from .boolean_alias import BooleanAlias, case_variants
 from .true_false import TrueFalse
 from .yes_no import YesNo
 from .on_off import OnOff
@@ -39,4 +45,5 @@ __all__ = [
     "OnOff",
     "EnabledDisabled",
     "BooleanAlias",
+    "case_variants",
 ]
@@ -32,12 +32,14 @@ Subclasses must define the following class variables:
 | `_FALSE_STRINGS` | `Iterable[str]` | Allowed strings for False values. |
 
 >    Prefer `Final` for the class variables to ensure they are not modified.
+>    Wrap their values in `enum.nonmember` so that they do not become enum members.
 
 ### Example Usage
 
 ```python
+from enum   import nonmember
 from typing import Final, Tuple
-from drjutils.common.bools import BooleanAlias
+from drjutils.common.types.bools import BooleanAlias, case_variants
 
 class MyYesNo(BooleanAlias):
     # Enum values for True and False.
@@ -45,10 +47,10 @@ class MyYesNo(BooleanAlias):
     NO  = False
 
     # Display strings for True and False.
-    _TRUE_STR:   Final[str]        = "Yes"
-    _FALSE_STR:  Final[str]        = "No"
-    _TRUE_STRINGS:  Final[Tuple[str]] = ["y", "Y", "yes", "Yes", "YES"]
-    _FALSE_STRINGS: Final[Tuple[str]] = ["n", "N", "no", "No", "NO"]
+    _TRUE_STR:      Final[str]        = nonmember("Yes")
+    _FALSE_STR:     Final[str]        = nonmember("No")
+    _TRUE_STRINGS:  Final[Tuple[str]] = nonmember(case_variants("y", "yes"))
+    _FALSE_STRINGS: Final[Tuple[str]] = nonmember(case_variants("n", "no"))
 ```
 
 Copyright 2025 Daniel Robert Jackson
@@ -58,7 +60,51 @@ Copyright 2025 Daniel Robert Jackson
 Standard Libraries
 """
 from enum   import Enum
-from typing import Dict, Optional, Self, Tuple, Union
+from sys    import intern
+from types  import MappingProxyType
+from typing import Dict, Final, FrozenSet, Mapping, Optional, Self, Tuple, Union
+
+_REQUIRED_CLASS_VARIABLES: Final[Tuple[str, ...]] = (
+    "_TRUE_STR",
+    "_FALSE_STR",
+    "_TRUE_STRINGS",
+    "_FALSE_STRINGS",
+)
+"""Class variables that every BooleanAlias subclass must define."""
+
+def _fast_strip(string: str) -> str:
+    """
+    Strip leading and trailing whitespace, skipping the copy if there is none to strip.
+
+    Args:
+        string: The string to strip.
+
+    Returns:
+        The string without leading or trailing whitespace (the same object if already trimmed).
+    """
+    if string and not (string[0].isspace() or string[-1].isspace()):
+        return string
+    return string.strip()
+
+def case_variants(*words: str) -> Tuple[str, ...]:
+    """
+    Expand each word into its lower, title and upper case spellings.
+
+    Duplicates are dropped while keeping first-seen order, so a single letter
+    yields two variants: `case_variants("t", "true")` is
+    `("t", "T", "true", "True", "TRUE")`.
+
+    Args:
+        *words: The words to expand.
+
+    Returns:
+        The case variants of every word, in order and without duplicates.
+    """
+    return tuple(dict.fromkeys(
+        variant
+        for word in words
+        for variant in (word.lower(), word.capitalize(), word.upper())
+    ))
 
 class BooleanAlias(Enum):
     """
@@ -82,12 +128,13 @@ class BooleanAlias(Enum):
     | `_FALSE_STRINGS` | `Iterable[str]` | Allowed strings for False values. |
 
     >    Prefer `Final` for the class variables to ensure they are not modified.
+    >    Wrap their values in `enum.nonmember` so that they do not become enum members.
 
     ## Boolean Enum Pair with Single String Alias
     
     ```python
     from typing import Tuple
-    from drjutils.common.bools import BooleanAlias
+    from drjutils.common.types.bools import BooleanAlias
 
     class MyYesNo1(BooleanAlias):
         # Enum values for True and False.
@@ -99,7 +146,7 @@ class BooleanAlias(Enum):
 
     ```python
     from typing import Tuple
-    from drjutils.common.bools import BooleanAlias
+    from drjutils.common.types.bools import BooleanAlias
 
     class MyYesNo2(BooleanAlias):
         # Enum values for True and False.
@@ -114,7 +161,7 @@ class BooleanAlias(Enum):
 
     ```python
     from typing import Tuple
-    from drjutils.common.bools import BooleanAlias
+    from drjutils.common.types.bools import BooleanAlias
 
     class MyEnabledDisabled(BooleanAlias):
         # Enum values for True and False.
@@ -145,6 +192,27 @@ class BooleanAlias(Enum):
     _FALSE_ENUMS: Tuple[Self, ...]
     """Tuple of all False Enum members."""
 
+    _PRIM_TRUE_ENUM: Optional[Self]
+    """The primary (first defined) True Enum member."""
+
+    _PRIM_FALSE_ENUM: Optional[Self]
+    """The primary (first defined) False Enum member."""
+
+    _TRUE_SET: FrozenSet[str]
+    """Set of all True strings, for fast lookup."""
+
+    _FALSE_SET: FrozenSet[str]
+    """Set of all False strings, for fast lookup."""
+
+    _ALL_BOOL_MAP: Mapping[str, bool]
+    """Mapping of every allowed string to its boolean value (a single hashed lookup)."""
+
+    _ALL_ENUM_MAP: Mapping[str, Self]
+    """Mapping of every allowed string to its primary Enum member."""
+
+    _CANONICAL: Mapping[bool, str]
+    """Mapping of each boolean value to its display string."""
+
     @classmethod
     def _make_enum_to_str_mapping(
         mapping: Dict[Self, Tuple[str, ...]]
@@ -172,8 +240,8 @@ class BooleanAlias(Enum):
     def __new__(cls, value: bool)-> Self:
         """
         Create a new instance of the enum with the given boolean value.
-        The display string is set based on the value.
         This method is called when the enum is created.
+        The display string is set once the subclass is complete (see `__init_subclass__`).
 
         Args:
             value: The boolean value (True or False) for the enum member.
@@ -183,10 +251,6 @@ class BooleanAlias(Enum):
         """
         obj         = object.__new__(cls)
         obj._value_ = value
-
-        # Use the subclass-specific display string.
-        obj._display_ = cls._TRUE_STRINGS[0] if value else cls._FALSE_STRINGS[0]
-
         return obj
 
     def __bool__(self) -> bool:
@@ -212,158 +276,88 @@ class BooleanAlias(Enum):
         """
         return self._display_
 
-    @classmethod
-    def __init_subclass__(cls) -> None:
+    def __format__(self, format_spec: str) -> str:
         """
-        This method is called when a subclass of BooleanAlias is created.
+        Return the formatted string representation of the enum member.
 
-        It ensures that the subclass has defined the required class variables
-        and initializes the sets for fast lookup of True and False values.
-        It also builds a combined mapping of all valid string values to their
-        corresponding boolean values.
+        This method is called by `format()` and f-strings.
+        The display string is returned directly when there is no format spec.
 
         Args:
-            cls: The subclass that is being initialized.
+            format_spec: The format specification.
 
-        Raises:
-            ValueError: If multiple True or False members are found in the subclass.
-            AssertionError: If the subclass does not define the required class variables.
+        Returns:
+            The display string of the enum member, formatted with the given spec.
         """
-        super().__init_subclass__()
+        return format(self._display_, format_spec) if format_spec else self._display_
 
-        # Initialize this class for the True/False enum pairs.
-        # They will be ordereded by the order they are defined in the subclass.
-        # Each True/False member must have a matching string(s) member.
-        # These primary members won't have underscores around them; that's how we can
-        # differentiate them from the string members.
-        # The naming convention for the strings members is: `_{BOOL_MEMBER_NAME}_STRINGS`
-        # Throw if these aren't present or if every member True member does not have a matching
-        # False member that it is paired with.
-
-        # Map of True to False Enum pairs.
-        cls._BOOL_PAIRS: Dict[Self, Self] = {}
-        """Mapping of True to False Enum pairs."""
+    @classmethod
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        This method is called when a subclass of BooleanAlias is created.
 
-        
+        It ensures that the subclass has defined the required class variables,
+        pairs the True/False members (in the order they are defined),
+        and initializes the sets and mappings used for fast lookup of the string aliases.
 
-        true_enum: Optional[Self] = None
-        """The current True enum member being processed."""
+        Args:
+            cls: The subclass that is being initialized.
 
-        false_enum: Optional[Self] = None
-        """The current False enum member being processed."""
+        Raises:
+            TypeError:      If the subclass does not define the required class variables.
+            ValueError:     If the display strings are not among the allowed strings.
+            AttributeError: If the True and False members do not form complete pairs.
+        """
+        super().__init_subclass__(**kwargs)
 
-        for member in cls:
-            if true_enum is None:
-                # If we don't have a True member yet, we expect one next.
-                if member.value is True:
-                    true_enum = member
-                else:
-                    raise AttributeError(
-                        f"Expected a True member, but found {member.name}::{member.value}."
-                    )
-            elif false_enum is None:
-                # If we have a True member, we expect a False member next.
-                if member.value is False:
-                    false_enum = member
-                    # Add the pair to the mapping.
-                    cls._BOOL_PAIRS[true_enum] = false_enum
-                    # Reset for the next pair.
-                    true_enum = None
-                    false_enum = None
-                else:
-                    raise AttributeError(
-                        f"Expected a False member, but found {member.name}::{member.value}."
-                    )
-
-        # If we have a True member but no False member, raise an error.
-        if true_enum is not None and false_enum is None:
+        # Ensure the subclass has defined the required class variables.
+        missing = [name for name in _REQUIRED_CLASS_VARIABLES if not hasattr(cls, name)]
+        if missing:
+            raise TypeError(f"Class {cls.__name__} must define {', '.join(missing)}")
+        if cls._TRUE_STR not in cls._TRUE_STRINGS:
+            raise ValueError(f"Class {cls.__name__} _TRUE_STR must be in _TRUE_STRINGS")
+        if cls._FALSE_STR not in cls._FALSE_STRINGS:
+            raise ValueError(f"Class {cls.__name__} _FALSE_STR must be in _FALSE_STRINGS")
+
+        # Pair the True/False members in the order they are defined.
+        # The first pair is the primary pair.
+        cls._TRUE_ENUMS  = tuple(member for member in cls if member.value is True)
+        cls._FALSE_ENUMS = tuple(member for member in cls if member.value is False)
+        if len(cls._TRUE_ENUMS) != len(cls._FALSE_ENUMS) \
+                or len(cls._TRUE_ENUMS) + len(cls._FALSE_ENUMS) != len(cls):
             raise AttributeError(
-                f"Expected a False member after True member {true_enum.name}::{true_enum.value}, \
-                    but found none."
+                f"Class {cls.__name__} must define matching pairs of True and False members"
             )
+        cls._ENUM_PAIRS = dict(zip(cls._TRUE_ENUMS, cls._FALSE_ENUMS))
 
-        if (
-               hasattr(cls, "_PRIM_TRUE_ENUM")
-            or hasattr(cls, "_ALT_TRUE_ENUMS")
-            or hasattr(cls, "_PRIM_FALSE_ENUM")
-            or hasattr(cls, "_ALT_FALSE_ENUMS")
-        ):
-            # if any of the alternate options are defined,
-            # then all of them must be defined.
-
-            # Build an error message if any of the required attributes are missing.
-            missing_attributes = []
-            if not hasattr(cls, "_PRIM_TRUE_ENUM"):
-                missing_attributes.append("_PRIM_TRUE_ENUM")
-            if not hasattr(cls, "_ALT_TRUE_ENUMS"):
-                missing_attributes.append("_ALT_TRUE_ENUMS")
-            if not hasattr(cls, "_PRIM_FALSE_ENUM"):
-                missing_attributes.append("_PRIM_FALSE_ENUM")
-            if not hasattr(cls, "_ALT_FALSE_ENUMS"):
-                missing_attributes.append("_ALT_FALSE_ENUMS")
-
-            has_alternates: bool = len(missing_attributes) == 0
-
-            
-
-            
-        
-        alt_option_attribute_count: int = 0
-
-        if hasattr(cls, "_PRIM_TRUE_ENUM"):
-            alt_option_attribute_count += 1
+        # Use the subclass-specific display strings.
+        cls._CANONICAL = MappingProxyType({True: cls._TRUE_STR, False: cls._FALSE_STR})
+        for member in cls:
+            member._display_ = cls._CANONICAL[member.value]
 
-        if hasattr(cls, "_ALT_TRUE_ENUMS"):
-            alt_option_attribute_count += 1
+        # Cache the primary True/False pair for `_get_true/false_member`.
+        cls._PRIM_TRUE_ENUM, cls._PRIM_FALSE_ENUM = next(iter(cls._ENUM_PAIRS.items()), (None, None))
 
-        if
+        # Intern the aliases so lookups with interned keys (e.g. parser tokens) compare by identity.
+        cls._TRUE_STRINGS  = tuple(intern(string) for string in cls._TRUE_STRINGS)
+        cls._FALSE_STRINGS = tuple(intern(string) for string in cls._FALSE_STRINGS)
 
-        has_alternates: bool = \
-                hasattr(cls, "_PRIM_TRUE_ENUM")  \
-            and hasattr(cls, "_ALT_TRUE_ENUMS")  \
-            and hasattr(cls, "_PRIM_FALSE_ENUM") \
-            and hasattr(cls, "_ALT_FALSE_ENUMS")
+        # Sets for fast lookup; the tuples are kept for ordered iteration and display.
+        cls._TRUE_SET:  FrozenSet[str] = frozenset(cls._TRUE_STRINGS)
+        cls._FALSE_SET: FrozenSet[str] = frozenset(cls._FALSE_STRINGS)
 
-        for member in cls:
-            if member.value is True:
-                assert  cls._TRUE_ENUM is None         \
-                    or  cls._PRIM_TRUE_ENUM is member  \
-                    and cls._ALT_TRUE_ENUMS is member, \
-                    f"Multiple True members found in {cls.__name__}"
-
-                if cl
-                cls._TRUE_ENUM = member
-            elif member.value is False:
-                assert cls._FALSE_ENUM is None, \
-                    f"Multiple False members found in {cls.__name__}"
-                cls._FALSE_ENUM = member
+        cls._ALL_STRS: tuple = (*cls._TRUE_STRINGS, *cls._FALSE_STRINGS)
 
-        # Ensure the subclass has defined the required class variables.
-        assert hasattr(cls, "_TRUE_STRING"),   f"Class {cls.__name__} must define _TRUE_STRING"
-        assert hasattr(cls, "_FALSE_STRING"),  f"Class {cls.__name__} must define _FALSE_STR"
-        assert hasattr(cls, "_TRUE_STRINGS"),  f"Class {cls.__name__} must define _TRUE_STRINGS"
-        assert hasattr(cls, "_FALSE_STRINGS"), f"Class {cls.__name__} must define _FALSE_STRINGS"
-
-        assert cls._TRUE_STRING in cls._TRUE_STRINGS,   \
-            f"Class {cls.__name__} _TRUE_STRING must be in _TRUE_STRINGS"
-        assert cls._FALSE_STRING in cls._FALSE_STRINGS, \
-            f"Class {cls.__name__} _FALSE_STRING must be in _FALSE_STRINGS"
-
-        cls._ALL_STRS: tuple = (
-            *cls._TRUE_STRINGS,
-            *cls._FALSE_STRINGS,
-        )
-
-        # Build a combined mapping.
-        cls._ALL_BOOL_MAP: Dict[str, bool] = {
+        # Build the combined mappings (read-only; they are shared by every lookup).
+        cls._ALL_BOOL_MAP = MappingProxyType({
             **{val: True  for val in cls._TRUE_STRINGS},
             **{val: False for val in cls._FALSE_STRINGS},
-        }
+        })
 
-        cls._ALL_ENUM_MAP: Dict[str, Self] = {
-            **{val: cls._TRUE_ENUM  for val in cls._TRUE_STRINGS},
-            **{val: cls._FALSE_ENUM for val in cls._FALSE_STRINGS},
-        }
+        cls._ALL_ENUM_MAP = MappingProxyType({
+            **{val: cls._PRIM_TRUE_ENUM  for val in cls._TRUE_STRINGS},
+            **{val: cls._PRIM_FALSE_ENUM for val in cls._FALSE_STRINGS},
+        })
 
     @classmethod
     def is_true(cls, string: str) -> bool:
@@ -380,7 +374,7 @@ class BooleanAlias(Enum):
         Returns:
             bool: True if the string is a valid representation of True, False otherwise.
         """
-        return string.strip() in cls._TRUE_STRINGS
+        return _fast_strip(string) in cls._TRUE_SET
 
     @classmethod
     def is_false(cls, string: str) -> bool:
@@ -397,7 +391,7 @@ class BooleanAlias(Enum):
         Returns:
             bool: True if the string is a valid representation of False, False otherwise.
         """
-        return string.strip() in cls._FALSE_STRINGS
+        return _fast_strip(string) in cls._FALSE_SET
 
     @classmethod
     def is_valid(cls, string: str) -> bool:
@@ -413,7 +407,7 @@ class BooleanAlias(Enum):
         Returns:
             bool: True if the string is a valid representation of either True or False, False otherwise.
         """
-        return string.strip() in cls._ALL_BOOL_MAP
+        return _fast_strip(string) in cls._ALL_BOOL_MAP
 
     @classmethod
     def maybe_from_str(cls, string: str) -> Optional[Self]:
@@ -427,12 +421,7 @@ class BooleanAlias(Enum):
             Optional[BooleanAlias]: Returns BooleanAlias.TRUE or BooleanAlias.FALSE if the string matches a known boolean alias,
             otherwise returns None.
         """
-        if cls.is_true(string):
-            return cls._get_true_member()
-        elif cls.is_false(string):
-            return cls._get_false_member()
-        else:
-            return None
+        return cls._ALL_ENUM_MAP.get(_fast_strip(string))
 
     @classmethod
     def maybe_bool_from_str(cls, string: str) -> Optional[bool]:
@@ -446,8 +435,7 @@ class BooleanAlias(Enum):
             Optional[bool]: The corresponding boolean value if the string matches a known alias,
             otherwise None.
         """
-        bool_enum = cls.maybe_from_str(string)
-        return bool_enum.value if bool_enum is not None else None
+        return cls._ALL_BOOL_MAP.get(_fast_strip(string))
 
     @classmethod
     def from_str(cls, string: str) -> Self:
@@ -466,10 +454,10 @@ class BooleanAlias(Enum):
         Raises:
             ValueError: If the input string cannot be interpreted as a boolean.
         """
-        result = cls.maybe_from_str(string)
-        if result is None:
-            raise ValueError(f"Invalid Boolean value: {string}")
-        return result
+        try:
+            return cls._ALL_ENUM_MAP[_fast_strip(string)]
+        except KeyError:
+            raise ValueError(f"Invalid Boolean value: {string}") from None
 
     @classmethod
     def bool_from_str(cls, string: str) -> bool:
@@ -488,17 +476,17 @@ class BooleanAlias(Enum):
         Raises:
             ValueError: If the input string cannot be interpreted as a boolean.
         """
-        result = cls.maybe_bool_from_str(string)
-        if result is None:
-            raise ValueError(f"Invalid Boolean value: {string}")
-        return result
+        try:
+            return cls._ALL_BOOL_MAP[_fast_strip(string)]
+        except KeyError:
+            raise ValueError(f"Invalid Boolean value: {string}") from None
 
     @classmethod
     def _get_true_member(cls) -> Self:
         """
         Returns the enum member whose value is True.
 
-        Iterates over all members of the class and returns the first member with a value of True.
+        This is the first member with a value of True, cached when the subclass is created.
 
         Returns:
             Self: The enum member with value True.
@@ -506,26 +494,23 @@ class BooleanAlias(Enum):
         Raises:
             NotImplementedError: If no member with value True is defined in the subclass.
         """
-        for member in cls:
-            if member.value is True:
-                return member
-        raise NotImplementedError("True member not defined in subclass")
+        if cls._PRIM_TRUE_ENUM is None:
+            raise NotImplementedError("True member not defined in subclass")
+        return cls._PRIM_TRUE_ENUM
 
     @classmethod
     def _get_false_member(cls) -> Self:
         """
         Returns the enum member whose value is False.
 
-        Iterates through the members of the class and returns the first member
-        with a value of False. Raises a ValueError if no such member is found.
+        This is the first member with a value of False, cached when the subclass is created.
 
         Returns:
-            BooleanAlias: The enum member with value False.
+            Self: The enum member with value False.
 
         Raises:
-            ValueError: If no member with value False is defined in the subclass.
+            NotImplementedError: If no member with value False is defined in the subclass.
         """
-        for member in cls:
-            if member.value is False:
-                return member
-        raise ValueError("False member not defined in subclass")
+        if cls._PRIM_FALSE_ENUM is None:
+            raise NotImplementedError("False member not defined in subclass")
+        return cls._PRIM_FALSE_ENUM
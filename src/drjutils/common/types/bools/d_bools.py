@@ -5,6 +5,12 @@ This module provides utilities for working with boolean strings.
 
 Copyright 2025 Daniel Robert Jackson
 
+### Classes:
+
+| Class   | Description    |
+|---------|----------------|
+| `YesNo` | Yes/No Values  |
+
 ### Constants:
 
 | Constant                   | Type         | Description                                   |
@@ -15,6 +21,7 @@ Copyright 2025 Daniel Robert Jackson
 | `FALSE_RGX`                | `re.Pattern` | False Regex Pattern                           |
 | `BOOL_RXS`                 | `str`        | Boolean Regex String                          |
 | `BOOL_RGX`                 | `re.Pattern` | Boolean Regex                                 |
+| `BOOL_CORE_RGX`            | `re.Pattern` | Unanchored Boolean Regex                      |
 | `YES_RXS`                  | `str`        | Yes Regex String                              |
 | `YES_RGX`                  | `re.Pattern` | Yes Regex Pattern                             |
 | `NO_RXS`                   | `str`        | No Regex String                               |
@@ -51,9 +58,17 @@ Copyright 2025 Daniel Robert Jackson
 | `FALSEISH_RGX`             | `re.Pattern` | False Regex Pattern                           |
 | `BOOLISH_RXS`              | `str`        | Boolean Regex String                          |
 | `BOOLISH_RGX`              | `re.Pattern` | Boolean Regex Pattern                         |
-| `BOOLISH_PATTERN_MAP`      | `dict`       | Map of regex patterns to related values       |
-| `BOOLISH_PATTERN_STR_MAP`  | `dict`       | Map of regex patterns to their string values  |
-| `BOOLISH_PATTERN_BOOL_MAP` | `dict`       | Map of regex patterns to their boolean values |
+| `BOOLISH_CORE_RGX`         | `re.Pattern` | Unanchored Booleanish Regex                   |
+| `BOOLISH_DISPATCH_RXS`     | `str`        | Booleanish Dispatch Regex String              |
+| `BOOLISH_DISPATCH_RGX`     | `re.Pattern` | Booleanish Dispatch Regex Pattern             |
+| `BOOLISH_GROUP_MAP`        | `dict`       | Map of dispatch groups to related values      |
+| `BOOLISH_PATTERN_MAP`      | `Mapping`    | Map of regex patterns to related values       |
+| `BOOLISH_PATTERN_STR_MAP`  | `Mapping`    | Map of regex patterns to their string values  |
+| `BOOLISH_PATTERN_BOOL_MAP` | `Mapping`    | Map of regex patterns to their boolean values |
+
+The `*_RGX` patterns are anchored and accept surrounding whitespace, so `match` checks a
+whole string. `BOOL_CORE_RGX` and `BOOLISH_CORE_RGX` hold the bare alternation, for
+`fullmatch` on a string that is already stripped.
 
 ### Functions:
 
@@ -79,6 +94,8 @@ Copyright 2025 Daniel Robert Jackson
 | `is_trueish_val`          | Indicate if a value represents a trueish value               |
 | `is_falseish`             | Indicate if a string represents a falseish value             |
 | `is_falseish_val`         | Indicate if a value represents a falseish value              |
+| `is_bool_str`             | Indicate if a string represents a boolean                    |
+| `is_boolish_str`          | Indicate if a string represents a booleanish value           |
 | `check_true`              | Validate that a string represents a true value               |
 | `check_true_val`          | Validate that a value represents a true value                |
 | `check_false`             | Validate that a string represents a false value              |
@@ -99,127 +116,169 @@ Copyright 2025 Daniel Robert Jackson
 | `check_trueish_val`       | Validate that a value represents a trueish value             |
 | `check_falseish`          | Validate that a string represents a falseish value           |
 | `check_falseish_val`      | Validate that a value represents a falseish value            |
-| `to_bool`                 | Convert a string to a boolean                                |
+| `to_bool`                 | Convert a booleanish value to a boolean                      |
+| `classify_batch`          | Interpret many values as booleans in a single pass           |
 | `interpret_as_bool`       | Interpret a value as a boolean                               |
+| `to_formatted`            | Create a string formatted in a booleanish style              |
 | `to_bool_str`             | Create a string formatted as a boolean (True/False) string   |
 | `to_yes_no_str`           | Create a string formatted as a Yes/No string                 |
 | `to_on_off_str`           | Create a string formatted as a On/Off string                 |
 | `to_enabled_disabled_str` | Create a string formatted as a Enabled/Disabled string       |
 | `to_std_boolish_str`      | Create a string formatted as the canonical booleanish string |
+| `compile_cached`          | Compile a regex string, memoized on the string and flags     |
+| `get_bool_pattern`        | Get a compiled booleanish pattern by name                    |
 """
 
 """
 Standard Libraries
 """
-from enum import Enum
-from re import compile
-from typing import Dict, Final, Pattern, Tuple, Union
+from functools import cache, lru_cache
+from itertools import repeat
+from numbers import Number
+from re import ASCII, IGNORECASE, compile
+from sys import intern
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Final, FrozenSet, Iterable, List, Mapping, Optional, Pattern, Tuple, Union
 
 __all__ = [
-    # Enums #
-    YesNo,                      # Yes/No Enum
-    OnOff,                      # On/Off Enum
-    EnabledDisabled,            # Enabled/Disabled Enum
+    # Classes #
+    "YesNo",                    # Yes/No Values
     # Constants #
-    "TRUE_RXS"                  # True Regex String
-    "TRUE_RGX"                  # True Regex Pattern
-    "FALSE_RXS"                 # False Regex String
-    "FALSE_RGX"                 # False Regex Pattern
-    "BOOL_RXS"                  # Boolean Regex String
-    "BOOL_RGX"                  # Boolean Regex
-    "YES_RXS"                   # Yes Regex String
-    "YES_RGX"                   # Yes Regex Pattern
-    "NO_RXS"                    # No Regex String
-    "NO_RGX"                    # No Regex Pattern
-    "YES_NO_RXS"                # Yes/No Regex String
-    "YES_NO_RGX"                # Yes/No Regex Pattern
-    "ON_RXS"                    # On Regex String
-    "ON_RGX"                    # On Regex Pattern
-    "OFF_RXS"                   # Off Regex String
-    "OFF_RGX"                   # Off Regex Pattern
-    "ON_OFF_RXS"                # On/Off Regex String
-    "ON_OFF_RGX"                # On/Off Regex Pattern
-    "ENABLED_RXS"               # Enabled Regex String
-    "ENABLED_RGX"               # Enabled Regex Pattern
-    "DISABLED_RXS"              # Disabled Regex String
-    "DISABLED_RGX"              # Disabled Regex Pattern
-    "ENABLED_DISABLED_RXS"      # Enabled/Disabled Regex String
-    "ENABLED_DISABLED_RGX"      # Enabled/Disabled Regex Pattern
-    "TRUEISH_RXS"               # True Regex String
-    "TRUEISH_RGX"               # True Regex Pattern
-    "FALSEISH_RXS"              # False Regex String
-    "FALSEISH_RGX"              # False Regex Pattern
-    "BOOLISH_RXS"               # Boolean Regex String
-    "BOOLISH_RGX"               # Boolean Regex Pattern
-    "BOOLISH_PATTERN_MAP"       # Map of regex patterns to their boolean values
+    "TRUE_RXS",                 # True Regex String
+    "TRUE_RGX",                 # True Regex Pattern
+    "FALSE_RXS",                # False Regex String
+    "FALSE_RGX",                # False Regex Pattern
+    "BOOL_RXS",                 # Boolean Regex String
+    "BOOL_RGX",                 # Boolean Regex
+    "BOOL_CORE_RGX",            # Unanchored Boolean Regex
+    "YES_RXS",                  # Yes Regex String
+    "YES_RGX",                  # Yes Regex Pattern
+    "NO_RXS",                   # No Regex String
+    "NO_RGX",                   # No Regex Pattern
+    "YES_NO_RXS",               # Yes/No Regex String
+    "YES_NO_RGX",               # Yes/No Regex Pattern
+    "ON_RXS",                   # On Regex String
+    "ON_RGX",                   # On Regex Pattern
+    "OFF_RXS",                  # Off Regex String
+    "OFF_RGX",                  # Off Regex Pattern
+    "ON_OFF_RXS",               # On/Off Regex String
+    "ON_OFF_RGX",               # On/Off Regex Pattern
+    "ENABLE_RXS",               # Enable Regex String
+    "ENABLE_RGX",               # Enable Regex Pattern
+    "DISABLE_RXS",              # Disable Regex String
+    "DISABLE_RGX",              # Disable Regex Pattern
+    "ENABLE_DISABLE_RXS",       # Enable/Disable Regex String
+    "ENABLE_DISABLE_RGX",       # Enable/Disable Regex Pattern
+    "ENABLED_RXS",              # Enabled Regex String
+    "ENABLED_RGX",              # Enabled Regex Pattern
+    "DISABLED_RXS",             # Disabled Regex String
+    "DISABLED_RGX",             # Disabled Regex Pattern
+    "ENABLED_DISABLED_RXS",     # Enabled/Disabled Regex String
+    "ENABLED_DISABLED_RGX",     # Enabled/Disabled Regex Pattern
+    "ENABLEDISH_RXS",           # Enabled/Disabled Like Regex String
+    "ENABLEDISH_RGX",           # Enabled/Disabled Like Regex Pattern
+    "DISABLEDISH_RXS",          # Disabled/Enabled Like Regex String
+    "DISABLEDISH_RGX",          # Disabled/Enabled Like Regex Pattern
+    "ENABLED_DISABLEDISH_RXS",  # Enabled/Disabled Like Regex String
+    "ENABLED_DISABLEDISH_RGX",  # Enabled/Disabled Like Regex Pattern
+    "TRUEISH_RXS",              # True Regex String
+    "TRUEISH_RGX",              # True Regex Pattern
+    "FALSEISH_RXS",             # False Regex String
+    "FALSEISH_RGX",             # False Regex Pattern
+    "BOOLISH_RXS",              # Boolean Regex String
+    "BOOLISH_RGX",              # Boolean Regex Pattern
+    "BOOLISH_CORE_RGX",         # Unanchored Booleanish Regex
+    "BOOLISH_DISPATCH_RXS",     # Booleanish Dispatch Regex String
+    "BOOLISH_DISPATCH_RGX",     # Booleanish Dispatch Regex Pattern
+    "BOOLISH_GROUP_MAP",        # Map of dispatch groups to related values
+    "BOOLISH_PATTERN_MAP",      # Map of regex patterns to related values
+    "BOOLISH_PATTERN_STR_MAP",  # Map of regex patterns to their string values
+    "BOOLISH_PATTERN_BOOL_MAP", # Map of regex patterns to their boolean values
     # Functions #
-    "is_bool"                   # Indicate if a string represents a boolean
-    "is_true"                   # Indicate if a string represents a true value
-    "is_true_val"               # Indicate if a value represents a true value
-    "is_false"                  # Indicate if a string represents a false value
-    "is_false_val"              # Indicate if a value represents a false value
-    "is_yes"                    # Indicate if a string represents a yes value
-    "is_no"                     # Indicate if a string represents a no value
-    "is_yes_no"                 # Indicate if a string represents a yes/no value
-    "is_on"                     # Indicate if a string represents a on value
-    "is_off"                    # Indicate if a string represents a off value
-    "is_on_off"                 # Indicate if a string represents a on/off value
-    "is_enabled"                # Indicate if a string represents a enabled value
-    "is_disabled"               # Indicate if a string represents a disabled value
-    "is_enabled_disabled"       # Indicate if a string represents a enabled/disabled value
-    "is_boolish"                # Indicate if a string represents a booleanish value
-    "is_boolish_val"            # Indicate if a value represents a booleanish value
-    "is_trueish"                # Indicate if a string represents a trueish value
-    "is_trueish_val"            # Indicate if a value represents a trueish value
-    "is_falseish"               # Indicate if a string represents a falseish value
-    "is_falseish_val"           # Indicate if a value represents a falseish value
-    "check_true"                # Validate that a string represents a true value
-    "check_true_val"            # Validate that a value represents a true value
-    "check_false"               # Validate that a string represents a false value
-    "check_false_val"           # Validate that a value represents a false value
-    "check_bool"                # Validate that a string represents a boolean
-    "check_yes"                 # Validate that a string represents a yes value
-    "check_no"                  # Validate that a string represents a no value
-    "check_yes_no"              # Validate that a string represents a yes/no value
-    "check_on"                  # Validate that a string represents a on value
-    "check_off"                 # Validate that a string represents a off value
-    "check_on_off"              # Validate that a string represents a on/off value
-    "check_enabled"             # Validate that a string represents a enabled value
-    "check_disabled"            # Validate that a string represents a disabled value
-    "check_enabled_disabled"    # Validate that a string represents a enabled/disabled value
-    "check_boolish"             # Validate that a string represents a booleanish value
-    "check_boolish_val"         # Validate that a value represents a booleanish value
-    "check_trueish"             # Validate that a string represents a trueish value
-    "check_trueish_val"         # Validate that a value represents a trueish value
-    "check_falseish"            # Validate that a string represents a falseish value
-    "check_falseish_val"        # Validate that a value represents a falseish value
-    "to_bool"                   # Convert a string to a boolean
-    "interpret_as_bool"         # Interpret a value as a boolean
-    "to_bool_str"               # Create a string formatted as a boolean (True/False) string
-    "to_yes_no_str"             # Create a string formatted as a Yes/No string
-    "to_on_off_str"             # Create a string formatted as a On/Off string
-    "to_enabled_disabled_str"   # Create a string formatted as a Enabled/Disabled string
-    "to_std_boolish_str"        # Create a string formatted as the canonical booleanish string
+    "is_bool",                  # Indicate if a string represents a boolean
+    "is_true",                  # Indicate if a string represents a true value
+    "is_true_val",              # Indicate if a value represents a true value
+    "is_false",                 # Indicate if a string represents a false value
+    "is_false_val",             # Indicate if a value represents a false value
+    "is_yes",                   # Indicate if a string represents a yes value
+    "is_no",                    # Indicate if a string represents a no value
+    "is_yes_no",                # Indicate if a string represents a yes/no value
+    "is_on",                    # Indicate if a string represents a on value
+    "is_off",                   # Indicate if a string represents a off value
+    "is_on_off",                # Indicate if a string represents a on/off value
+    "is_enabled",               # Indicate if a string represents a enabled value
+    "is_disabled",              # Indicate if a string represents a disabled value
+    "is_enabled_disabled",      # Indicate if a string represents a enabled/disabled value
+    "is_boolish",               # Indicate if a string represents a booleanish value
+    "is_boolish_val",           # Indicate if a value represents a booleanish value
+    "is_trueish",               # Indicate if a string represents a trueish value
+    "is_trueish_val",           # Indicate if a value represents a trueish value
+    "is_falseish",              # Indicate if a string represents a falseish value
+    "is_falseish_val",          # Indicate if a value represents a falseish value
+    "is_bool_str",              # Indicate if a string represents a boolean
+    "is_boolish_str",           # Indicate if a string represents a booleanish value
+    "check_true",               # Validate that a string represents a true value
+    "check_true_val",           # Validate that a value represents a true value
+    "check_false",              # Validate that a string represents a false value
+    "check_false_val",          # Validate that a value represents a false value
+    "check_bool",               # Validate that a string represents a boolean
+    "check_yes",                # Validate that a string represents a yes value
+    "check_no",                 # Validate that a string represents a no value
+    "check_yes_no",             # Validate that a string represents a yes/no value
+    "check_on",                 # Validate that a string represents a on value
+    "check_off",                # Validate that a string represents a off value
+    "check_on_off",             # Validate that a string represents a on/off value
+    "check_enabled",            # Validate that a string represents a enabled value
+    "check_disabled",           # Validate that a string represents a disabled value
+    "check_enabled_disabled",   # Validate that a string represents a enabled/disabled value
+    "check_boolish",            # Validate that a string represents a booleanish value
+    "check_boolish_val",        # Validate that a value represents a booleanish value
+    "check_trueish",            # Validate that a string represents a trueish value
+    "check_trueish_val",        # Validate that a value represents a trueish value
+    "check_falseish",           # Validate that a string represents a falseish value
+    "check_falseish_val",       # Validate that a value represents a falseish value
+    "to_bool",                  # Convert a booleanish value to a boolean
+    "classify_batch",           # Interpret many values as booleans in a single pass
+    "interpret_as_bool",        # Interpret a value as a boolean
+    "to_formatted",             # Create a string formatted in a booleanish style
+    "to_bool_str",              # Create a string formatted as a boolean (True/False) string
+    "to_yes_no_str",            # Create a string formatted as a Yes/No string
+    "to_on_off_str",            # Create a string formatted as a On/Off string
+    "to_enabled_disabled_str",  # Create a string formatted as a Enabled/Disabled string
+    "to_std_boolish_str",       # Create a string formatted as the canonical booleanish string
+    "compile_cached",           # Compile a regex string, memoized on the string and flags
+    "get_bool_pattern",         # Get a compiled booleanish pattern by name
 ]
 
 ########## Constants ##########
 
-TRUE_RXS: Final[str] = r"[tT](?:rue)?|TRUE"
+_TRUE_STR:     Final[str] = intern("True")
+_FALSE_STR:    Final[str] = intern("False")
+_YES_STR:      Final[str] = intern("Yes")
+_NO_STR:       Final[str] = intern("No")
+_ON_STR:       Final[str] = intern("On")
+_OFF_STR:      Final[str] = intern("Off")
+_ENABLED_STR:  Final[str] = intern("Enabled")
+_DISABLED_STR: Final[str] = intern("Disabled")
+"""
+Canonical output strings, interned so every formatter returns the same objects.
+"""
+
+TRUE_RXS: Final[str] = r"t(?:rue)?"
 r"""
 ### True Regex String
 
 *   Words: `true`, `True`, `TRUE`
 *   Abrevs: `t`, `T`
-*   Usage: `re.compile(TRUE_RXS)`
+*   Usage: `re.compile(TRUE_RXS, re.IGNORECASE | re.ASCII)`
 
-### Pattern: `[tT](?:rue)?|TRUE`
+### Pattern: `t(?:rue)?`
 
-#### True Regex Options: `...|...`
+#### True Regex Structure:
 
-| Opt |      Regex     |   Body | Suffix? |   Abrevs   |       Words      |  Bool  |
-|----:|----------------|-------:|:--------|:----------:|:----------------:|:------:|
-|   1 | `[tT](?:rue)?` | `[tT]` | `rue`   | `t` \| `T` | `true` \| `True` | `True` |
-|   2 | `TRUE`         | `TRUE` |         |            |      `TRUE`      | `True` |
+|    Regex    | Letter | Suffix? | Value |
+|-------------|-------:|:--------|-------|
+| `t(?:rue)?` |    `t` | `rue`   | True  |
 
 See also:
     | Regex Strings | Regex Patterns |
@@ -232,28 +291,27 @@ See also:
     | `BOOLISH_RXS` | `BOOLISH_RGX`  |
 """
 
-TRUE_RGX: Final[Pattern] = compile(rf"^\s*\b({TRUE_RXS})\b\s*$")
+TRUE_RGX: Pattern
 r"""
 ### True Regex Pattern
 
 *   Words: `true`, `True`, `TRUE`
 *   Abrevs: `t`, `T`
-*   Usage: `re.compile(TRUE_RXS)`
+*   Usage: `TRUE_RGX.match(string)`
 
-### Pattern: `^\s*\b(t(?:rue)?|TRUE)\b\s*$`
+### Pattern: `^\s*(t(?:rue)?)\s*$`
 
 #### True Regex Structure:
 
-|  Prefix? |  (Cap Opts)  | Suffix?  |
-|---------:|:------------:|:---------|
-| `^\s*\b` | `(...\|...)` | `\b\s*$` |
+| Prefix? | (Cap Grp) | Suffix? |
+|--------:|:---------:|:--------|
+|  `^\s*` |  `(...)`  | `\s*$`  |
 
-#### True Regex Capture Options: `(...|...)`
+#### True Regex Capture Group: `(...)`
 
-| Opt |      Regex     |   Body | Suffix? |   Abrevs   |       Words      |  Bool  |
-|----:|----------------|-------:|:--------|:----------:|:----------------:|:------:|
-|   1 | `[tT](?:rue)?` | `[tT]` | `rue`   | `t` \| `T` | `true` \| `True` | `True` |
-|   2 | `TRUE`         | `TRUE` |         |            |      `TRUE`      | `True` |
+|    Regex    | Letter | Suffix? | Value |
+|-------------|-------:|:--------|-------|
+| `t(?:rue)?` |    `t` | `rue`   | True  |
 
 See also:
     | Regex Strings | Regex Patterns |
@@ -266,22 +324,21 @@ See also:
     | `BOOLISH_RXS` | `BOOLISH_RGX`  |
 """
 
-FALSE_RXS: Final[str] = r"[fF](?:alse)?|FALSE"
+FALSE_RXS: Final[str] = r"f(?:alse)?"
 r"""
 ### False Regex String
 
 *   Words: `false`, `False`, `FALSE`
 *   Abrevs: `f`, `F`
-*   Usage: `re.compile(FALSE_RXS)`
+*   Usage: `re.compile(FALSE_RXS, re.IGNORECASE | re.ASCII)`
 
-### Pattern: `[fF](?:alse)?|FALSE`
+### Pattern: `f(?:alse)?`
 
-#### False Regex Options: `...|...`
+#### False Regex Structure:
 
-| Opt |      Regex      |    Body | Suffix? |   Abrevs   |        Words       |   Bool  |
-|----:|-----------------|--------:|:--------|:----------:|:------------------:|:-------:|
-|   1 | `[fF](?:alse)?` |  `[fF]` | `alse`  | `f` \| `F` | `false` \| `False` | `False` |
-|   2 | `FALSE`         | `FALSE` |         |            |       `FALSE`      | `False` |
+|     Regex    | Letter | Suffix? | Value |
+|--------------|-------:|:--------|-------|
+| `f(?:alse)?` |    `f` | `alse`  | False |
 
 See also:
     | Regex Strings | Regex Patterns |
@@ -294,7 +351,7 @@ See also:
     | `BOOLISH_RXS` | `BOOLISH_RGX`  |
 """
 
-FALSE_RGX: Final[Pattern] = compile(rf"^\s*\b({FALSE_RXS})\b\s*$")
+FALSE_RGX: Pattern
 r"""
 ### False Regex Pattern
 
@@ -302,20 +359,19 @@ r"""
 *   Abrevs: `f` | `F`
 *   Usage: `FALSE_RGX.match("false")`
 
-### Pattern: `^\s*\b([fF](?:alse)?|FALSE)\b\s*$`
+### Pattern: `^\s*(f(?:alse)?)\s*$`
 
 #### False Regex Structure:
 
-|  Prefix? |  (Cap Opts)  | Suffix?  |
-|---------:|:------------:|:---------|
-| `^\s*\b` | `(...\|...)` | `\b\s*$` |
+| Prefix? | (Cap Grp) | Suffix? |
+|--------:|:---------:|:--------|
+|  `^\s*` |  `(...)`  | `\s*$`  |
 
-#### False Regex Capture Options: `(...|...)`
+#### False Regex Capture Group: `(...)`
 
-| Option |      Regex      |    Body | Suffix? |   Abrevs   |        Words       |   Bool  |
-|-------:|-----------------|--------:|:--------|:----------:|:------------------:|:-------:|
-|      1 | `[fF](?:alse)?` |  `[fF]` | `alse`  | `f` \| `F` | `false` \| `False` | `False` |
-|      2 | `FALSE`         | `FALSE` |         |            |       `FALSE`      | `False` |
+|     Regex    | Letter | Suffix? | Value |
+|--------------|-------:|:--------|-------|
+| `f(?:alse)?` |    `f` | `alse`  | False |
 
 See also:
     | Regex Strings | Regex Patterns |
@@ -338,20 +394,18 @@ r"""
 *   False:
     *   Words: `false`, `False`, `FALSE`
     *   Abrevs: `f`, `F`
-*   Usage: `re.compile(BOOL_RXS)`
+*   Usage: `re.compile(BOOL_RXS, re.IGNORECASE | re.ASCII)`
 *   Note: This does not support 1 or 0 because they would be ambiguous with integers
 
 
-### Pattern: `[tT](?:rue)?|TRUE|[fF](?:alse)?|FALSE`
+### Pattern: `t(?:rue)?|f(?:alse)?`
 
 #### Boolean Regex Option Series: `...|...`
 
-| Option |      Regex     |    Body | Suffix? |   Abrevs   |       Words       |   Bool  |
-|-------:|----------------|--------:|:--------|:----------:|:-----------------:|:-------:|
-|      1 | `[tT](?:rue)?` |  `[tT]` | `rue`   | `t` \| `T` |  `true` \| `True` |  `True` |
-|      2 | `TRUE`         |  `TRUE` |         |            |       `TRUE`      |  `True` |
-|      3 | `[fF](?:alse)?`|  `[fF]` | `alse`  | `f` \| `F` | `false` \| `False`| `False` |
-|      4 | `FALSE`        | `FALSE` |         |            |       `FALSE`     | `False` |
+| Option |     Regex    | Letter | Suffix? | Value |
+|-------:|--------------|-------:|:--------|-------|
+|      1 | `t(?:rue)?`  |    `t` | `rue`   | True  |
+|      2 | `f(?:alse)?` |    `f` | `alse`  | False |
 
 See also:
     | Regex Strings | Regex Patterns |
@@ -365,7 +419,7 @@ See also:
 """
 
 
-BOOL_RGX: Final[Pattern] = compile(rf"^\s*\b({BOOL_RXS})\b\s*$")
+BOOL_RGX: Pattern
 r"""
 ### Boolean Regex Pattern
 
@@ -375,25 +429,23 @@ r"""
 *   False:
     *   Words: `false`, `False`, `FALSE`
     *   Abrevs: `f`, `F`
-*   Usage: `re.compile(BOOL_RXS)`
+*   Usage: `BOOL_RGX.match(string)`
 *   Note: This does not support 1 or 0 because they would be ambiguous with integers
 
-### Pattern: `^\s*\b(t(?:rue)?|TRUE|[fF](?:alse)?|FALSE)\b\s*$`
+### Pattern: `^\s*(t(?:rue)?|f(?:alse)?)\s*$`
 
 #### Boolean Regex Structure:
 
-|  Prefix? |  (Cap Opts)  | Suffix?  |
-|---------:|:------------:|:---------|
-| `^\s*\b` | `(...\|...)` | `\b\s*$` |
+| Prefix? |  (Cap Opts)  | Suffix? |
+|--------:|:------------:|:--------|
+|  `^\s*` | `(...\|...)` | `\s*$`  |
 
 #### Boolean Regex Capture Options: `(...|...)`
 
-| Option |      Regex     |    Body | Suffix? |   Abrevs   |       Words       |   Bool  |
-|-------:|----------------|--------:|:--------|:----------:|:-----------------:|:-------:|
-|      1 | `[tT](?:rue)?` |  `[tT]` | `rue`   | `t` \| `T` |  `true` \| `True` |  `True` |
-|      2 | `TRUE`         |  `TRUE` |         |            |       `TRUE`      |  `True` |
-|      3 | `[fF](?:alse)?`|  `[fF]` | `alse`  | `f` \| `F` | `false` \| `False`| `False` |
-|      4 | `FALSE`        | `FALSE` |         |            |       `FALSE`     | `False` |
+| Option |     Regex    | Letter | Suffix? | Value |
+|-------:|--------------|-------:|:--------|-------|
+|      1 | `t(?:rue)?`  |    `t` | `rue`   | True  |
+|      2 | `f(?:alse)?` |    `f` | `alse`  | False |
 
 See also:
     | Regex Strings | Regex Patterns |
@@ -406,231 +458,315 @@ See also:
     | `BOOLISH_RXS` | `BOOLISH_RGX`  |
 """
 
+YES_RXS: Final[str] = r"y(?:es)?"
+r"""
+### Yes Regex String
+
+*   Words: `yes`, `Yes`, `YES`
+*   Abbrevs: `y`, `Y`
+*   Usage: `re.compile(YES_RXS, re.IGNORECASE | re.ASCII)`
+
+### Pattern: `y(?:es)?`
+
+#### Yes Regex Structure:
+
+|    Regex   | Letter | Suffix? | Value |
+|------------|-------:|:--------|-------|
+| `y(?:es)?` |    `y` | `es`    | True  |
+
+See also:
+    | Regex Strings | Regex Patterns |
+    |---------------|----------------|
+    |               | `YES_RGX`      |
+    | `NO_RXS`      | `NO_RGX`       |
+    | `YES_NO_RXS`  | `YES_NO_RGX`   |
+    | `TRUEISH_RXS` | `TRUEISH_RGX`  |
+    | `FALSEISH_RXS`| `FALSEISH_RGX` |
+    | `BOOLISH_RXS` | `BOOLISH_RGX`  |
+"""
+
+YES_RGX: Pattern
+r"""
+### Yes Regex Pattern
+
+*   e.g.: `y`, `Y`, `yes`, `Yes`, `YES`, etc.
+*   Usage: `YES_RGX.match("yes")`
+
+### Pattern: `^\s*(y(?:es)?)\s*$`
+
+#### Yes Regex Structure:
+
+| Prefix? | (Cap Grp) | Suffix? |
+|--------:|:---------:|:--------|
+|  `^\s*` |  `(...)`  | `\s*$`  |
+
+#### Yes Regex Capture Group: `(...)`
+
+|    Regex   | Letter | Suffix? | Value |
+|------------|-------:|:--------|-------|
+| `y(?:es)?` |    `y` | `es`    | True  |
+
+See also:
+    | Regex Strings | Regex Patterns |
+    |---------------|----------------|
+    | `YES_RXS`     |                |
+    | `NO_RXS`      | `NO_RGX`       |
+    | `YES_NO_RXS`  | `YES_NO_RGX`   |
+    | `TRUEISH_RXS` | `TRUEISH_RGX`  |
+    | `FALSEISH_RXS`| `FALSEISH_RGX` |
+    | `BOOLISH_RXS` | `BOOLISH_RGX`  |
+"""
+
+NO_RXS: Final[str] = r"no?"
+r"""
+### No Regex String
+
+*   e.g.: `n`, `N`, `no`, `No`, `NO`, etc.
+*   Usage: `re.compile(NO_RXS, re.IGNORECASE | re.ASCII)`
+
+### Pattern: `no?`
+
+#### No Regex Structure:
+
+| Regex | Letter | Suffix? | Value |
+|-------|-------:|:--------|-------|
+| `no?` |    `n` | `o`     | False |
+
+
+See also:
+    | Regex Strings | Regex Patterns |
+    |---------------|----------------|
+    | `YES_RXS`     | `YES_RGX`      |
+    |               | `NO_RGX`       |
+    | `YES_NO_RXS`  | `YES_NO_RGX`   |
+    | `TRUEISH_RXS` | `TRUEISH_RGX`  |
+    | `FALSEISH_RXS`| `FALSEISH_RGX` |
+    | `BOOLISH_RXS` | `BOOLISH_RGX`  |
+"""
+
+NO_RGX: Pattern
+r"""
+### No Regex Pattern
+
+*   e.g.: `n`, `N`, `no`, `No`, `NO`, etc.
+*   Usage: `NO_RGX.match("no")`
+
+### Pattern: `^\s*(no?)\s*$`
+
+#### No Regex Structure:
+
+| Prefix? | (Cap Grp) | Suffix? |
+|--------:|:---------:|:--------|
+|  `^\s*` |  `(...)`  | `\s*$`  |
+
+#### No Regex Capture Group: `(...)`
+
+| Regex | Letter | Suffix? | Value |
+|-------|-------:|:--------|-------|
+| `no?` |    `n` | `o`     | False |
+
+See also:
+    | Regex Strings | Regex Patterns |
+    |---------------|----------------|
+    | `YES_RXS`     | `YES_RGX`      |
+    | `NO_RXS`      |                |
+    | `YES_NO_RXS`  | `YES_NO_RGX`   |
+    | `TRUEISH_RXS` | `TRUEISH_RGX`  |
+    | `FALSEISH_RXS`| `FALSEISH_RGX` |
+    | `BOOLISH_RXS` | `BOOLISH_RGX`  |
+"""
+
+YES_NO_RXS: Final[str] = rf"{YES_RXS}|{NO_RXS}"
+r"""
+### Yes/No Regex String
+
+*   Yes
+    *   e.g.: `y`, `Y`, `yes`, `Yes`, `YES`, etc.
+*   No
+    *   e.g.: `n`, `N`, `no`, `No`, `NO`, etc.
+*   Usage: `re.compile(YES_NO_RXS, re.IGNORECASE | re.ASCII)`
+
+### Pattern: `y(?:es)?|no?`
+
+#### Yes/No Regex Option Series: `...|...`
+
+| Option |    Regex   | Letter | Suffix? | Value |
+|-------:|------------|-------:|:--------|-------|
+|      1 | `y(?:es)?` |    `y` | `es`    | True  |
+|      2 | `no?`      |    `n` | `o`     | False |
+
+See also:
+    | Regex Strings | Regex Patterns |
+    |---------------|----------------|
+    | `YES_RXS`     | `YES_RGX`      |
+    | `NO_RXS`      | `NO_RGX`       |
+    |               | `YES_NO_RGX`   |
+    | `TRUEISH_RXS` | `TRUEISH_RGX`  |
+    | `FALSEISH_RXS`| `FALSEISH_RGX` |
+    | `BOOLISH_RXS` | `BOOLISH_RGX`  |
+"""
+
+YES_NO_RGX: Pattern
+r"""
+### Yes/No Regex Pattern
+
+*   Yes
+    *   e.g.: `y`, `Y`, `yes`, `Yes`, `YES`, etc.
+*   No
+    *   e.g.: `n`, `N`, `no`, `No`, `NO`, etc.
+*   Usage: `YES_NO_RGX.match("yes")`
+
+### Pattern: `^\s*(y(?:es)?|no?)\s*$`
+
+#### Yes/No Regex Structure:
+
+| Prefix? |  (Cap Opts)  | Suffix? |
+|--------:|:------------:|:--------|
+|  `^\s*` | `(...\|...)` | `\s*$`  |
+
+#### Yes/No Regex Capture Options: `(...|...)`
+
+| Option |    Regex   | Letter | Suffix? | Value |
+|-------:|------------|-------:|:--------|-------|
+|      1 | `y(?:es)?` |    `y` | `es`    | True  |
+|      2 | `no?`      |    `n` | `o`     | False |
+
+See also:
+    | Regex Strings | Regex Patterns |
+    |---------------|----------------|
+    | `YES_RXS`     | `YES_RGX`      |
+    | `NO_RXS`      | `NO_RGX`       |
+    | `YES_NO_RXS`  |                |
+    | `TRUEISH_RXS` | `TRUEISH_RGX`  |
+    | `FALSEISH_RXS`| `FALSEISH_RGX` |
+    | `BOOLISH_RXS` | `BOOLISH_RGX`  |
+"""
 
 
-class YesNo(Enum):
+class YesNo:
     """
-    Yes/No Enum
+    Yes/No Values
 
-    This enum represents the Yes/No values.
+    A plain class with the two singleton instances `YesNo.Yes` and `YesNo.No`.
+    It mirrors the `Enum` interface (`name`, `value`) without routing every
+    member access through the `Enum` metaclass.
     """
-    Yes = True
-    No  = False
+    __slots__ = ("value", "_name")
+
+    Yes: "YesNo"
+    No:  "YesNo"
+
+    def __init__(self, value: bool, name: str) -> None:
+        """
+        Initialize a Yes/No value. Only `YesNo.Yes` and `YesNo.No` should exist.
+
+        Args:
+            value (bool): The boolean value.
+            name  (str):  The display name.
+        """
+        self.value = value
+        self._name = name
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the value: `"Yes"` or `"No"`.
+        """
+        return self._name
 
     def __str__(self) -> str:
         """
-        Convert the enum value to a string.
+        Convert the value to a string.
 
         Returns:
-            str: The string representation of the enum value.
+            str: The string representation of the value.
         """
-        return "Yes" if self.value else "No"
+        return self._name
 
-    YES_RXS: Final[str] = r"y(?:es)?"
-    r"""
-    ### Yes Regex String
-    
-    *   Words: `yes`, `Yes`, `YES`
-    *   Abbrevs: `y`, `Y`
-    *   Usage: `re.compile(YES_RXS)`
-    
-    ### Pattern: `y(?:es)?`
-    
-    #### Yes Regex Structure:
-    
-    |    Regex   | Letter | Suffix? | Value |
-    |------------|-------:|:--------|-------|
-    | `y(?:es)?` |    `y` | `es`    | True  |
-    
-    See also:
-        | Regex Strings | Regex Patterns |
-        |---------------|----------------|
-        |               | `YES_RGX`      |
-        | `NO_RXS`      | `NO_RGX`       |
-        | `YES_NO_RXS`  | `YES_NO_RGX`   |
-        | `TRUEISH_RXS` | `TRUEISH_RGX`  |
-        | `FALSEISH_RXS`| `FALSEISH_RGX` |
-        | `BOOLISH_RXS` | `BOOLISH_RGX`  |
-    """
-    
-    YES_RGX: Final[Pattern] = compile(rf"^\s*\b({YES_RXS})\b\s*$")
-    r"""
-    ### Yes Regex Pattern
-    
-    *   e.g.: `y`, `Y`, `yes`, `Yes`, `YES`, etc.
-    *   Usage: `YES_RGX.match("yes")`
-    
-    ### Pattern: `^\s*(y(?:es)?)\s*$`
-    
-    #### Yes Regex Structure:
-    
-    |  Prefix? | (Cap Grp) | Suffix?  |
-    |---------:|:---------:|:---------|
-    | `^\s*\b` |  `(...)`  | `\b\s*$` |
-    
-    #### Yes Regex Capture Group: `(...)`
-    
-    |    Regex   | Letter | Suffix? | Value |
-    |------------|-------:|:--------|-------|
-    | `y(?:es)?` |    `y` | `es`    | True  |
-    
-    See also:
-        | Regex Strings | Regex Patterns |
-        |---------------|----------------|
-        | `YES_RXS`     |                |
-        | `NO_RXS`      | `NO_RGX`       |
-        | `YES_NO_RXS`  | `YES_NO_RGX`   |
-        | `TRUEISH_RXS` | `TRUEISH_RGX`  |
-        | `FALSEISH_RXS`| `FALSEISH_RGX` |
-        | `BOOLISH_RXS` | `BOOLISH_RGX`  |
-    """
-    
-    NO_RXS: Final[str] = r"no?"
-    r"""
-    ### No Regex String
-    
-    *   e.g.: `n`, `N`, `no`, `No`, `NO`, etc.
-    *   Usage: `re.compile(NO_RXS)`
-    
-    ### Pattern: `no?`
-    
-    #### No Regex Structure:
-    
-    | Regex | Letter | Suffix? | Value |
-    |-------|-------:|:--------|-------|
-    | `no?` |    `n` | `o`     | False |
-    
-    
-    See also:
-        | Regex Strings | Regex Patterns |
-        |---------------|----------------|
-        | `YES_RXS`     | `YES_RGX`      |
-        |               | `NO_RGX`       |
-        | `YES_NO_RXS`  | `YES_NO_RGX`   |
-        | `TRUEISH_RXS` | `TRUEISH_RGX`  |
-        | `FALSEISH_RXS`| `FALSEISH_RGX` |
-        | `BOOLISH_RXS` | `BOOLISH_RGX`  |
-    """
-    
-    NO_RGX: Final[Pattern] = compile(rf"^\s*\b({NO_RXS})\b\s*$")
-    r"""
-    ### No Regex Pattern
-    
-    *   e.g.: `n`, `N`, `no`, `No`, `NO`, etc.
-    *   Usage: `NO_RGX.match("no")`
-    
-    ### Pattern: `^\s*(no?)\s*$`
-    
-    #### No Regex Structure:
-    
-    |  Prefix? | (Cap Grp) | Suffix?  |
-    |---------:|:---------:|:---------|
-    | `^\s*\b` |  `(...)`  | `\b\s*$` |
-    
-    #### No Regex Capture Group: `(...)`
-    
-    | Regex | Letter | Suffix? | Value |
-    |-------|-------:|:--------|-------|
-    | `no?` |    `n` | `o`     | False |
-    
-    See also:
-        | Regex Strings | Regex Patterns |
-        |---------------|----------------|
-        | `YES_RXS`     | `YES_RGX`      |
-        | `NO_RXS`      |                |
-        | `YES_NO_RXS`  | `YES_NO_RGX`   |
-        | `TRUEISH_RXS` | `TRUEISH_RGX`  |
-        | `FALSEISH_RXS`| `FALSEISH_RGX` |
-        | `BOOLISH_RXS` | `BOOLISH_RGX`  |
-    """
-    
-    YES_NO_RXS: Final[str] = rf"{YES_RXS}|{NO_RXS}"
-    r"""
-    ### Yes/No Regex String
-    
-    *   Yes
-        *   e.g.: `y`, `Y`, `yes`, `Yes`, `YES`, etc.
-    *   No
-        *   e.g.: `n`, `N`, `no`, `No`, `NO`, etc.
-    *   Usage: `re.compile(YES_NO_RXS)`
-    
-    ### Pattern: `y(?:es)?|no?`
-    
-    #### Yes/No Regex Option Series: `...|...`
-    
-    | Option |    Regex   | Letter | Suffix? | Value |
-    |-------:|------------|-------:|:--------|-------|
-    |      1 | `y(?:es)?` |    `y` | `es`    | True  |
-    |      2 | `no?`      |    `n` | `o`     | False |
-    
-    See also:
-        | Regex Strings | Regex Patterns |
-        |---------------|----------------|
-        | `YES_RXS`     | `YES_RGX`      |
-        | `NO_RXS`      | `NO_RGX`       |
-        |               | `YES_NO_RGX`   |
-        | `TRUEISH_RXS` | `TRUEISH_RGX`  |
-        | `FALSEISH_RXS`| `FALSEISH_RGX` |
-        | `BOOLISH_RXS` | `BOOLISH_RGX`  |
-    """
-    
-    YES_NO_RGX: Final[Pattern] = compile(rf"^\s*\b({YES_NO_RXS})\b\s*$")
-    r"""
-    ### Yes/No Regex Pattern
-    
-    *   Yes
-        *   e.g.: `y`, `Y`, `yes`, `Yes`, `YES`, etc.
-    *   No
-        *   e.g.: `n`, `N`, `no`, `No`, `NO`, etc.
-    *   Usage: `YES_NO_RGX.match("yes")`
-    
-    ### Pattern: `^\s*(y(?:es)?|no?)\s*$`
-    
-    #### Yes/No Regex Structure:
-    
-    |  Prefix? |  (Cap Opts)  | Suffix?  |
-    |---------:|:------------:|:---------|
-    | `^\s*\b` | `(...\|...)` | `\b\s*$` |
-    
-    #### Yes/No Regex Capture Options: `(...|...)`
-    
-    | Option |    Regex   | Letter | Suffix? | Value |
-    |-------:|------------|-------:|:--------|-------|
-    |      1 | `y(?:es)?` |    `y` | `es`    | True  |
-    |      2 | `no?`      |    `n` | `o`     | False |
-    
-    See also:
-        | Regex Strings | Regex Patterns |
-        |---------------|----------------|
-        | `YES_RXS`     | `YES_RGX`      |
-        | `NO_RXS`      | `NO_RGX`       |
-        | `YES_NO_RXS`  |                |
-        | `TRUEISH_RXS` | `TRUEISH_RGX`  |
-        | `FALSEISH_RXS`| `FALSEISH_RGX` |
-        | `BOOLISH_RXS` | `BOOLISH_RGX`  |
-    """
-
-    @classmethod
-    def interp(cls, val: Union[str, int, bool]) -> "YesNo":
+    def __repr__(self) -> str:
         """
-        Interpret a value as a Yes/No enum.
+        Represent the value the way an `Enum` member would be.
+
+        Returns:
+            str: The representation of the value.
+        """
+        return f"<YesNo.{self._name}: {self.value}>"
+
+    def __bool__(self) -> bool:
+        """
+        Get the boolean value.
+
+        Returns:
+            bool: True for `YesNo.Yes`, False for `YesNo.No`.
+        """
+        return self.value
+
+    def __reduce__(self) -> Tuple[Callable[..., Any], Tuple[Any, ...]]:
+        """
+        Pickle as a reference to the singleton, so unpickling returns `YesNo.Yes` or `YesNo.No`.
+
+        Returns:
+            Tuple[Callable[..., Any], Tuple[Any, ...]]: `getattr(YesNo, name)`.
+        """
+        return getattr, (YesNo, self._name)
+
+    def __copy__(self) -> "YesNo":
+        """
+        Copy the value. The values are singletons, so this returns the value itself.
+
+        Returns:
+            YesNo: This value.
+        """
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "YesNo":
+        """
+        Deep copy the value. The values are singletons, so this returns the value itself.
+
+        Args:
+            memo (Dict[int, Any]): The `copy.deepcopy` memo (unused).
+
+        Returns:
+            YesNo: This value.
+        """
+        return self
+
+    @staticmethod
+    def interp(val: Union[str, int, bool]) -> "YesNo":
+        """
+        Interpret a value as a Yes/No value.
+
+        The exact `bool`, `int` and `str` types are dispatched on with identity
+        checks; subclasses fall back to `isinstance`.
 
         Args:
             val (Union[str, int, bool]): The value to interpret.
 
         Returns:
-            YesNo: The interpreted Yes/No enum value.
+            YesNo: The interpreted Yes/No value.
+
+        Raises:
+            ValueError: If the value cannot be interpreted as Yes/No.
         """
-        if isinstance(val, str):
-            if YES_RGX.match(val):
-                return cls.Yes
-            elif NO_RGX.match(val):
-                return cls.No
-        elif isinstance(val, bool):
-            return cls.Yes if val else cls.No
+        yes, no = YesNo.Yes, YesNo.No
+        val_type = type(val)
+        if val_type is bool or val_type is int:
+            return yes if val else no
+        if val_type is str or isinstance(val, str):
+            group = _match_group(val)
+            if group == "yes":
+                return yes
+            elif group == "no":
+                return no
+        elif isinstance(val, int):
+            return yes if val else no
         raise ValueError(f"Cannot interpret {val} as Yes/No")
 
-ON_RXS: Final[str] = r"[oO]n|ON"
+YesNo.Yes = YesNo(True,  _YES_STR)
+YesNo.No  = YesNo(False, _NO_STR)
+
+
+ON_RXS: Final[str] = r"on"
 r"""
 ### On Regex String
 
@@ -639,250 +775,1432 @@ r"""
 TODO: docstring
 """
 
-ON_RGX: Final[Pattern] = compile(rf"^\s*\b({ON_RXS})\b\s*$")
+ON_RGX: Pattern
 r"""
 TODO: docstring
 """
 
-OFF_RXS: Final[str] = r"[oO]ff|OFF"
+OFF_RXS: Final[str] = r"off"
 r"""
 TODO: docstring
 """
 
-OFF_RGX: Final[Pattern] = compile(rf"^\s*\b({OFF_RXS})\b\s*$")
+OFF_RGX: Pattern
 r"""
 TODO: docstring
 """
 
-ON_OFF_RXS: Final[str] = rf"[oO](?:n|ff)|O(?:N|FF)"
+ON_OFF_RXS: Final[str] = r"o(?:n|ff)"
 """
 TODO: docstring
 """
 
-ENABLE_RXS: Final[str] = r"[eE]nable|ENABLE"
+ON_OFF_RGX: Pattern
 r"""
 TODO: docstring
 """
 
-ENABLE_RGX: Final[Pattern] = compile(rf"^\s*\b({ENABLE_RXS})\b\s*$")
+ENABLE_RXS: Final[str] = r"enable"
 r"""
 TODO: docstring
 """
 
-DISABLE_RXS: Final[str] = r"[dD]isable|DISABLE"
+ENABLE_RGX: Pattern
 r"""
 TODO: docstring
 """
 
-DISABLE_RGX: Final[Pattern] = compile(rf"^\s*\b({DISABLE_RXS})\b\s*$")
+DISABLE_RXS: Final[str] = r"disable"
 r"""
 TODO: docstring
 """
 
-ENABLE_DISABLE_RXS: Final[str] = r"(?:[eE]n|[dD]is)able|(?:EN|DIS)ABLE"
+DISABLE_RGX: Pattern
 r"""
 TODO: docstring
 """
 
-ENABLE_DISABLE_RGX: Final[Pattern] = compile(rf"^\s*\b({ENABLE_DISABLE_RXS})\b\s*$")
+ENABLE_DISABLE_RXS: Final[str] = r"(?:en|dis)able"
 r"""
 TODO: docstring
 """
 
-ENABLED_RXS: Final[str] = r"[eE]nabled|ENABLED"
+ENABLE_DISABLE_RGX: Pattern
 r"""
 TODO: docstring
 """
 
-ENABLED_RGX: Final[Pattern] = compile(rf"^\s*\b({ENABLED_RXS})\b\s*$")
+ENABLED_RXS: Final[str] = r"enabled"
 r"""
 TODO: docstring
 """
 
-DISABLED_RXS: Final[str] = r"[dD]isabled|DISABLED"
+ENABLED_RGX: Pattern
 r"""
 TODO: docstring
 """
 
-DISABLED_RGX: Final[Pattern] = compile(rf"^\s*\b({DISABLED_RXS})\b\s*$")
+DISABLED_RXS: Final[str] = r"disabled"
 r"""
 TODO: docstring
 """
 
-ENABLED_DISABLED_RXS: Final[str] = r"(?:[eE]n|[dD]is)abled|(?:EN|DIS)ABLED"
+DISABLED_RGX: Pattern
 r"""
 TODO: docstring
 """
 
-ENABLED_DISABLED_RGX: Final[Pattern] = compile(rf"^\s*\b({ENABLED_DISABLED_RXS})\b\s*$")
+ENABLED_DISABLED_RXS: Final[str] = r"(?:en|dis)abled"
 r"""
 TODO: docstring
 """
 
-ENABLEDISH_RXS: Final[str] = r"[eE]nabled?|ENABLED?"
+ENABLED_DISABLED_RGX: Pattern
 r"""
 TODO: docstring
 """
 
-ENABLEDISH_RGX: Final[Pattern] = compile(rf"^\s*\b({ENABLEDISH_RXS})\b\s*$")
+ENABLEDISH_RXS: Final[str] = r"enabled?"
 r"""
 TODO: docstring
 """
 
-DISABLEDISH_RXS: Final[str] = r"[dD]isabled?|DISABLED?"
+ENABLEDISH_RGX: Pattern
 r"""
 TODO: docstring
 """
 
-DISABLEDISH_RGX: Final[Pattern] = compile(rf"^\s*\b({DISABLEDISH_RXS})\b\s*$")
+DISABLEDISH_RXS: Final[str] = r"disabled?"
 r"""
 TODO: docstring
 """
 
-ENABLED_DISABLEDISH_RXS: Final[str] = r"(?:[eE]n|[dD]is)abled?|(?:EN|DIS)ABLED?"
+DISABLEDISH_RGX: Pattern
 r"""
 TODO: docstring
 """
 
-ENABLED_DISABLEDISH_RGX: Final[Pattern] = compile(rf"^\s*\b({ENABLED_DISABLEDISH_RXS})\b\s*$")
+ENABLED_DISABLEDISH_RXS: Final[str] = r"(?:en|dis)abled?"
 r"""
 TODO: docstring
 """
 
-TRUEISH_RXS: Final[str] = rf"{TRUE_RXS}|{YES_RXS}|{ON_RXS}|{ENABLEDISH_RXS}"
+ENABLED_DISABLEDISH_RGX: Pattern
 r"""
 TODO: docstring
 """
 
-TRUEISH_RGX: Final[Pattern] = compile(rf"^\s*\b({TRUEISH_RXS})\b\s*$")
+_TRUEISH_PARTS: Final[Tuple[str, ...]] = (TRUE_RXS, YES_RXS, ON_RXS, ENABLEDISH_RXS)
+"""
+The true word family regex strings, joined into `TRUEISH_RXS`.
+"""
+
+_FALSEISH_PARTS: Final[Tuple[str, ...]] = (FALSE_RXS, NO_RXS, OFF_RXS, DISABLEDISH_RXS)
+"""
+The false word family regex strings, joined into `FALSEISH_RXS`.
+"""
+
+_BOOLISH_PARTS: Final[Tuple[str, ...]] = (
+    BOOL_RXS, YES_NO_RXS, ON_OFF_RXS, ENABLED_DISABLEDISH_RXS
+)
+"""
+The combined word family regex strings, joined into `BOOLISH_RXS`.
+
+The enabled/disabled family uses the factored `(?:en|dis)abled?` rather than
+`ENABLEDISH_RXS` and `DISABLEDISH_RXS` side by side, so the shared `abled?`
+suffix is compiled once.
+"""
+
+TRUEISH_RXS: Final[str] = "|".join(_TRUEISH_PARTS)
 r"""
 TODO: docstring
 """
 
-FALSEISH_RXS: Final[str] = rf"{FALSE_RXS}|{NO_RXS}|{OFF_RXS}|{DISABLEDISH_RXS}"
+TRUEISH_RGX: Pattern
 r"""
 TODO: docstring
 """
 
-FALSEISH_RGX: Final[Pattern] = compile(rf"^\s*\b({FALSEISH_RXS})\b\s*$")
+FALSEISH_RXS: Final[str] = "|".join(_FALSEISH_PARTS)
 r"""
 TODO: docstring
 """
 
-BOOLISH_RXS: Final[str] = rf"{BOOL_RXS}|{YES_NO_RXS}|{ON_OFF_RXS}|{ENABLED_DISABLEDISH_RXS}"
+FALSEISH_RGX: Pattern
 r"""
 TODO: docstring
 """
 
-BOOLISH_RGX: Final[Pattern] = compile(rf"^\s*\b({BOOLISH_RXS})\b\s*$")
+BOOLISH_RXS: Final[str] = "|".join(_BOOLISH_PARTS)
 r"""
 TODO: docstring
 """
 
-BOOLISH_PATTERN_MAP: Final[Dict[Pattern, Tuple[str, bool]]] = {
-    TRUE_RGX:           ("True",        True),
-    FALSE_RGX:          ("False",       False),
-    YES_RGX:            ("Yes",         True),
-    NO_RGX:             ("No",          False),
-    ON_RGX:             ("On",          True),
-    OFF_RGX:            ("Off",         False),
-    ENABLEDISH_RGX:     ("Enabled",     True),
-    DISABLEDISH_RGX:    ("Disabled",    False),
-}
+BOOLISH_RGX: Pattern
 r"""
 TODO: docstring
 """
 
-BOOLISH_PATTERN_STR_MAP: Final[Dict[Pattern, str]] = {
-    TRUE_RGX:           "True",
-    FALSE_RGX:          "False",
-    YES_RGX:            "Yes",
-    NO_RGX:             "No",
-    ON_RGX:             "On",
-    OFF_RGX:            "Off",
-    ENABLEDISH_RGX:     "Enabled",
-    DISABLEDISH_RGX:    "Disabled",
-}
+BOOL_CORE_RGX: Pattern
 r"""
-TODO: docstring
+### Unanchored Boolean Regex Pattern
+
+*   Words: same as `BOOL_RGX`
+*   Usage: `BOOL_CORE_RGX.fullmatch(string.strip())`
+
+### Pattern: `(t(?:rue)?|f(?:alse)?)`
 """
 
-BOOLISH_PATTERN_BOOL_MAP: Final[Dict[Pattern, bool]] = {
-    TRUE_RGX:           True,
-    FALSE_RGX:          False,
-    YES_RGX:            True,
-    NO_RGX:             False,
-    ON_RGX:             True,
-    OFF_RGX:            False,
-    ENABLEDISH_RGX:     True,
-    DISABLEDISH_RGX:    False,
-}
+BOOLISH_CORE_RGX: Pattern
 r"""
-TODO: docstring
+### Unanchored Booleanish Regex Pattern
+
+*   Words: same as `BOOLISH_RGX`
+*   Usage: `BOOLISH_CORE_RGX.fullmatch(string.strip())`
 """
 
-########## Functions ##########
+BOOLISH_DISPATCH_RXS: Final[str] = (
+    rf"(?P<true>{TRUE_RXS})|(?P<false>{FALSE_RXS})|"
+    rf"(?P<yes>{YES_RXS})|(?P<no>{NO_RXS})|"
+    rf"(?P<on>{ON_RXS})|(?P<off>{OFF_RXS})|"
+    rf"(?P<enabled>{ENABLEDISH_RXS})|(?P<disabled>{DISABLEDISH_RXS})"
+)
+r"""
+### Booleanish Dispatch Regex String
+
+Matches the same words as `BOOLISH_RXS`, but each word family is captured by
+its own named group, so a single match both validates and classifies a word.
+
+| Group      | Regex String      |
+|------------|-------------------|
+| `true`     | `TRUE_RXS`        |
+| `false`    | `FALSE_RXS`       |
+| `yes`      | `YES_RXS`         |
+| `no`       | `NO_RXS`          |
+| `on`       | `ON_RXS`          |
+| `off`      | `OFF_RXS`         |
+| `enabled`  | `ENABLEDISH_RXS`  |
+| `disabled` | `DISABLEDISH_RXS` |
+"""
 
-def is_bool_str(string: str) -> bool:
-    """
-    Determine if the string represents a boolean value.
-    
-    Args:
-        string (str): The string to evaluate.
-        
-    Returns:
-        bool: True if the string represents a boolean value, False otherwise.
-    """
-    return BOOL_RGX.match(string)is not None
+BOOLISH_DISPATCH_RGX: Pattern
+r"""
+### Booleanish Dispatch Regex Pattern
 
-def is_boolish_str(string: str) -> bool:
-    """
-    Determine if the string represents a boolean value or can be interpreted as a boolean.
-    
-    Args:
-        string (str): The string to evaluate.
-        
-    Returns:
-        bool: True if the string represents a booleanish value, False otherwise.
-    """
-    return BOOLISH_RGX.match(string)is not None
+*   Usage: `BOOLISH_GROUP_MAP[BOOLISH_DISPATCH_RGX.match(" Off ").lastgroup]`
 
+One match against this pattern replaces trying each pattern of
+`BOOLISH_PATTERN_MAP` in turn: `Match.lastgroup` names the word family, which
+`BOOLISH_GROUP_MAP` maps to its canonical string and boolean value.
+The groups are in table order, so `Match.lastindex - 1` indexes `_BOOLISH_TABLE` directly.
 
+Every alternative is a short literal with at most one optional suffix (no nested
+quantifiers, backreferences or lookaround), so a match is linear in the input length
+and cannot backtrack catastrophically. The predicates, `to_bool` and
+`interpret_as_bool` do not match it at all: they look the stripped string up in the
+literal tables.
+"""
 
+_BOOLISH_TABLE: Final[Tuple[Tuple[str, bool], ...]] = (
+    (_TRUE_STR,     True),
+    (_FALSE_STR,    False),
+    (_YES_STR,      True),
+    (_NO_STR,       False),
+    (_ON_STR,       True),
+    (_OFF_STR,      False),
+    (_ENABLED_STR,  True),
+    (_DISABLED_STR, False),
+)
+"""
+Canonical string and boolean value of each word family, in the order of the
+`BOOLISH_DISPATCH_RXS` groups.
+"""
 
-def to_bool(num: Union[str, Number]) -> bool:
-    """
-    Convert a string that represents a boolean value or a number to a boolean.
-    
-    Does 
-    Also accepts numbers as input just to be more flexible. Just returns the number as-is.
+_GROUP_IDX: Final[Dict[str, int]] = {
+    "true":     0,
+    "false":    1,
+    "yes":      2,
+    "no":       3,
+    "on":       4,
+    "off":      5,
+    "enabled":  6,
+    "disabled": 7,
+}
+"""
+Index of each `BOOLISH_DISPATCH_RGX` group name into `_BOOLISH_TABLE`.
+"""
 
-    Args:
-        num (Union[str, Number]): The string to convert.
+BOOLISH_GROUP_MAP: Final[Dict[str, Tuple[str, bool]]] = {
+    group: _BOOLISH_TABLE[index] for group, index in _GROUP_IDX.items()
+}
+"""
+Map of each `BOOLISH_DISPATCH_RGX` group name to its canonical string and
+boolean value.
+"""
 
-    Returns:
-        Union[int, float]: The converted number.
-    """
-    if is_real(num):
-        return float(num)
-    elif is_int(num):
-        return int(num) if is_int_dec(num) else 
+BOOLISH_PATTERN_MAP: Mapping[Pattern, Tuple[str, bool]]
+r"""
+Read-only map of the booleanish regex patterns to their canonical strings and
+boolean values.
 
-    raise ValueError(f"Invalid number format: {num}")
+This is metadata: to classify a string, match `BOOLISH_DISPATCH_RGX` once
+instead of trying each pattern.
+"""
 
+BOOLISH_PATTERN_STR_MAP: Mapping[Pattern, str]
+r"""
+Read-only map of the booleanish regex patterns to their canonical strings.
+"""
 
-def to_bool_str(value: Union[Number, str]) -> str:
-    """
-    Format as a boolean string
-    values: `True` or `False`
-    
-    Args:
-        value (Union[Number, str]): The boolean interpretable value to format.
+BOOLISH_PATTERN_BOOL_MAP: Mapping[Pattern, bool]
+r"""
+Read-only map of the booleanish regex patterns to their boolean values.
+
+To interpret a string, prefer `interpret_as_bool`, which looks the stripped
+string up directly instead of trying each pattern.
+"""
+
+########## Lazy Patterns ##########
+
+_RGX_SOURCES: Final[Dict[str, str]] = {
+    "TRUE_RGX":                 rf"^\s*({TRUE_RXS})\s*$",
+    "FALSE_RGX":                rf"^\s*({FALSE_RXS})\s*$",
+    "BOOL_RGX":                 rf"^\s*({BOOL_RXS})\s*$",
+    "YES_RGX":                  rf"^\s*({YES_RXS})\s*$",
+    "NO_RGX":                   rf"^\s*({NO_RXS})\s*$",
+    "YES_NO_RGX":               rf"^\s*({YES_NO_RXS})\s*$",
+    "ON_RGX":                   rf"^\s*({ON_RXS})\s*$",
+    "OFF_RGX":                  rf"^\s*({OFF_RXS})\s*$",
+    "ON_OFF_RGX":               rf"^\s*({ON_OFF_RXS})\s*$",
+    "ENABLE_RGX":               rf"^\s*({ENABLE_RXS})\s*$",
+    "DISABLE_RGX":              rf"^\s*({DISABLE_RXS})\s*$",
+    "ENABLE_DISABLE_RGX":       rf"^\s*({ENABLE_DISABLE_RXS})\s*$",
+    "ENABLED_RGX":              rf"^\s*({ENABLED_RXS})\s*$",
+    "DISABLED_RGX":             rf"^\s*({DISABLED_RXS})\s*$",
+    "ENABLED_DISABLED_RGX":     rf"^\s*({ENABLED_DISABLED_RXS})\s*$",
+    "ENABLEDISH_RGX":           rf"^\s*({ENABLEDISH_RXS})\s*$",
+    "DISABLEDISH_RGX":          rf"^\s*({DISABLEDISH_RXS})\s*$",
+    "ENABLED_DISABLEDISH_RGX":  rf"^\s*({ENABLED_DISABLEDISH_RXS})\s*$",
+    "TRUEISH_RGX":              rf"^\s*({TRUEISH_RXS})\s*$",
+    "FALSEISH_RGX":             rf"^\s*({FALSEISH_RXS})\s*$",
+    "BOOLISH_RGX":              rf"^\s*({BOOLISH_RXS})\s*$",
+    "BOOLISH_DISPATCH_RGX":     rf"^\s*(?:{BOOLISH_DISPATCH_RXS})\s*$",
+    "BOOL_CORE_RGX":            rf"({BOOL_RXS})",
+    "BOOLISH_CORE_RGX":         rf"({BOOLISH_RXS})",
+}
+r"""
+Map of each `*_RGX` name to the regex string it is compiled from: the capturing
+`*_RXS` alternation (or the named groups of `BOOLISH_DISPATCH_RXS`) between `^\s*`
+and `\s*$`, or the bare alternation for the `*_CORE_RGX` patterns.
+
+The patterns are compiled on first access through the module `__getattr__`
+rather than at import, so importing this module compiles nothing.
+"""
+
+_PATTERN_MAP_ENTRIES: Final[Tuple[Tuple[str, str], ...]] = (
+    ("TRUE_RGX",        "true"),
+    ("FALSE_RGX",       "false"),
+    ("YES_RGX",         "yes"),
+    ("NO_RGX",          "no"),
+    ("ON_RGX",          "on"),
+    ("OFF_RGX",         "off"),
+    ("ENABLEDISH_RGX",  "enabled"),
+    ("DISABLEDISH_RGX", "disabled"),
+)
+"""
+Entries of the `BOOLISH_PATTERN_*` maps: pattern name and `_GROUP_IDX` group.
+
+All three maps are projections of the records built from these entries by
+`_boolish_records`, so they cannot drift apart.
+"""
+
+_PATTERN_MAP_VALUES: Final[Dict[str, Callable[[str, bool], Any]]] = {
+    "BOOLISH_PATTERN_MAP":      lambda string, value: (string, value),
+    "BOOLISH_PATTERN_STR_MAP":  lambda string, value: string,
+    "BOOLISH_PATTERN_BOOL_MAP": lambda string, value: value,
+}
+"""
+Map of each lazily built `BOOLISH_PATTERN_*` name to the builder of its values.
+"""
+
+@cache
+def _boolish_records() -> Tuple[Tuple[Pattern, str, bool], ...]:
+    """
+    Build the pattern, canonical string and boolean value of each word family,
+    compiling the patterns on the first call.
+
+    Returns:
+        Tuple[Tuple[Pattern, str, bool], ...]: The records, in `_BOOLISH_TABLE` order.
+    """
+    return tuple(
+        (_pattern(rgx_name), *_BOOLISH_TABLE[_GROUP_IDX[group]])
+        for rgx_name, group in _PATTERN_MAP_ENTRIES
+    )
+
+@cache
+def _compile_rgx(source: str) -> Pattern:
+    """
+    Compile the source of a `*_RGX` pattern, memoized on the source.
+
+    Args:
+        source (str): The regex string to compile.
+
+    Returns:
+        Pattern: The compiled pattern; the same object for the same source.
+    """
+    return compile(source, IGNORECASE | ASCII)
+
+@lru_cache(maxsize=1024)
+def compile_cached(pattern: str, flags: int = 0) -> Pattern:
+    """
+    Compile a regex string, memoized on the string and flags.
+
+    Use this when composing patterns from the `*_RXS` strings at runtime (e.g.
+    `compile_cached(rf"(?:{BOOL_RXS})=(?:{BOOL_RXS})", IGNORECASE)`), so that
+    repeated calls do not recompile the same pattern.
+
+    Args:
+        pattern (str): The regex string to compile.
+        flags (int):   The `re` flags to compile with.
+
+    Returns:
+        Pattern: The compiled pattern.
+    """
+    return compile(pattern, flags)
+
+def get_bool_pattern(name: str) -> Pattern:
+    """
+    Get a compiled booleanish pattern by name, e.g. `"bool"`, `"yes_no"` or
+    `"boolish"` for `BOOL_RGX`, `YES_NO_RGX` or `BOOLISH_RGX`.
+
+    Args:
+        name (str): The pattern name, without the `_RGX` suffix (case-insensitive).
+
+    Returns:
+        Pattern: The compiled pattern.
+
+    Raises:
+        ValueError: If the name is not a string or there is no booleanish pattern with that name.
+    """
+    rgx_name = f"{name.upper()}_RGX" if isinstance(name, str) else None
+    if rgx_name not in _RGX_SOURCES:
+        raise ValueError(f"Unknown boolean pattern: {name!r}")
+    return _pattern(rgx_name)
+
+def _pattern(name: str) -> Pattern:
+    """
+    Get a `*_RGX` pattern by name, compiling it if it has not been accessed yet.
+
+    Args:
+        name (str): The name of the pattern.
+
+    Returns:
+        Pattern: The compiled pattern.
+    """
+    pattern = globals().get(name)
+    return pattern if pattern is not None else __getattr__(name)
+
+def __getattr__(name: str) -> Any:
+    """
+    Compile a `*_RGX` pattern or build a `BOOLISH_PATTERN_*` map on first access.
+
+    The result is cached in the module globals, so later lookups never reach
+    this function again.
+
+    Args:
+        name (str): The name of the attribute being looked up.
+
+    Returns:
+        Any: The compiled pattern or built map.
+
+    Raises:
+        AttributeError: If the name is not a lazily built attribute.
+    """
+    source = _RGX_SOURCES.get(name)
+    if source is not None:
+        value = _compile_rgx(source)
+    elif name in _PATTERN_MAP_VALUES:
+        make_value = _PATTERN_MAP_VALUES[name]
+        value = MappingProxyType({
+            pattern: make_value(string, flag)
+            for pattern, string, flag in _boolish_records()
+        })
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    """
+    List the module attributes, including the lazily built ones.
+
+    Returns:
+        List[str]: The sorted attribute names.
+    """
+    return sorted({*globals(), *_RGX_SOURCES, *_PATTERN_MAP_VALUES})
+
+########## Literals ##########
+
+_ASCII_SPACES: Final[str] = " \t\n\r\f\v"
+r"""
+ASCII whitespace, the set `\s` matches in the `ASCII` patterns.
+
+The literal lookups strip only these and accept only ASCII strings, so they
+accept the same language as the `*_RGX` patterns.
+"""
+
+_TRUE_LITERALS: Final[FrozenSet[str]] = frozenset(("t", "true"))
+"""Lowercase form of every string matched by `TRUE_RXS`."""
+
+_FALSE_LITERALS: Final[FrozenSet[str]] = frozenset(("f", "false"))
+"""Lowercase form of every string matched by `FALSE_RXS`."""
+
+_YES_LITERALS: Final[FrozenSet[str]] = frozenset(("y", "yes"))
+"""Lowercase form of every string matched by `YES_RXS`."""
+
+_NO_LITERALS: Final[FrozenSet[str]] = frozenset(("n", "no"))
+"""Lowercase form of every string matched by `NO_RXS`."""
+
+_ON_LITERALS: Final[FrozenSet[str]] = frozenset(("on",))
+"""Lowercase form of every string matched by `ON_RXS`."""
+
+_OFF_LITERALS: Final[FrozenSet[str]] = frozenset(("off",))
+"""Lowercase form of every string matched by `OFF_RXS`."""
+
+_ENABLED_LITERALS: Final[FrozenSet[str]] = frozenset(("enable", "enabled"))
+"""Lowercase form of every string matched by `ENABLEDISH_RXS`."""
+
+_DISABLED_LITERALS: Final[FrozenSet[str]] = frozenset(("disable", "disabled"))
+"""Lowercase form of every string matched by `DISABLEDISH_RXS`."""
+
+_BOOL_LITERALS:             Final[FrozenSet[str]] = _TRUE_LITERALS    | _FALSE_LITERALS
+_YES_NO_LITERALS:           Final[FrozenSet[str]] = _YES_LITERALS     | _NO_LITERALS
+_ON_OFF_LITERALS:           Final[FrozenSet[str]] = _ON_LITERALS      | _OFF_LITERALS
+_ENABLED_DISABLED_LITERALS: Final[FrozenSet[str]] = _ENABLED_LITERALS | _DISABLED_LITERALS
+_TRUEISH_LITERALS:          Final[FrozenSet[str]] = (
+    _TRUE_LITERALS | _YES_LITERALS | _ON_LITERALS | _ENABLED_LITERALS
+)
+_FALSEISH_LITERALS:         Final[FrozenSet[str]] = (
+    _FALSE_LITERALS | _NO_LITERALS | _OFF_LITERALS | _DISABLED_LITERALS
+)
+_BOOLISH_LITERALS:          Final[FrozenSet[str]] = _TRUEISH_LITERALS | _FALSEISH_LITERALS
+
+_MAX_LITERAL_LEN: Final[int] = max(map(len, _BOOLISH_LITERALS))
+"""
+Length of the longest booleanish literal.
+
+A stripped string longer than this cannot be booleanish, so it is rejected before the
+lowercase copy is made.
+"""
+
+_LITERAL_MAP: Final[Dict[str, Tuple[str, bool]]] = {
+    literal: (group, value)
+    for group, value, literals in (
+        ("true",     True,  _TRUE_LITERALS),
+        ("false",    False, _FALSE_LITERALS),
+        ("yes",      True,  _YES_LITERALS),
+        ("no",       False, _NO_LITERALS),
+        ("on",       True,  _ON_LITERALS),
+        ("off",      False, _OFF_LITERALS),
+        ("enabled",  True,  _ENABLED_LITERALS),
+        ("disabled", False, _DISABLED_LITERALS),
+    )
+    for literal in literals
+}
+"""
+Map of every booleanish literal to its word family and boolean value.
+
+The booleanish vocabulary is small and finite, so after stripping whitespace and
+lowercasing a hashed lookup replaces the regex match in the predicates below. The `*_RXS` and
+`*_RGX` constants above describe the same vocabulary and remain available for
+composing larger patterns.
+"""
+
+_BOOLISH_BOOL_MAP: Final[Dict[str, bool]] = {
+    literal: value for literal, (_, value) in _LITERAL_MAP.items()
+}
+"""
+Map of every booleanish literal to its boolean value.
+
+This is the literal-keyed counterpart of `BOOLISH_PATTERN_BOOL_MAP`: a single
+dict probe instead of trying each pattern in turn.
+"""
+
+_EXACT_BOOLISH_BOOL_MAP: Final[Dict[str, bool]] = {
+    variant: value
+    for literal, value in _BOOLISH_BOOL_MAP.items()
+    for variant in (literal, literal.capitalize(), literal.upper())
+}
+"""
+`_BOOLISH_BOOL_MAP` extended with the title and upper case spelling of every
+literal, so clean input (e.g. `"True"`, `"OFF"`) resolves with one dict probe
+before falling back to stripping and lowercasing.
+"""
+
+_EXACT_BOOL_LITERALS: Final[FrozenSet[str]] = frozenset(
+    variant
+    for literal in _BOOL_LITERALS
+    for variant in (literal, literal.capitalize(), literal.upper())
+)
+"""
+`_BOOL_LITERALS` with the title and upper case spelling of every literal.
+"""
+
+_BOOL_STRS:             Final[Tuple[str, str]] = (_FALSE_STR,    _TRUE_STR)
+_YES_NO_STRS:           Final[Tuple[str, str]] = (_NO_STR,       _YES_STR)
+_ON_OFF_STRS:           Final[Tuple[str, str]] = (_OFF_STR,      _ON_STR)
+_ENABLED_DISABLED_STRS: Final[Tuple[str, str]] = (_DISABLED_STR, _ENABLED_STR)
+
+_STYLE_TABLE: Final[Dict[str, Tuple[str, str]]] = {
+    "bool":             _BOOL_STRS,
+    "yes_no":           _YES_NO_STRS,
+    "on_off":           _ON_OFF_STRS,
+    "enabled_disabled": _ENABLED_DISABLED_STRS,
+}
+"""
+Map of each `to_formatted` style to its `(false, true)` strings, indexed by the
+boolean value.
+"""
+
+_GROUP_STYLES: Final[Dict[str, str]] = {
+    "true":     "bool",
+    "false":    "bool",
+    "yes":      "yes_no",
+    "no":       "yes_no",
+    "on":       "on_off",
+    "off":      "on_off",
+    "enabled":  "enabled_disabled",
+    "disabled": "enabled_disabled",
+}
+"""
+Map of each word family to the `to_formatted` style that keeps it.
+"""
+
+########## Functions ##########
+
+def _match_group(string: str) -> Optional[str]:
+    """
+    Look up the word family of a booleanish string.
+
+    Args:
+        string (str): The string to look up.
+
+    Returns:
+        Optional[str]: The name of the word family (e.g. `"yes"`), or None if
+            the string is not booleanish.
+    """
+    if not string.isascii():
+        return None
+    entry = _LITERAL_MAP.get(string.strip(_ASCII_SPACES).lower())
+    return entry[0] if entry is not None else None
+
+def _format_flag(value: Union[Number, str]) -> bool:
+    """
+    Interpret a value as a boolean for formatting.
+
+    Args:
+        value (Union[Number, str]): The boolean interpretable value.
+
+    Returns:
+        bool: The boolean value, used to index a `(false, true)` pair of strings.
+
+    Raises:
+        ValueError: If the value cannot be interpreted as a boolean.
+    """
+    if type(value) is bool:
+        return value
+    flag = interpret_as_bool(value)
+    if flag is None:
+        raise ValueError(f"Cannot interpret {value} as a boolean")
+    return flag
+
+def is_bool(string: str) -> bool:
+    """
+    Determine if the string represents a boolean value.
+
+    Args:
+        string (str): The string to evaluate.
+
+    Returns:
+        bool: True if the string represents a boolean value, False otherwise.
+    """
+    return string.isascii() and string.strip(_ASCII_SPACES).lower() in _BOOL_LITERALS
+
+def is_true(string: str) -> bool:
+    """
+    Determine if the string represents a true value.
+
+    Args:
+        string (str): The string to evaluate.
+
+    Returns:
+        bool: True if the string represents a true value, False otherwise.
+    """
+    return string.isascii() and string.strip(_ASCII_SPACES).lower() in _TRUE_LITERALS
+
+def is_false(string: str) -> bool:
+    """
+    Determine if the string represents a false value.
+
+    Args:
+        string (str): The string to evaluate.
+
+    Returns:
+        bool: True if the string represents a false value, False otherwise.
+    """
+    return string.isascii() and string.strip(_ASCII_SPACES).lower() in _FALSE_LITERALS
+
+def is_yes(string: str) -> bool:
+    """
+    Determine if the string represents a yes value.
+
+    Args:
+        string (str): The string to evaluate.
+
+    Returns:
+        bool: True if the string represents a yes value, False otherwise.
+    """
+    return string.isascii() and string.strip(_ASCII_SPACES).lower() in _YES_LITERALS
+
+def is_no(string: str) -> bool:
+    """
+    Determine if the string represents a no value.
+
+    Args:
+        string (str): The string to evaluate.
+
+    Returns:
+        bool: True if the string represents a no value, False otherwise.
+    """
+    return string.isascii() and string.strip(_ASCII_SPACES).lower() in _NO_LITERALS
+
+def is_yes_no(string: str) -> bool:
+    """
+    Determine if the string represents a yes/no value.
+
+    Args:
+        string (str): The string to evaluate.
+
+    Returns:
+        bool: True if the string represents a yes/no value, False otherwise.
+    """
+    return string.isascii() and string.strip(_ASCII_SPACES).lower() in _YES_NO_LITERALS
+
+def is_on(string: str) -> bool:
+    """
+    Determine if the string represents an on value.
+
+    Args:
+        string (str): The string to evaluate.
+
+    Returns:
+        bool: True if the string represents an on value, False otherwise.
+    """
+    return string.isascii() and string.strip(_ASCII_SPACES).lower() in _ON_LITERALS
+
+def is_off(string: str) -> bool:
+    """
+    Determine if the string represents an off value.
+
+    Args:
+        string (str): The string to evaluate.
+
+    Returns:
+        bool: True if the string represents an off value, False otherwise.
+    """
+    return string.isascii() and string.strip(_ASCII_SPACES).lower() in _OFF_LITERALS
+
+def is_on_off(string: str) -> bool:
+    """
+    Determine if the string represents an on/off value.
+
+    Args:
+        string (str): The string to evaluate.
+
+    Returns:
+        bool: True if the string represents an on/off value, False otherwise.
+    """
+    return string.isascii() and string.strip(_ASCII_SPACES).lower() in _ON_OFF_LITERALS
+
+def is_enabled(string: str) -> bool:
+    """
+    Determine if the string represents an enabled value.
+
+    Args:
+        string (str): The string to evaluate.
+
+    Returns:
+        bool: True if the string represents an enabled value, False otherwise.
+    """
+    return string.isascii() and string.strip(_ASCII_SPACES).lower() in _ENABLED_LITERALS
+
+def is_disabled(string: str) -> bool:
+    """
+    Determine if the string represents a disabled value.
+
+    Args:
+        string (str): The string to evaluate.
+
+    Returns:
+        bool: True if the string represents a disabled value, False otherwise.
+    """
+    return string.isascii() and string.strip(_ASCII_SPACES).lower() in _DISABLED_LITERALS
+
+def is_enabled_disabled(string: str) -> bool:
+    """
+    Determine if the string represents an enabled/disabled value.
+
+    Args:
+        string (str): The string to evaluate.
+
+    Returns:
+        bool: True if the string represents an enabled/disabled value, False otherwise.
+    """
+    return string.isascii() and string.strip(_ASCII_SPACES).lower() in _ENABLED_DISABLED_LITERALS
+
+def is_boolish(string: str) -> bool:
+    """
+    Determine if the string represents a booleanish value.
+
+    Args:
+        string (str): The string to evaluate.
+
+    Returns:
+        bool: True if the string represents a booleanish value, False otherwise.
+    """
+    return string.isascii() and string.strip(_ASCII_SPACES).lower() in _BOOLISH_LITERALS
+
+def is_trueish(string: str) -> bool:
+    """
+    Determine if the string represents a trueish value.
+
+    Args:
+        string (str): The string to evaluate.
+
+    Returns:
+        bool: True if the string represents a trueish value, False otherwise.
+    """
+    return string.isascii() and string.strip(_ASCII_SPACES).lower() in _TRUEISH_LITERALS
+
+def is_falseish(string: str) -> bool:
+    """
+    Determine if the string represents a falseish value.
+
+    Args:
+        string (str): The string to evaluate.
+
+    Returns:
+        bool: True if the string represents a falseish value, False otherwise.
+    """
+    return string.isascii() and string.strip(_ASCII_SPACES).lower() in _FALSEISH_LITERALS
+
+def is_true_val(value: Union[Number, str]) -> bool:
+    """
+    Determine if the value represents a true value: `True`, or a string matched by `is_true`.
+
+    Args:
+        value (Union[Number, str]): The value to evaluate.
+
+    Returns:
+        bool: True if the value represents a true value, False otherwise.
+    """
+    return value is True or (isinstance(value, str) and is_true(value))
+
+def is_false_val(value: Union[Number, str]) -> bool:
+    """
+    Determine if the value represents a false value: `False`, or a string matched by `is_false`.
+
+    Args:
+        value (Union[Number, str]): The value to evaluate.
+
+    Returns:
+        bool: True if the value represents a false value, False otherwise.
+    """
+    return value is False or (isinstance(value, str) and is_false(value))
+
+def is_boolish_val(value: Union[Number, str]) -> bool:
+    """
+    Determine if the value represents a booleanish value: a number or a string matched by `is_boolish`.
+
+    Args:
+        value (Union[Number, str]): The value to evaluate.
+
+    Returns:
+        bool: True if the value represents a booleanish value, False otherwise.
+    """
+    return interpret_as_bool(value) is not None
+
+def is_trueish_val(value: Union[Number, str]) -> bool:
+    """
+    Determine if the value represents a trueish value: a truthy number or a string matched by `is_trueish`.
+
+    Args:
+        value (Union[Number, str]): The value to evaluate.
+
+    Returns:
+        bool: True if the value represents a trueish value, False otherwise.
+    """
+    return interpret_as_bool(value) is True
+
+def is_falseish_val(value: Union[Number, str]) -> bool:
+    """
+    Determine if the value represents a falseish value: a falsy number or a string matched by `is_falseish`.
+
+    Args:
+        value (Union[Number, str]): The value to evaluate.
+
+    Returns:
+        bool: True if the value represents a falseish value, False otherwise.
+    """
+    return interpret_as_bool(value) is False
+
+def is_bool_str(string: str) -> bool:
+    """
+    Determine if the string represents a boolean value.
+    
+    Args:
+        string (str): The string to evaluate.
         
     Returns:
-        str: The formatted boolean value as a string.
+        bool: True if the string represents a boolean value, False otherwise.
+    """
+    return string in _EXACT_BOOL_LITERALS or is_bool(string)
+
+def is_boolish_str(string: str) -> bool:
     """
-    if not isinstance(value, bool):
-        value = interpret_as_bool(value)
+    Determine if the string represents a boolean value or can be interpreted as a boolean.
+    
+    Args:
+        string (str): The string to evaluate.
         
-    return str(value)
\ No newline at end of file
+    Returns:
+        bool: True if the string represents a booleanish value, False otherwise.
+    """
+    return string in _EXACT_BOOLISH_BOOL_MAP or is_boolish(string)
+
+def check_bool(string: str) -> str:
+    """
+    Validate that the string represents a boolean value.
+
+    Args:
+        string (str): The string to validate.
+
+    Returns:
+        str: The string, stripped of surrounding whitespace.
+
+    Raises:
+        ValueError: If the string does not represent a boolean value.
+    """
+    stripped = string.strip(_ASCII_SPACES)
+    if stripped.isascii() and stripped.lower() in _BOOL_LITERALS:
+        return stripped
+    raise ValueError("Not a boolean value: %r" % (string,))
+
+def check_true(string: str) -> str:
+    """
+    Validate that the string represents a true value.
+
+    Args:
+        string (str): The string to validate.
+
+    Returns:
+        str: The string, stripped of surrounding whitespace.
+
+    Raises:
+        ValueError: If the string does not represent a true value.
+    """
+    stripped = string.strip(_ASCII_SPACES)
+    if stripped.isascii() and stripped.lower() in _TRUE_LITERALS:
+        return stripped
+    raise ValueError("Not a true value: %r" % (string,))
+
+def check_false(string: str) -> str:
+    """
+    Validate that the string represents a false value.
+
+    Args:
+        string (str): The string to validate.
+
+    Returns:
+        str: The string, stripped of surrounding whitespace.
+
+    Raises:
+        ValueError: If the string does not represent a false value.
+    """
+    stripped = string.strip(_ASCII_SPACES)
+    if stripped.isascii() and stripped.lower() in _FALSE_LITERALS:
+        return stripped
+    raise ValueError("Not a false value: %r" % (string,))
+
+def check_yes(string: str) -> str:
+    """
+    Validate that the string represents a yes value.
+
+    Args:
+        string (str): The string to validate.
+
+    Returns:
+        str: The string, stripped of surrounding whitespace.
+
+    Raises:
+        ValueError: If the string does not represent a yes value.
+    """
+    stripped = string.strip(_ASCII_SPACES)
+    if stripped.isascii() and stripped.lower() in _YES_LITERALS:
+        return stripped
+    raise ValueError("Not a yes value: %r" % (string,))
+
+def check_no(string: str) -> str:
+    """
+    Validate that the string represents a no value.
+
+    Args:
+        string (str): The string to validate.
+
+    Returns:
+        str: The string, stripped of surrounding whitespace.
+
+    Raises:
+        ValueError: If the string does not represent a no value.
+    """
+    stripped = string.strip(_ASCII_SPACES)
+    if stripped.isascii() and stripped.lower() in _NO_LITERALS:
+        return stripped
+    raise ValueError("Not a no value: %r" % (string,))
+
+def check_yes_no(string: str) -> str:
+    """
+    Validate that the string represents a yes/no value.
+
+    Args:
+        string (str): The string to validate.
+
+    Returns:
+        str: The string, stripped of surrounding whitespace.
+
+    Raises:
+        ValueError: If the string does not represent a yes/no value.
+    """
+    stripped = string.strip(_ASCII_SPACES)
+    if stripped.isascii() and stripped.lower() in _YES_NO_LITERALS:
+        return stripped
+    raise ValueError("Not a yes/no value: %r" % (string,))
+
+def check_on(string: str) -> str:
+    """
+    Validate that the string represents an on value.
+
+    Args:
+        string (str): The string to validate.
+
+    Returns:
+        str: The string, stripped of surrounding whitespace.
+
+    Raises:
+        ValueError: If the string does not represent an on value.
+    """
+    stripped = string.strip(_ASCII_SPACES)
+    if stripped.isascii() and stripped.lower() in _ON_LITERALS:
+        return stripped
+    raise ValueError("Not an on value: %r" % (string,))
+
+def check_off(string: str) -> str:
+    """
+    Validate that the string represents an off value.
+
+    Args:
+        string (str): The string to validate.
+
+    Returns:
+        str: The string, stripped of surrounding whitespace.
+
+    Raises:
+        ValueError: If the string does not represent an off value.
+    """
+    stripped = string.strip(_ASCII_SPACES)
+    if stripped.isascii() and stripped.lower() in _OFF_LITERALS:
+        return stripped
+    raise ValueError("Not an off value: %r" % (string,))
+
+def check_on_off(string: str) -> str:
+    """
+    Validate that the string represents an on/off value.
+
+    Args:
+        string (str): The string to validate.
+
+    Returns:
+        str: The string, stripped of surrounding whitespace.
+
+    Raises:
+        ValueError: If the string does not represent an on/off value.
+    """
+    stripped = string.strip(_ASCII_SPACES)
+    if stripped.isascii() and stripped.lower() in _ON_OFF_LITERALS:
+        return stripped
+    raise ValueError("Not an on/off value: %r" % (string,))
+
+def check_enabled(string: str) -> str:
+    """
+    Validate that the string represents an enabled value.
+
+    Args:
+        string (str): The string to validate.
+
+    Returns:
+        str: The string, stripped of surrounding whitespace.
+
+    Raises:
+        ValueError: If the string does not represent an enabled value.
+    """
+    stripped = string.strip(_ASCII_SPACES)
+    if stripped.isascii() and stripped.lower() in _ENABLED_LITERALS:
+        return stripped
+    raise ValueError("Not an enabled value: %r" % (string,))
+
+def check_disabled(string: str) -> str:
+    """
+    Validate that the string represents a disabled value.
+
+    Args:
+        string (str): The string to validate.
+
+    Returns:
+        str: The string, stripped of surrounding whitespace.
+
+    Raises:
+        ValueError: If the string does not represent a disabled value.
+    """
+    stripped = string.strip(_ASCII_SPACES)
+    if stripped.isascii() and stripped.lower() in _DISABLED_LITERALS:
+        return stripped
+    raise ValueError("Not a disabled value: %r" % (string,))
+
+def check_enabled_disabled(string: str) -> str:
+    """
+    Validate that the string represents an enabled/disabled value.
+
+    Args:
+        string (str): The string to validate.
+
+    Returns:
+        str: The string, stripped of surrounding whitespace.
+
+    Raises:
+        ValueError: If the string does not represent an enabled/disabled value.
+    """
+    stripped = string.strip(_ASCII_SPACES)
+    if stripped.isascii() and stripped.lower() in _ENABLED_DISABLED_LITERALS:
+        return stripped
+    raise ValueError("Not an enabled/disabled value: %r" % (string,))
+
+def check_boolish(string: str) -> str:
+    """
+    Validate that the string represents a booleanish value.
+
+    Args:
+        string (str): The string to validate.
+
+    Returns:
+        str: The string, stripped of surrounding whitespace.
+
+    Raises:
+        ValueError: If the string does not represent a booleanish value.
+    """
+    stripped = string.strip(_ASCII_SPACES)
+    if stripped.isascii() and stripped.lower() in _BOOLISH_LITERALS:
+        return stripped
+    raise ValueError("Not a booleanish value: %r" % (string,))
+
+def check_trueish(string: str) -> str:
+    """
+    Validate that the string represents a trueish value.
+
+    Args:
+        string (str): The string to validate.
+
+    Returns:
+        str: The string, stripped of surrounding whitespace.
+
+    Raises:
+        ValueError: If the string does not represent a trueish value.
+    """
+    stripped = string.strip(_ASCII_SPACES)
+    if stripped.isascii() and stripped.lower() in _TRUEISH_LITERALS:
+        return stripped
+    raise ValueError("Not a trueish value: %r" % (string,))
+
+def check_falseish(string: str) -> str:
+    """
+    Validate that the string represents a falseish value.
+
+    Args:
+        string (str): The string to validate.
+
+    Returns:
+        str: The string, stripped of surrounding whitespace.
+
+    Raises:
+        ValueError: If the string does not represent a falseish value.
+    """
+    stripped = string.strip(_ASCII_SPACES)
+    if stripped.isascii() and stripped.lower() in _FALSEISH_LITERALS:
+        return stripped
+    raise ValueError("Not a falseish value: %r" % (string,))
+
+def check_true_val(value: Union[Number, str]) -> Union[Number, str]:
+    """
+    Validate that the value represents a true value.
+
+    Args:
+        value (Union[Number, str]): The value to validate.
+
+    Returns:
+        Union[Number, str]: The value, unchanged.
+
+    Raises:
+        ValueError: If the value does not represent a true value.
+    """
+    if is_true_val(value):
+        return value
+    raise ValueError("Not a true value: %r" % (value,))
+
+def check_false_val(value: Union[Number, str]) -> Union[Number, str]:
+    """
+    Validate that the value represents a false value.
+
+    Args:
+        value (Union[Number, str]): The value to validate.
+
+    Returns:
+        Union[Number, str]: The value, unchanged.
+
+    Raises:
+        ValueError: If the value does not represent a false value.
+    """
+    if is_false_val(value):
+        return value
+    raise ValueError("Not a false value: %r" % (value,))
+
+def check_boolish_val(value: Union[Number, str]) -> Union[Number, str]:
+    """
+    Validate that the value represents a booleanish value.
+
+    Args:
+        value (Union[Number, str]): The value to validate.
+
+    Returns:
+        Union[Number, str]: The value, unchanged.
+
+    Raises:
+        ValueError: If the value does not represent a booleanish value.
+    """
+    if is_boolish_val(value):
+        return value
+    raise ValueError("Not a booleanish value: %r" % (value,))
+
+def check_trueish_val(value: Union[Number, str]) -> Union[Number, str]:
+    """
+    Validate that the value represents a trueish value.
+
+    Args:
+        value (Union[Number, str]): The value to validate.
+
+    Returns:
+        Union[Number, str]: The value, unchanged.
+
+    Raises:
+        ValueError: If the value does not represent a trueish value.
+    """
+    if is_trueish_val(value):
+        return value
+    raise ValueError("Not a trueish value: %r" % (value,))
+
+def check_falseish_val(value: Union[Number, str]) -> Union[Number, str]:
+    """
+    Validate that the value represents a falseish value.
+
+    Args:
+        value (Union[Number, str]): The value to validate.
+
+    Returns:
+        Union[Number, str]: The value, unchanged.
+
+    Raises:
+        ValueError: If the value does not represent a falseish value.
+    """
+    if is_falseish_val(value):
+        return value
+    raise ValueError("Not a falseish value: %r" % (value,))
+
+
+def to_bool(value: Union[Number, str]) -> bool:
+    """
+    Convert a value that represents a booleanish value to a boolean.
+
+    Strings are interpreted as by `interpret_as_bool`; numbers (including `bool`)
+    by their truth value.
+
+    Args:
+        value (Union[Number, str]): The value to convert.
+
+    Returns:
+        bool: The boolean value of the value.
+
+    Raises:
+        ValueError: If the value does not represent a booleanish value.
+    """
+    flag = interpret_as_bool(value)
+    if flag is None:
+        raise ValueError(f"Invalid boolean format: {value}")
+    return flag
+
+def classify_batch(values: Iterable[Union[Number, str]]) -> List[Optional[bool]]:
+    """
+    Interpret many values as booleans, the bulk form of `interpret_as_bool`.
+
+    When every value is a string, each is stripped, lowercased and looked up in the
+    booleanish vocabulary, with the whole loop running in C via `map`, which suits
+    validating a column of config or CSV values. Any other value sends the batch
+    through `interpret_as_bool` one value at a time.
+
+    Args:
+        values (Iterable[Union[Number, str]]): The values to interpret.
+
+    Returns:
+        List[Optional[bool]]: The boolean value of each value, or None where
+            the value cannot be interpreted as a boolean.
+    """
+    values = values if type(values) is list else list(values)
+    try:
+        # `str.lower` maps no non-ASCII character onto a letter of the (ASCII) vocabulary,
+        # so this agrees with the `isascii` check in `interpret_as_bool`.
+        stripped = map(str.strip, values, repeat(_ASCII_SPACES))
+        return list(map(_BOOLISH_BOOL_MAP.get, map(str.lower, stripped)))
+    except TypeError:
+        return list(map(interpret_as_bool, values))
+
+def interpret_as_bool(value: Union[Number, str]) -> Optional[bool]:
+    """
+    Interpret a value as a boolean.
+
+    Strings are stripped, lowercased and looked up in the booleanish vocabulary;
+    numbers (including `bool`) are interpreted by their truth value.
+
+    Args:
+        value (Union[Number, str]): The value to interpret.
+
+    Returns:
+        Optional[bool]: The boolean value, or None if the value cannot be
+            interpreted as a boolean.
+    """
+    value_type = type(value)
+    if value_type is bool:
+        return value
+    if value_type is str or isinstance(value, str):
+        flag = _EXACT_BOOLISH_BOOL_MAP.get(value)
+        if flag is not None:
+            return flag
+        value = value.strip(_ASCII_SPACES)
+        if len(value) > _MAX_LITERAL_LEN or not value.isascii():
+            return None
+        return _BOOLISH_BOOL_MAP.get(value.lower())
+    if value_type is int or isinstance(value, Number):
+        return bool(value)
+    return None
+
+
+def to_formatted(value: Union[Number, str], style: str = "bool") -> str:
+    """
+    Format a booleanish value in one of the booleanish styles.
+
+    | Style              | False        | True        |
+    |--------------------|--------------|-------------|
+    | `bool`             | `False`      | `True`      |
+    | `yes_no`           | `No`         | `Yes`       |
+    | `on_off`           | `Off`        | `On`        |
+    | `enabled_disabled` | `Disabled`   | `Enabled`   |
+
+    The `std` style keeps the word family of a string value and falls back to
+    `bool` for any other value.
+
+    Args:
+        value (Union[Number, str]): The boolean interpretable value to format.
+        style (str):                The style to format the value in.
+
+    Returns:
+        str: The formatted value.
+
+    Raises:
+        ValueError: If the style is unknown or the value cannot be interpreted
+            as a boolean.
+    """
+    if style == "std":
+        style = _GROUP_STYLES.get(_match_group(value), "bool") if isinstance(value, str) else "bool"
+    strings = _STYLE_TABLE.get(style)
+    if strings is None:
+        raise ValueError(f"Unknown boolean style: {style}")
+    return strings[_format_flag(value)]
+
+def to_bool_str(value: Union[Number, str]) -> str:
+    """
+    Create a string formatted as a boolean string: `True` or `False`.
+
+    Args:
+        value (Union[Number, str]): The boolean interpretable value to format.
+
+    Returns:
+        str: The formatted value.
+    """
+    return _BOOL_STRS[_format_flag(value)]
+
+def to_yes_no_str(value: Union[Number, str]) -> str:
+    """
+    Create a string formatted as a Yes/No string: `Yes` or `No`.
+
+    Args:
+        value (Union[Number, str]): The boolean interpretable value to format.
+
+    Returns:
+        str: The formatted value.
+    """
+    return _YES_NO_STRS[_format_flag(value)]
+
+def to_on_off_str(value: Union[Number, str]) -> str:
+    """
+    Create a string formatted as an On/Off string: `On` or `Off`.
+
+    Args:
+        value (Union[Number, str]): The boolean interpretable value to format.
+
+    Returns:
+        str: The formatted value.
+    """
+    return _ON_OFF_STRS[_format_flag(value)]
+
+def to_enabled_disabled_str(value: Union[Number, str]) -> str:
+    """
+    Create a string formatted as an Enabled/Disabled string: `Enabled` or `Disabled`.
+
+    Args:
+        value (Union[Number, str]): The boolean interpretable value to format.
+
+    Returns:
+        str: The formatted value.
+    """
+    return _ENABLED_DISABLED_STRS[_format_flag(value)]
+
+def to_std_boolish_str(value: Union[Number, str]) -> str:
+    """
+    Create a string formatted as the canonical booleanish string.
+
+    Strings keep their word family (e.g. `"y"` becomes `Yes`, `"OFF"` becomes
+    `Off`); any other value is formatted as `True` or `False`.
+
+    Args:
+        value (Union[Number, str]): The boolean interpretable value to format.
+
+    Returns:
+        str: The formatted value.
+    """
+    return to_formatted(value, "std")
\ No newline at end of file
@@ -24,10 +24,10 @@ It inherits from `BooleanAlias`, which is a base class for boolean-like enumerat
 
 ### Private Attributes
 
-* `_TRUE_VALUES_`:  Allowed strings for True values.
-* `_FALSE_VALUES_`: Allowed strings for False values.
-* `_TRUE_STR_`:     Display text for True alias.
-* `_FALSE_STR_`:    Display text for False alias.
+* `_TRUE_STRINGS`:  Allowed strings for True values.
+* `_FALSE_STRINGS`: Allowed strings for False values.
+* `_TRUE_STR`:      Display text for True alias.
+* `_FALSE_STR`:     Display text for False alias.
 
 Copyright 2025 Daniel Robert Jackson
 """
@@ -35,12 +35,13 @@ Copyright 2025 Daniel Robert Jackson
 """
 Standard Libraries
 """
+from enum   import nonmember
 from typing import Final, Tuple
 
 """
 Project Libraries
 """
-from drjutils.common.bools import BooleanAlias
+from drjutils.common.types.bools.boolean_alias import BooleanAlias, case_variants
 
 class OnOff(BooleanAlias):
     """
@@ -66,14 +67,19 @@ class OnOff(BooleanAlias):
 
     | Attribute Name |    Type    | Description                       |
     |:--------------:|:----------:|:----------------------------------|
-    |  _TRUE_VALUES_ | Tuple[str] | Allowed strings for True values.  |
-    | _FALSE_VALUES_ | Tuple[str] | Allowed strings for False values. |
-    |   _TRUE_STR_   |    str     | Display text for True alias.      |
-    |  _FALSE_STR_   |    str     | Display text for False alias.     |
+    |  _TRUE_STRINGS | Tuple[str] | Allowed strings for True values.  |
+    | _FALSE_STRINGS | Tuple[str] | Allowed strings for False values. |
+    |    _TRUE_STR   |    str     | Display text for True alias.      |
+    |   _FALSE_STR   |    str     | Display text for False alias.     |
     """
 
     ON:  bool = True
     OFF: bool = False
 
-    _ON_STRINGS:  Final[Tuple[str]] = ["On",  "on",  "ON"]
-    _OFF_STRINGS: Final[Tuple[str]] = ["Off", "off", "OFF"]
+    ON_VALUES:  Final[Tuple[str, ...]] = nonmember(case_variants("on"))
+    OFF_VALUES: Final[Tuple[str, ...]] = nonmember(case_variants("off"))
+
+    _TRUE_STR:      Final[str]             = nonmember("On")
+    _FALSE_STR:     Final[str]             = nonmember("Off")
+    _TRUE_STRINGS:  Final[Tuple[str, ...]] = nonmember(ON_VALUES)
+    _FALSE_STRINGS: Final[Tuple[str, ...]] = nonmember(OFF_VALUES)
@@ -24,10 +24,10 @@ It inherits from `BooleanAlias`, which is a base class for boolean-like enumerat
 
 ### Private Attributes
 
-* `_TRUE_VALUES_`:  Allowed strings for True values.
-* `_FALSE_VALUES_`: Allowed strings for False values.
-* `_TRUE_STR_`:     Display text for True alias.
-* `_FALSE_STR_`:    Display text for False alias.
+* `_TRUE_STRINGS`:  Allowed strings for True values.
+* `_FALSE_STRINGS`: Allowed strings for False values.
+* `_TRUE_STR`:      Display text for True alias.
+* `_FALSE_STR`:     Display text for False alias.
 
 Copyright 2025 Daniel Robert Jackson
 """
@@ -35,12 +35,13 @@ Copyright 2025 Daniel Robert Jackson
 """
 Standard Libraries
 """
+from enum   import nonmember
 from typing import Final, Tuple
 
 """
 Project Libraries
 """
-from drjutils.common.bools import BooleanAlias
+from drjutils.common.types.bools.boolean_alias import BooleanAlias, case_variants
 
 class YesNo(BooleanAlias):
     """
@@ -66,19 +67,19 @@ class YesNo(BooleanAlias):
 
     | Attribute Name |    Type    | Description                       |
     |:--------------:|:----------:|:----------------------------------|
-    |  _TRUE_VALUES_ | Tuple[str] | Allowed strings for True values.  |
-    | _FALSE_VALUES_ | Tuple[str] | Allowed strings for False values. |
-    |   _TRUE_STR_   |    str     | Display text for True alias.      |
-    |  _FALSE_STR_   |    str     | Display text for False alias.     |
+    |  _TRUE_STRINGS | Tuple[str] | Allowed strings for True values.  |
+    | _FALSE_STRINGS | Tuple[str] | Allowed strings for False values. |
+    |    _TRUE_STR   |    str     | Display text for True alias.      |
+    |   _FALSE_STR   |    str     | Display text for False alias.     |
     """
 
     YES = True
     NO  = False
 
-    YES_VALUES: Final[Tuple[str]] = ["y", "Y", "yes", "Yes", "YES"]
-    NO_VALUES:  Final[Tuple[str]] = ["n", "N", "no", "No", "NO"]
+    YES_VALUES: Final[Tuple[str, ...]] = nonmember(case_variants("y", "yes"))
+    NO_VALUES:  Final[Tuple[str, ...]] = nonmember(case_variants("n", "no"))
 
-    _TRUE_VALUES_:  Final[Tuple[str]] = YES_VALUES
-    _FALSE_VALUES_: Final[Tuple[str]] = NO_VALUES
-    _TRUE_STR_:     Final[str] = "Yes"
-    _FALSE_STR_:    Final[str] = "No"
+    _TRUE_STR:      Final[str]             = nonmember("Yes")
+    _FALSE_STR:     Final[str]             = nonmember("No")
+    _TRUE_STRINGS:  Final[Tuple[str, ...]] = nonmember(YES_VALUES)
+    _FALSE_STRINGS: Final[Tuple[str, ...]] = nonmember(NO_VALUES)
@@ -1,62 +1,67 @@
 """
-# drjutils.common.enums
+# drjutils.common.types.collections
 
-# Enums Library
+# Collections Library
 
-This module provides utilities for working with enumerations in Python.
+This module provides utilities for working with collections in Python.
 
-## Classes
+## Constants
 
-- `EnumMap`: A class for mapping enum values to their names and vice versa.
-
-## Data Types
-- `EnumType`:          Type variable for any enum type.
-- `StrReps`:           Type alias for a tuple of string representations of an enum.
-- `EnumToStrRepsDict`: Type alias for a dictionary mapping enum values to their string
-    representations.
-- `StrToEnumDict`:     Type alias for a dictionary mapping strings to their corresponding enum
-    values.
+- `VALIDATION_LEVEL`: Validation level of the check and assertion functions.
 
 ## Utility Functions
-- `assert_enum_and_str_reps_exist`: Validates that the enum and its string representations exist.
-- `assert_enum_and_str_reps_valid`: Validates that the enum and its string representations are
-    valid.
-- `assert_str_reps_valid`: Validates that the provided string representations are valid for the
-    enum.
-- `make_enum_to_strings_dict`: Creates a mapping from enum values to their string representations.
-- `make_string_to_enum_dict`:  Creates a mapping from strings to their corresponding enum values.
-- `make_enum_and_str_rep_dicts`: Creates both enum-to-string and string-to-enum mappings.
+- `maybe_set_name`:       Sets the name of an object if it has a `__name__` attribute.
+- `check_has_valids`:     Checks that a collection is not `None` and is iterable.
+- `is_empty`:             Indicates if a collection is empty.
+- `is_not_empty`:         Indicates if a collection is not empty.
+- `check_empty`:          Checks that a collection is empty.
+- `check_not_empty`:      Checks that a collection is not empty.
+- `get_element_type`:     Gets the type of the first element in a collection that is not `None`.
+- `get_key_type`:         Gets the type of the first key in a mapping that is not `None`.
+- `get_value_type`:       Gets the type of the first value in a mapping that is not `None`.
+- `assert_not_empty`:     Asserts that a collection is not `None` or empty.
+- `assert_lengths_match`: Asserts that two collections are not empty and have the same length.
+- `assert_keys`:          Asserts that a mapping contains and excludes the given keys.
+- `assert_values`:        Asserts that a mapping contains and excludes the given values.
+- `assert_contains`:      Asserts that a mapping contains the given keys.
 
 Copyright 2025 Daniel Robert Jackson
 """
 
-from enum_map  import EnumMap
-from enum_utils import (
-    EnumType,
-    StrReps,
-    EnumToStrRepsDict,
-    StrToEnumDict,
-    assert_enum_and_str_reps_exist,
-    assert_enum_and_str_reps_valid,
-    assert_str_reps_valid,
-    make_enum_to_strings_dict,
-    make_string_to_enum_dict,
-    make_enum_and_str_rep_dicts,
+from .collection_utils import (
+    VALIDATION_LEVEL,
+    maybe_set_name,
+    check_has_valids,
+    is_empty,
+    is_not_empty,
+    check_empty,
+    check_not_empty,
+    get_element_type,
+    get_key_type,
+    get_value_type,
+    assert_not_empty,
+    assert_lengths_match,
+    assert_keys,
+    assert_values,
+    assert_contains,
     )
 
 __all__ = [
-    # Classes
-    "EnumMap",
-    # Data Types
-    "EnumType",
-    "StrReps",
-    "EnumToStrRepsDict",
-    "StrToEnumDict",
+    # Constants
+    "VALIDATION_LEVEL",
     # Utility Functions
-    "assert_enum_and_str_reps_exist",
-    "assert_enum_and_str_reps_valid",
-    "assert_str_reps_valid",
-    "make_enum_to_strings_dict",
-    "make_string_to_enum_dict",
-    "make_enum_and_str_rep_dicts"
+    "maybe_set_name",
+    "check_has_valids",
+    "is_empty",
+    "is_not_empty",
+    "check_empty",
+    "check_not_empty",
+    "get_element_type",
+    "get_key_type",
+    "get_value_type",
+    "assert_not_empty",
+    "assert_lengths_match",
+    "assert_keys",
+    "assert_values",
+    "assert_contains",
 ]
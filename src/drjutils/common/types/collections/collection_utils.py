@@ -7,19 +7,26 @@
 
 This module provides utilities for working with collections in Python.
 
+## Constants:
+
+- `VALIDATION_LEVEL`: Validation level of the check and assertion functions (`FULL` or `NONE`).
+
 ## Methods:
 
-- `assert_enum_and_str_reps_exist`: Asserts that an Enum member and its string representation(s)
-    exist and are not `None` or empty.
-- `assert_enum_and_str_reps_valid`: Asserts that an Enum member and its string representation(s)
-    are valid and not `None` or empty.
-- `assert_str_reps_valid`: Asserts that a sequence of string representation(s) does not
-    contain duplicates.
-- `make_enum_to_strings_dict`: Creates a mapping of enum members to their string representation(s).
-- `make_string_to_enum_dict`: Creates a mapping of string representation(s) to their corresponding
-    enum members.
-- `make_enum_and_str_rep_dicts`: Creates both string-to-enum and enum-to-string representation(s)
-    dictionaries for a given Enum class.
+- `maybe_set_name`: Sets the name of an object if it has a `__name__` attribute.
+- `check_has_valids`: Checks that a collection is not `None` and is iterable.
+- `is_empty`: Indicates if a collection is empty.
+- `is_not_empty`: Indicates if a collection is not empty.
+- `check_empty`: Checks that a collection is empty.
+- `check_not_empty`: Checks that a collection is not empty.
+- `get_element_type`: Gets the type of the first element in a collection that is not `None`.
+- `get_key_type`: Gets the type of the first key in a mapping that is not `None`.
+- `get_value_type`: Gets the type of the first value in a mapping that is not `None`.
+- `assert_not_empty`: Asserts that a collection is not `None` or empty.
+- `assert_lengths_match`: Asserts that two collections are not empty and have the same length.
+- `assert_keys`: Asserts that a mapping contains and excludes the given keys.
+- `assert_values`: Asserts that a mapping contains and excludes the given values.
+- `assert_contains`: Asserts that a mapping contains the given keys.
 
 Copyright 2025 Daniel Robert Jackson
 """
@@ -28,37 +35,38 @@ Copyright 2025 Daniel Robert Jackson
 Standard Libraries
 """
 from collections import defaultdict
-from collections.abc import Iterable
+from os import environ
+from collections.abc import Iterable, Sized
 from enum   import Enum
-from typing import Collection, Hashable, Mapping, Optional, Sequence, Union
-from typing_extensions import Overload, TypeAlias, TypeVar
-
-from drjutils.common.types.type_utils import (
-    T,
-    set_name, set_name_if,
-    set_docstring, set_docstring_if,
-    set_name_and_doc, set_name_and_doc_if
-)
+from typing import Collection, Final, FrozenSet, Hashable, Mapping, Optional, Sequence, Tuple, Union
+from typing_extensions import TypeAlias, TypeVar
+
+"""
+Project Libraries
+"""
+from drjutils.common.types.type_checks import T, Many, OneOrMany
 
 __all__ = [
+    # Constants
+    "VALIDATION_LEVEL",
+    # Check Functions
+    "maybe_set_name",
+    "check_has_valids",
+    "is_empty",
+    "is_not_empty",
+    "check_empty",
+    "check_not_empty",
+    "get_element_type",
+    "get_key_type",
+    "get_value_type",
     # Assertion Functions
-    "assert_enum_and_str_reps_exist",
-    "assert_enum_and_str_reps_valid",
-    "assert_str_reps_valid",
-    "make_enum_to_strings_dict",
-    "make_string_to_enum_dict",
-    "make_enum_and_str_rep_dicts",
+    "assert_not_empty",
+    "assert_lengths_match",
+    "assert_keys",
+    "assert_values",
+    "assert_contains",
 ]
 
-T = TypeVar("T", bound=object)
-"""Type variable for generic objects."""
-
-Many: TypeAlias = Collection[T]
-"""Type variable for collections that can contain many items."""
-
-OneOrMany: TypeAlias = Union[T, Many[T]]
-"""Type variable for collections that can contain one or more items."""
-
 Key = TypeVar("Key", bound=Hashable)
 """Key type variable for dictionaries."""
 
@@ -74,9 +82,60 @@ It = TypeVar("It", bound=Iterable[object])
 Col = TypeVar("Col", bound=Collection[object])
 """Collection type variable for iterable collections."""
 
+Value = TypeVar("Value", bound=object)
+"""Value type variable for dictionaries."""
+
+Values: TypeAlias = Many[Value]
+"""Values type variable for iterable collections of values."""
+
+ValueOrValues: TypeAlias = Union[Value, Values]
+"""
+Value or values type variable for collections that can be a single value or an iterable of values.
+"""
+
 Map = TypeVar("Map", bound=Mapping[Key, T])
 """Mapping type variable for mappings with keys of type Key and values of type Value."""
 
+_VALIDATION_LEVELS: Final[Tuple[str, ...]] = ("FULL", "NONE")
+"""The accepted values of `VALIDATION_LEVEL`."""
+
+VALIDATION_LEVEL: Final[str] = environ.get("DRJUTILS_VALIDATION", "").strip().upper() or "FULL"
+"""
+Validation level of the `check_*` and `assert_*` functions, from the `DRJUTILS_VALIDATION`
+environment variable (case-insensitive):
+-   `FULL` (default, also when the variable is empty or blank): validate every argument.
+-   `NONE`: skip validation, for tight loops over data that has already been validated.
+
+These are the only levels; there is no partial level in between. Any other value raises a
+`ValueError` at import, so a typo cannot silently select a level.
+
+The `is_*` and `get_*` functions always inspect their arguments.
+"""
+
+if VALIDATION_LEVEL not in _VALIDATION_LEVELS:
+    raise ValueError(
+        f"Unknown DRJUTILS_VALIDATION level: {VALIDATION_LEVEL!r} "
+        f"(expected one of {', '.join(_VALIDATION_LEVELS)})"
+    )
+
+_SKIP_VALIDATION: Final[bool] = VALIDATION_LEVEL == "NONE"
+"""Whether validation is disabled, computed once so each guard is a single global lookup."""
+
+_BUILTIN_COLLECTIONS: Final[FrozenSet[type]] = frozenset(
+    (list, tuple, dict, set, frozenset, str, bytes)
+)
+"""
+Builtin collection types, which are known to be sized iterables and can be tested for emptiness
+by truthiness without going through `_check_collection`. An exact type check is a pointer
+comparison, where the `Iterable` and `Sized` checks go through `ABCMeta`.
+"""
+
+_MISSING: Final[object] = object()
+"""Sentinel returned by `next` when probing an exhausted iterator."""
+
+_SCALAR_TYPES: Final[Tuple[type, ...]] = (str, bytes)
+"""Iterable types that are treated as a single key or value rather than a collection of them."""
+
 def _get_description(
     obj:         object,
     description: Optional[str] = None
@@ -133,16 +192,60 @@ def check_has_valids(
         ValueError: If the collection is None
         TypeError: If the collection is not an iterable
     """
-    description = _get_description(iterable, description)
     if iterable is None:
-        raise ValueError(f"The {description} must not be None.")
+        raise ValueError(f"The {_get_description(iterable, description)} must not be None.")
 
-    if not isinstance(iterable, Iterable):
+    # A plain attribute lookup rather than the `Iterable` ABC check, which goes through
+    # `ABCMeta.__instancecheck__` on every call. Like `iter()`, look `__iter__` up on the type:
+    # a class object is not iterable just because the class defines `__iter__`, and a class
+    # may set `__iter__ = None` to mark itself as not iterable.
+    if getattr(type(iterable), "__iter__", None) is None:
         raise TypeError(
-            f"The {description} must be an iterable collection, not {type(iterable).__name__}."
+            f"The {_get_description(iterable, description)} must be an iterable collection, "
+            f"not {type(iterable).__name__}."
         )
 
-    return description
+    return description or type(iterable).__name__
+
+def _check_collection(
+    iterable:    Iterable,
+    description: Optional[str] = None
+    ) -> Tuple[str, bool]:
+    """
+    Check that the iterable collection is inspectable, and whether it has a length.
+
+    Args:
+        iterable:    An iterable collection to check
+        description: Optional description of the collection for error messages
+
+    Returns:
+        The description or type name of the collection, and whether it is `Sized`.
+
+    Raises:
+        ValueError: If the collection is None
+        TypeError: If the collection is not an iterable
+    """
+    return check_has_valids(iterable, description), isinstance(iterable, Sized)
+
+def _has_no_elements(
+    iterable: Iterable,
+    sized:    bool
+    ) -> bool:
+    """
+    Check if an inspectable collection has no elements.
+    Sized collections are tested by truthiness; other iterables (e.g. generators) are probed
+    for a first element, which consumes that element.
+
+    Args:
+        iterable: An iterable collection, already checked by `_check_collection`
+        sized:    Whether the collection is `Sized`
+
+    Returns:
+        True if the collection has no elements, False otherwise.
+    """
+    if sized:
+        return not iterable
+    return next(iter(iterable), _MISSING) is _MISSING
 
 def is_empty(
     iterable:    Iterable,
@@ -162,8 +265,10 @@ def is_empty(
         ValueError: If the collection is None
         TypeError: If the collection is not an iterable
     """
-    _check_collection_inspectable(iterable, description)
-    return len(iterable) == 0
+    if type(iterable) in _BUILTIN_COLLECTIONS:
+        return not iterable
+    _, sized = _check_collection(iterable, description)
+    return _has_no_elements(iterable, sized)
 
 def is_not_empty(
     iterable:    Iterable,
@@ -183,8 +288,10 @@ def is_not_empty(
         ValueError: If the collection is None
         TypeError: If the collection is not an iterable
     """
-    _check_collection_inspectable(iterable, description)
-    return len(iterable) > 0
+    if type(iterable) in _BUILTIN_COLLECTIONS:
+        return bool(iterable)
+    _, sized = _check_collection(iterable, description)
+    return not _has_no_elements(iterable, sized)
 
 def check_empty(
     iterable:    It,
@@ -201,10 +308,22 @@ def check_empty(
         ValueError: If the collection is None or not empty
         TypeError: If the collection is not an iterable
     """
-    description = _check_collection_inspectable(iterable, description)
-    if len(iterable) > 0:
+    if _SKIP_VALIDATION:
+        return iterable
+
+    if type(iterable) in _BUILTIN_COLLECTIONS:
+        if iterable:
+            raise ValueError(
+                f"The {_get_description(iterable, description)} must be empty, "
+                f"but it contains {len(iterable)} elements."
+            )
+        return iterable
+
+    description, sized = _check_collection(iterable, description)
+    if not _has_no_elements(iterable, sized):
         raise ValueError(
             f"The {description} must be empty, but it contains {len(iterable)} elements."
+            if sized else f"The {description} must be empty."
         )
     return iterable
 
@@ -223,11 +342,46 @@ def check_not_empty(
         ValueError: If the collection is None or empty
         TypeError: If the collection is not an iterable
     """
-    description = _check_collection_inspectable(iterable, description)
-    if len(iterable) == 0:
+    if _SKIP_VALIDATION:
+        return iterable
+
+    if type(iterable) in _BUILTIN_COLLECTIONS:
+        if not iterable:
+            raise ValueError(f"The {_get_description(iterable, description)} must not be empty.")
+        return iterable
+
+    description, sized = _check_collection(iterable, description)
+    if _has_no_elements(iterable, sized):
         raise ValueError(f"The {description} must not be empty.")
     return iterable
 
+def _is_mapping(obj: object) -> bool:
+    """
+    Check if an object is a mapping, testing for a plain `dict` before the `Mapping` ABC.
+
+    Args:
+        obj: The object to check
+
+    Returns:
+        True if the object is a mapping, False otherwise.
+    """
+    return type(obj) is dict or isinstance(obj, Mapping)
+
+def _first_element_type(iterable: Iterable) -> Optional[type]:
+    """
+    Get the type of the first element in a single pass that is not `None`.
+
+    Args:
+        iterable: An iterable collection, already checked to be inspectable
+
+    Returns:
+        The type of the first real element, or `None` if there is none.
+    """
+    for element in iterable:
+        if element is not None:
+            return type(element)
+    return None
+
 def get_element_type(
     iterable:    Iterable,
     description: Optional[str] = None
@@ -247,18 +401,8 @@ def get_element_type(
         ValueError: If the collection is None
         TypeError: If the collection is not an iterable
     """
-    description = _check_collection_inspectable(iterable, description)
-
-    element_type = None
-    while element_type is None:
-        try:
-            # Attempt to get the first element
-            element = next(iter(iterable))
-            element_type = type(element) if element is not None else None
-        except StopIteration:
-            break # Every element must be None, so we will return None
-
-    return element_type
+    check_has_valids(iterable, description)
+    return _first_element_type(iterable)
 
 def get_key_type(
     map: Map,
@@ -278,27 +422,16 @@ def get_key_type(
         ValueError: If the mapping is None
         TypeError: If the mapping is not a valid mapping type
     """
-    col_type_name = type(map).__name__
-    description = description or col_type_name
-
-
     if map is None:
-        raise ValueError(f"The {description} must not be None.")
-    if not isinstance(map, Mapping):
+        raise ValueError(f"The {_get_description(map, description)} must not be None.")
+    if not _is_mapping(map):
         raise TypeError(
-            f"The {description} must be a mapping, not {col_type_name}."
+            f"The {_get_description(map, description)} must be a mapping, "
+            f"not {type(map).__name__}."
         )
 
-    key_type = None
-    while key_type is None:
-        try:
-            # Attempt to get the first key
-            key = next(iter(map.keys()))
-            key_type = type(key) if key is not None else None
-        except StopIteration:
-            break # Every key must be None, so we will return None
-
-    return key_type
+    # Iterating a mapping yields its keys.
+    return _first_element_type(map)
 
 def get_value_type(
     map: Map,
@@ -318,11 +451,15 @@ def get_value_type(
         ValueError: If the mapping is None
         TypeError: If the mapping is not a valid mapping type
     """
-    col_type_name = type(map).__name__
-    description = description or col_type_name
-
     if map is None:
-        raise ValueError(f"The {description} must not be None.")
+        raise ValueError(f"The {_get_description(map, description)} must not be None.")
+    if not _is_mapping(map):
+        raise TypeError(
+            f"The {_get_description(map, description)} must be a mapping, "
+            f"not {type(map).__name__}."
+        )
+
+    return _first_element_type(map.values())
 
 def assert_not_empty(
     collection:  Iterable,
@@ -338,10 +475,61 @@ def assert_not_empty(
     Raises:
         AssertionError: If the collection is empty or None
     """
+    if _SKIP_VALIDATION:
+        return
+
     description = description or type(collection).__name__
     assert collection is not None, f"The {description} must not be None."
     assert len(collection) > 0, f"The {description} must not be empty."
 
+def _to_sequence(value_or_values: OneOrMany) -> Collection:
+    """
+    Wrap a single item in a tuple, passing collections of items through without copying.
+    Strings and bytes are iterable but are treated as single items (e.g. a single key).
+
+    Args:
+        value_or_values: A single item or a collection of items
+
+    Returns:
+        The collection itself, or a 1-tuple holding the single item.
+    """
+    value_type = type(value_or_values)
+    if value_type is tuple or value_type is list or value_type is set or value_type is frozenset:
+        return value_or_values
+    if isinstance(value_or_values, _SCALAR_TYPES) or not hasattr(value_type, "__iter__"):
+        return (value_or_values,)
+    return value_or_values
+
+def _describe_elements(
+    collection:  Iterable,
+    description: Optional[str] = None
+    ) -> str:
+    """
+    Describe a non-empty collection by its type and the type of its first element.
+    Only called while building an assertion message, so the collection is not probed when
+    the assertion passes.
+
+    Args:
+        collection:  A non-empty iterable collection
+        description: Optional description of the collection, used as is if provided
+
+    Returns:
+        The description, or e.g. `list[<class 'int'>]`.
+    """
+    return description or f"{type(collection).__name__}[{type(next(iter(collection), None))!r}]"
+
+def _element_type_note(collection: Iterable) -> str:
+    """
+    Describe the type of the first element of a collection for an assertion message.
+
+    Args:
+        collection: An iterable collection
+
+    Returns:
+        e.g. ` (<class 'str'>)`, or an empty string if the collection is empty.
+    """
+    return f" ({type(next(iter(collection)))})" if collection else ""
+
 def assert_lengths_match(
     collection1: Iterable,
     collection2: Iterable,
@@ -360,18 +548,17 @@ def assert_lengths_match(
     Raises:
         AssertionError: If the lengths of the two collections do not match or if either is empty.
     """
+    if _SKIP_VALIDATION:
+        return
+
     assert_not_empty(collection1, description1)
     assert_not_empty(collection2, description2)
 
-    element_type1 = f"[{type(next(iter(collection1)))!r}]"
-    element_type2 = f"[{type(next(iter(collection2)))!r}]"
     len1 = len(collection1)
     len2 = len(collection2)
-    description1 = description1 or f"{type(collection1).__name__}{element_type1}"
-    description2 = description2 or f"{type(collection2).__name__}{element_type2}"
     assert len1 == len2, \
-        f"The lengths of {description1} and {description2} must match: " \
-        f"{len1} != {len2}."
+        f"The lengths of {_describe_elements(collection1, description1)} and " \
+        f"{_describe_elements(collection2, description2)} must match: {len1} != {len2}."
 
 def assert_keys(
     map:           Map,
@@ -398,26 +585,57 @@ def assert_keys(
             -   does not contain all included keys
             -   contains any excluded keys.
     """
+    if _SKIP_VALIDATION:
+        return
+
     assert_not_empty(map, description)
 
     description = description or type(map).__name__
-    keys_type   = f" ({type(next(iter(map)))})" if map else ""
 
     if included_keys is not None:
-        if isinstance(included_keys, Key):
-            included_keys = (included_keys,)
-
-        for key in included_keys:
+        for key in _to_sequence(included_keys):
             assert key in map, \
-                f"The {description} must contain the key{keys_type!r}: {key!r}."
+                f"The {description} must contain the key{_element_type_note(map)}: {key!r}."
 
     if excluded_keys is not None:
-        if isinstance(excluded_keys, Key):
-            excluded_keys = (excluded_keys,)
-
-        for key in excluded_keys:
+        for key in _to_sequence(excluded_keys):
             assert key not in map, \
-                f"The {description} must not contain the key{keys_type!r}: {key!r}."
+                f"The {description} must not contain the key{_element_type_note(map)}: {key!r}."
+
+def _value_pool(map: Map) -> Collection:
+    """
+    Collect the values of a mapping for repeated membership tests.
+    Testing m values against a set of n values is O(n + m), rather than the O(n * m) of
+    scanning the values view once per value.
+
+    Args:
+        map: A mapping of keys to values
+
+    Returns:
+        A set of the values when they are all hashable, otherwise the values view itself.
+    """
+    values = map.values()
+    try:
+        return frozenset(values)
+    except TypeError:
+        return values
+
+def _pool_contains(pool: Collection, value: object) -> bool:
+    """
+    Check if a value pool (see `_value_pool`) contains a value.
+
+    Args:
+        pool:  The values to search
+        value: The value to look for
+
+    Returns:
+        True if the value is in the pool, False otherwise.
+    """
+    try:
+        return value in pool
+    except TypeError:
+        # An unhashable value cannot be in a set of hashable values.
+        return False
 
 def assert_values(
     map:             Map,
@@ -444,28 +662,27 @@ def assert_values(
             -   does not contain all included values
             -   contains any excluded values.
     """
+    if _SKIP_VALIDATION:
+        return
+
     assert_not_empty(map, description)
 
     description = description or type(map).__name__
-    values_type = f" ({type(next(iter(map.values())))})" if map else ""
 
-    if included_values is not None:
-        if isinstance(included_values, Value):
-            included_values = (included_values,)
+    if included_values is None and excluded_values is None:
+        return
+    values = _value_pool(map)
 
-        for value in included_values:
-            assert value in map.values(), \
-                f"The {description} must contain the value{values_type!r}: {value!r}."
+    if included_values is not None:
+        for value in _to_sequence(included_values):
+            assert _pool_contains(values, value), \
+                f"The {description} must contain the value{_element_type_note(map.values())}: {value!r}."
 
     if excluded_values is not None:
-        if isinstance(excluded_values, Value):
-            excluded_values = (excluded_values,)
+        for value in _to_sequence(excluded_values):
+            assert not _pool_contains(values, value), \
+                f"The {description} must not contain the value{_element_type_note(map.values())}: {value!r}."
 
-        for value in excluded_values:
-            assert value not in map.values(), \
-                f"The {description} must not contain the value{values_type!r}: {value!r}."
-
-@Overload
 def assert_contains(
     map:         Map,
     keys:        KeyOrKeys,
@@ -482,20 +699,15 @@ def assert_contains(
     Raises:
         AssertionError: If the mapping does not contain the specified key(s).
     """
-    assert_not_empty(map, description)
+    if _SKIP_VALIDATION:
+        return
 
-    key_type   = None
-    value_type = None
-
-    while key_type is None or value_type is None:
-        try:
-            key_type   = type(next(iter(map.keys())))   if key_type   is None else key_type
-            value_type = type(next(iter(map.values()))) if value_type is None else value_type
-        except StopIteration:
-            # This can only happen if the only key in the map is None, or if every value in the map
-            # is None.
-            break
+    assert_not_empty(map, description)
 
-    
+    if description is None:
+        key_type    = type(next(iter(map)))
+        value_type  = type(next(iter(map.values())))
+        description = f"{type(map).__name__}[{key_type!r}, {value_type!r}]"
 
-    description = description or f"{type(map).__name__}[{key_type!r}, {value_type!r}]"
\ No newline at end of file
+    for key in _to_sequence(keys):
+        assert key in map, f"The {description} must contain the key: {key!r}."
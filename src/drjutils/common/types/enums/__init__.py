@@ -14,7 +14,7 @@ This module provides utilities for working with enumerations in Python.
 - `StrReps`:           Type alias for a tuple of string representations of an enum.
 - `EnumToStrRepsDict`: Type alias for a dictionary mapping enum values to their string
     representations.
-- `StrToEnumDict`:     Type alias for a dictionary mapping strings to their corresponding enum
+- `StrRepToEnumDict`:  Type alias for a dictionary mapping strings to their corresponding enum
     values.
 
 ## Utility Functions
@@ -27,27 +27,21 @@ This module provides utilities for working with enumerations in Python.
 - `make_string_to_enum_dict`:  Creates a mapping from strings to their corresponding enum values.
 - `make_enum_and_str_rep_dicts`: Creates both enum-to-string and string-to-enum mappings.
 
+The names are imported from their submodules on first access, so importing this package does not
+load them.
+
 Copyright 2025 Daniel Robert Jackson
 """
 
-from enum_utils import (
-    EnumType,
-    StrReps,
-    EnumToStrRepsDict,
-    StrRepToEnumDict,
-    assert_enum_and_str_reps_exist,
-    assert_enum_and_str_reps_valid,
-    assert_str_reps_valid,
-    make_enum_to_strings_dict,
-    make_string_to_enum_dict,
-    make_enum_and_str_rep_dicts,
-    )
-from mapped_enum  import MappedEnum
-
+"""
+Standard Libraries
+"""
+from importlib import import_module
+from typing    import Any, Dict, Final, List
 
 __all__ = [
     # Classes
-    "EnumMap",
+    "MappedEnum",
     # Data Types
     "EnumType",
     "StrReps",
@@ -59,5 +53,44 @@ __all__ = [
     "assert_str_reps_valid",
     "make_enum_to_strings_dict",
     "make_string_to_enum_dict",
-    "make_enum_and_str_rep_dicts"
+    "make_enum_and_str_rep_dicts",
 ]
+
+_LAZY_ATTRS: Final[Dict[str, str]] = {
+    name: "mapped_enum" if name == "MappedEnum" else "enum_utils" for name in __all__
+}
+"""
+Map of each public name to the submodule it is imported from on first access.
+"""
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a public name from its submodule on first access.
+
+    The result is cached in the package globals, so later lookups never reach this function
+    again.
+
+    Args:
+        name (str): The name of the attribute being looked up.
+
+    Returns:
+        Any: The imported attribute.
+
+    Raises:
+        AttributeError: If the name is not a public name of this package.
+    """
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    """
+    List the package attributes, including the lazily imported ones.
+
+    Returns:
+        List[str]: The sorted attribute names.
+    """
+    return sorted({*globals(), *_LAZY_ATTRS})
@@ -42,6 +42,10 @@ This module provides utilities for working with enumerations in Python.
     sequences match.
 - `_process_enum_set`: Processes a set of enum members and their string representation(s), ensuring
     uniqueness and non-emptiness of strings.
+- `_member_str_reps`: Gets the string representation(s) of an enum member from its value.
+- `_is_str_keyed`: Indicates if a mapping is keyed by strings rather than Enum members.
+- `_enum_to_strings_from_*`: The forms of `make_enum_to_strings_dict`.
+- `_strings_to_enum_from_*`: The forms of `make_string_to_enum_dict`.
 
 Copyright 2025 Daniel Robert Jackson
 """
@@ -52,8 +56,9 @@ Standard Libraries
 from collections import defaultdict
 from collections.abc import Iterable
 from enum   import Enum
-from typing import Mapping, Optional, Sequence
-from typing_extensions import Overload, TypeAlias, TypeVar
+from sys    import intern
+from typing import Mapping, Optional, Sequence, Union, overload
+from typing_extensions import TypeAlias, TypeVar
 
 """
 Project Libraries
@@ -199,7 +204,6 @@ def _assert_keys(
             specified conditions.
     """
     description = description or type(map).__name__
-    keys_type = type(next(iter(map.keys())))
 
     assert map is not None, f"The {description} must not be None."
 
@@ -208,12 +212,12 @@ def _assert_keys(
     if included_keys is not UNSET:
         for key in included_keys:
             assert key in map, \
-                f"The {description} must contain the key ({keys_type!r}): {key!r}."
+                f"The {description} must contain the key ({type(next(iter(map)))!r}): {key!r}."
 
     if excluded_keys is not UNSET:
         for key in excluded_keys:
             assert key not in map, \
-                f"The {description} must not contain the key ({keys_type!r}): {key!r}."
+                f"The {description} must not contain the key ({type(next(iter(map)))!r}): {key!r}."
 
 def _assert_not_empty(
     collection:  Iterable,
@@ -352,18 +356,14 @@ def _assert_str_reps_valid(
     """
     _assert_str_reps_exist(str_reps, enum)
 
-    if isinstance(str_reps, Sequence):
-        # Check for empty strings in the sequence
-        for str_rep in str_reps:
-            assert str_rep, \
-                f"Empty string found in string representation(s) {str_reps!r}." \
-                    if enum is None and description is None else \
-                f"Empty string found in string representation(s) {str_reps!r} for {enum!r}." \
-                    if enum is not None and description is None else \
-                f"Empty string found in string representation(s) {str_reps!r} for {description}." \
-                    if enum is None and description is not None else \
-                f"Empty string found in string representation(s) {str_reps!r} for {description} \
-                    ({enum!r})."
+    # `_assert_str_reps_exist` has already rejected empty strings; a single string (or a
+    # one-element sequence) cannot hold duplicates, so only longer sequences build a set.
+    if not isinstance(str_reps, str) and len(str_reps) > 1:
+        assert len(frozenset(str_reps)) == len(str_reps), \
+            f"Duplicate string found in string representation(s) {str_reps!r}." \
+                if enum is None and description is None else \
+            f"Duplicate string found in string representation(s) {str_reps!r} for " \
+            f"{description or repr(enum)}."
 
 def _process_enum_set(
     enum:                  EnumType,
@@ -401,12 +401,60 @@ def _process_enum_set(
     for string in str_reps:
         assert string not in str_rep_to_enum_dict, \
             f"Duplicate string '{string}' found for {str_rep_to_enum_dict[string]!r} and {enum!r}."
-        str_rep_to_enum_dict[string] = enum
+        str_rep_to_enum_dict[intern(string)] = enum
 
     if enum_to_str_reps_dict is not None:
         assert enum not in enum_to_str_reps_dict, \
             f"Duplicate enum {enum!r} found in enum_to_str_reps_dict."
-        enum_to_str_reps_dict[enum] = tuple(str_reps)
+        enum_to_str_reps_dict[enum] = tuple(map(intern, str_reps))
+
+def _member_str_reps(enum: EnumType) -> StrReps:
+    """
+    Get the string representation(s) of an Enum member from its value.
+
+    Args:
+        enum: The Enum member whose value holds its string representation(s).
+
+    Returns:
+        The tuple of interned string representation(s) for the Enum member.
+
+    Raises:
+        AssertionError: If any of the following conditions are met:
+            *   the value is not a sequence of strings or a single string
+            *   the Enum member has no string representation(s)
+            *   any of the strings are empty
+    """
+    if isinstance(enum.value, Sequence) and isinstance(next(iter(enum.value), None), str):
+        str_reps = enum.value
+    elif isinstance(enum.value, str):
+        str_reps = (enum.name,)
+    else:
+        raise AssertionError(
+            f"Enum {enum!r} has an invalid value type: {type(enum.value)!r}. "
+            "Expected a sequence of strings or a single string."
+        )
+
+    _assert_str_reps_exist(str_reps, enum)
+    # Interned, so lookups with literal or interned strings hit the identity check first.
+    return tuple(map(intern, str_reps))
+
+def _is_str_keyed(mapping: Mapping) -> bool:
+    """
+    Indicate if a mapping is keyed by strings rather than Enum members.
+
+    Args:
+        mapping: The mapping to check.
+
+    Returns:
+        True if every key is a string, False if none is (including for an empty mapping).
+
+    Raises:
+        TypeError: If the mapping mixes string and non-string keys.
+    """
+    str_keys = sum(isinstance(key, str) for key in mapping)
+    if str_keys and str_keys != len(mapping):
+        raise TypeError("The mapping must be keyed by all strings or all Enum members.")
+    return bool(str_keys)
 
 assert_enum_and_str_reps_exist = _assert_enum_and_str_reps_exist
 
@@ -432,8 +480,7 @@ def assert_enum_and_str_reps_valid(
 
 assert_str_reps_valid = _assert_str_reps_valid
 
-@Overload
-def make_enum_to_strings_dict(
+def _enum_to_strings_from_map(
     enum_to_str_reps_map:  Mapping[EnumType, Sequence[str]]
     ) -> EnumToStrRepsDict[EnumType]:
     """
@@ -455,18 +502,17 @@ def make_enum_to_strings_dict(
             *   there are duplicate string representation(s) for different Enum members
     """
     _assert_valid_enum_keys(enum_to_str_reps_map)
-    enum_to_str_reps_dict: EnumToStrRepsDict[EnumType] = enum_to_str_reps_map
-    str_rep_to_enum_dict:  StrRepToEnumDict[EnumType]     = {} # For checking uniqueness
+    str_rep_to_enum_dict: StrRepToEnumDict[EnumType] = {} # For checking uniqueness
 
     for enum, strings in enum_to_str_reps_map.items():
-        _process_enum_set(enum, strings, str_rep_to_enum_dict, enum_to_str_reps_dict)
+        _process_enum_set(enum, strings, str_rep_to_enum_dict)
 
-    return enum_to_str_reps_dict
+    # The input is already grouped by member, so each group is copied once as a tuple.
+    return {enum: tuple(strings) for enum, strings in enum_to_str_reps_map.items()}
 
-@Overload
-def make_enum_to_strings_dict(
+def _enum_to_strings_from_pairs(
     enum_to_str_reps_pairs: Sequence[tuple[EnumType, _StrReps]],
-    enum_to_str_reps_dict:  Optional[EnumToStrRepOrRepsDict[EnumType]] = {}
+    enum_to_str_reps_dict:  Optional[EnumToStrRepOrRepsDict[EnumType]] = None
     ) -> EnumToStrRepsDict[EnumType]:
     """
     Create a mapping of `Enum` members to their string representation(s).
@@ -493,6 +539,8 @@ def make_enum_to_strings_dict(
                 `enum_to_str_reps_pairs`
     """
     _assert_not_empty(enum_to_str_reps_pairs, "enum_to_str_reps_pairs")
+    if enum_to_str_reps_dict is None:
+        enum_to_str_reps_dict = {}
     str_rep_to_enum_dict: StrRepToEnumDict[EnumType] = {}  # For checking uniqueness
 
     for enum, strings in enum_to_str_reps_pairs:
@@ -500,11 +548,10 @@ def make_enum_to_strings_dict(
 
     return enum_to_str_reps_dict
 
-@Overload
-def make_enum_to_strings_dict(
+def _enum_to_strings_from_lists(
     enums:                 Sequence[EnumType],
     str_reps_list:         Sequence[Sequence[str]],
-    enum_to_str_reps_dict: Optional[EnumToStrRepsDict[EnumType]] = {},
+    enum_to_str_reps_dict: Optional[EnumToStrRepsDict[EnumType]] = None,
 ) -> EnumToStrRepsDict[EnumType]:
     """
     Create a mapping of Enum members to their string representation(s).
@@ -531,6 +578,8 @@ def make_enum_to_strings_dict(
                 `str_reps_list`
     """
     _assert_lengths_match(enums, str_reps_list)
+    if enum_to_str_reps_dict is None:
+        enum_to_str_reps_dict = {}
 
     str_rep_to_enum_dict: StrRepToEnumDict[EnumType] = {} # For checking uniqueness
 
@@ -539,10 +588,9 @@ def make_enum_to_strings_dict(
 
     return enum_to_str_reps_dict
 
-@Overload
-def make_enum_to_strings_dict(
+def _enum_to_strings_from_str_map(
     str_rep_to_enum_dict:  StrRepToEnumDict,
-    enum_to_str_reps_dict: Optional[EnumToStrRepsDict[EnumType]] = {}
+    enum_to_str_reps_dict: Optional[EnumToStrRepsDict[EnumType]] = None
 ) -> EnumToStrRepsDict[EnumType]:
     """
     Create a mapping of Enum members to their string representation(s) from a string-to-enum
@@ -566,6 +614,8 @@ def make_enum_to_strings_dict(
             *   any of the strings are empty or None
     """
     _assert_valid_str_keys(str_rep_to_enum_dict)
+    if enum_to_str_reps_dict is None:
+        enum_to_str_reps_dict = {}
 
     enum_to_str_reps: defaultdict[Enum, list[str]] = defaultdict(list)
 
@@ -583,10 +633,82 @@ def make_enum_to_strings_dict(
 
     return enum_to_str_reps_dict
 
-@Overload
-def make_string_to_enum_dict(
+@overload
+def make_enum_to_strings_dict(
+    enum_to_str_reps_map:  Mapping[EnumType, Sequence[str]],
+    /
+    ) -> EnumToStrRepsDict[EnumType]: ...
+
+@overload
+def make_enum_to_strings_dict(
+    enum_to_str_reps_pairs: Sequence[tuple[EnumType, _StrReps]],
+    enum_to_str_reps_dict:  Optional[EnumToStrRepOrRepsDict[EnumType]] = None,
+    /
+    ) -> EnumToStrRepsDict[EnumType]: ...
+
+@overload
+def make_enum_to_strings_dict(
+    enums:                 Sequence[EnumType],
+    str_reps_list:         Sequence[Sequence[str]],
+    enum_to_str_reps_dict: Optional[EnumToStrRepsDict[EnumType]] = None,
+    /
+) -> EnumToStrRepsDict[EnumType]: ...
+
+@overload
+def make_enum_to_strings_dict(
+    str_rep_to_enum_dict:  StrRepToEnumDict,
+    enum_to_str_reps_dict: Optional[EnumToStrRepsDict[EnumType]] = None,
+    /
+) -> EnumToStrRepsDict[EnumType]: ...
+
+def make_enum_to_strings_dict(
+    source:                Union[Mapping, Sequence],
+    str_reps_or_dict:      Optional[Union[Sequence, Mapping]] = None,
+    enum_to_str_reps_dict: Optional[EnumToStrRepsDict[EnumType]] = None,
+    /
+    ) -> EnumToStrRepsDict[EnumType]:
+    """
+    Create a dictionary of Enum members to their tuples of string representation(s).
+
+    The form is chosen from the argument types:
+    *   a mapping keyed by Enum members (see `_enum_to_strings_from_map`)
+    *   a mapping keyed by strings, and an optional dictionary to update
+        (see `_enum_to_strings_from_str_map`)
+    *   a sequence of Enum members and a matching sequence of string representation(s), and an
+        optional dictionary to update (see `_enum_to_strings_from_lists`)
+    *   a sequence of (Enum member, string representation(s)) pairs, and an optional dictionary
+        to update (see `_enum_to_strings_from_pairs`)
+
+    Args:
+        source:                The mapping, the sequence of Enum members, or the sequence of pairs.
+        str_reps_or_dict:      The sequence of string representation(s) for the Enum members, or
+            the optional dictionary to update.
+        enum_to_str_reps_dict: The optional dictionary to update, after a sequence of Enum members
+            and their string representation(s).
+
+    Returns:
+        A dictionary mapping Enum members to their tuple of string representation(s).
+
+    Raises:
+        TypeError: If the arguments match none of the forms.
+        AssertionError: If the matching form rejects the data.
+    """
+    if isinstance(source, Mapping):
+        if enum_to_str_reps_dict is None:
+            if _is_str_keyed(source):
+                return _enum_to_strings_from_str_map(source, str_reps_or_dict)
+            if str_reps_or_dict is None:
+                return _enum_to_strings_from_map(source)
+    elif str_reps_or_dict is None or isinstance(str_reps_or_dict, Mapping):
+        if enum_to_str_reps_dict is None:
+            return _enum_to_strings_from_pairs(source, str_reps_or_dict)
+    else:
+        return _enum_to_strings_from_lists(source, str_reps_or_dict, enum_to_str_reps_dict)
+    raise TypeError("make_enum_to_strings_dict() got arguments that match none of its forms.")
+
+def _strings_to_enum_from_map(
     enum_to_str_reps_map: Mapping[EnumType, Sequence[str]],
-    str_rep_to_enum_dict: Optional[StrRepToEnumDict[EnumType]] = {}
+    str_rep_to_enum_dict: Optional[StrRepToEnumDict[EnumType]] = None
     ) -> StrRepToEnumDict[EnumType]:
     """
     Create a mapping of string representation(s) to their corresponding Enum members.
@@ -610,14 +732,26 @@ def make_string_to_enum_dict(
             *   there are duplicate string representation(s) for different Enum members
     """
     _assert_valid_enum_keys(enum_to_str_reps_map)
+    if str_rep_to_enum_dict is None:
+        for enum, strings in enum_to_str_reps_map.items():
+            _assert_enum_and_str_reps_exist(enum, strings)
+        # Built in one comprehension, so the dict is sized once rather than grown per string.
+        str_rep_to_enum_dict = {
+            intern(string): enum
+            for enum, strings in enum_to_str_reps_map.items()
+            for string in strings
+        }
+        if len(str_rep_to_enum_dict) == sum(map(len, enum_to_str_reps_map.values())):
+            return str_rep_to_enum_dict
+        # A string was repeated; rebuild one member at a time to report which one.
+        str_rep_to_enum_dict = {}
     for enum, strings in enum_to_str_reps_map.items():
         _process_enum_set(enum, strings, str_rep_to_enum_dict)
     return str_rep_to_enum_dict
 
-@Overload
-def make_string_to_enum_dict(
+def _strings_to_enum_from_pairs(
     enum_to_str_reps_pairs: Sequence[tuple[Enum, Sequence[str]]],
-    str_rep_to_enum_dict:   Optional[StrRepToEnumDict[EnumType]] = {}
+    str_rep_to_enum_dict:   Optional[StrRepToEnumDict[EnumType]] = None
     ) -> StrRepToEnumDict[EnumType]:
     """
     Create a mapping of string representation(s) to their corresponding Enum members.
@@ -642,15 +776,16 @@ def make_string_to_enum_dict(
             *   there are duplicate string representation(s) for different Enum members
     """
     _assert_not_empty(enum_to_str_reps_pairs, "enum_to_str_reps_pairs")
+    if str_rep_to_enum_dict is None:
+        str_rep_to_enum_dict = {}
     for enum, strings in enum_to_str_reps_pairs:
         _process_enum_set(enum, strings, str_rep_to_enum_dict)
     return str_rep_to_enum_dict
 
-@Overload
-def make_string_to_enum_dict(
+def _strings_to_enum_from_lists(
     enums:                Sequence[Enum],
     str_reps_list:        Sequence[Union[Sequence[str], str]],
-    str_rep_to_enum_dict: Optional[StrRepToEnumDict[EnumType]] = {}
+    str_rep_to_enum_dict: Optional[StrRepToEnumDict[EnumType]] = None
 ) -> StrRepToEnumDict[EnumType]:
     """
     Create a mapping of string representation(s) to their corresponding Enum members.
@@ -682,53 +817,77 @@ def make_string_to_enum_dict(
             *   there are duplicate string representation(s) for different Enum members
     """
     _assert_lengths_match(enums, str_reps_list)
+    if str_rep_to_enum_dict is None:
+        str_rep_to_enum_dict = {}
     for i in range(len(enums)):
         _process_enum_set(enums[i], str_reps_list[i], str_rep_to_enum_dict)
     return str_rep_to_enum_dict
 
-def make_enum_and_str_rep_dicts(
-    enum_class: EnumType,
-    
-) -> tuple[EnumToStrRepsDict[EnumType], StrRepToEnumDict[EnumType]]:
+@overload
+def make_string_to_enum_dict(
+    enum_to_str_reps_map: Mapping[EnumType, Sequence[str]],
+    str_rep_to_enum_dict: Optional[StrRepToEnumDict[EnumType]] = None,
+    /
+    ) -> StrRepToEnumDict[EnumType]: ...
+
+@overload
+def make_string_to_enum_dict(
+    enum_to_str_reps_pairs: Sequence[tuple[Enum, Sequence[str]]],
+    str_rep_to_enum_dict:   Optional[StrRepToEnumDict[EnumType]] = None,
+    /
+    ) -> StrRepToEnumDict[EnumType]: ...
+
+@overload
+def make_string_to_enum_dict(
+    enums:                Sequence[Enum],
+    str_reps_list:        Sequence[Union[Sequence[str], str]],
+    str_rep_to_enum_dict: Optional[StrRepToEnumDict[EnumType]] = None,
+    /
+) -> StrRepToEnumDict[EnumType]: ...
+
+def make_string_to_enum_dict(
+    source:               Union[Mapping, Sequence],
+    str_reps_or_dict:     Optional[Union[Sequence, Mapping]] = None,
+    str_rep_to_enum_dict: Optional[StrRepToEnumDict[EnumType]] = None,
+    /
+    ) -> StrRepToEnumDict[EnumType]:
     """
-    Create both string-to-enum and enum-to-string representation(s) dictionaries.
+    Create a mapping of string representation(s) to their corresponding Enum members.
+
+    The form is chosen from the argument types, and each takes an optional dictionary to update:
+    *   a mapping of Enum members to their string representation(s)
+        (see `_strings_to_enum_from_map`)
+    *   a sequence of Enum members and a matching sequence of string representation(s)
+        (see `_strings_to_enum_from_lists`)
+    *   a sequence of (Enum member, string representation(s)) pairs
+        (see `_strings_to_enum_from_pairs`)
 
     Args:
-        enum_class: The Enum class to create the mappings for.
+        source:               The mapping, the sequence of Enum members, or the sequence of pairs.
+        str_reps_or_dict:     The sequence of string representation(s) for the Enum members, or
+            the optional dictionary to update.
+        str_rep_to_enum_dict: The optional dictionary to update, after a sequence of Enum members
+            and their string representation(s).
 
     Returns:
-        A tuple containing:
-        -   A dictionary mapping string representation(s) to their corresponding Enum members.
-        -   A dictionary mapping Enum members to their tuple of string representation(s).
+        A dictionary mapping string representation(s) to their corresponding Enum members.
 
     Raises:
-        AssertionError: If the Enum class is not valid or does not have string representation(s).
-    """
-    enum_to_str_reps_dict: EnumToStrRepsDict[EnumType] = {}
-    str_rep_to_enum_dict:  StrRepToEnumDict[EnumType]  = {}
-
-    for enum in enum_class:
-        if isinstance(enum.value, Sequence) and isinstance(next(iter(enum.value), None), str):
-            str_reps = enum.value
-        elif isinstance(enum.value, str):
-            str_reps = (enum.name,)
-        else:
-            raise AssertionError(
-                f"Enum {enum!r} has an invalid value type: {type(enum.value)!r}. "
-                "Expected a sequence of strings or a single string."
-            )
-
-        _assert_str_reps_exist(str_reps, enum)
-        _process_enum_set(
-            enum,
-            str_reps,
-            str_rep_to_enum_dict,
-            enum_to_str_reps_dict)
-
-    return enum_to_str_reps_dict, str_rep_to_enum_dict
+        TypeError: If the arguments match none of the forms.
+        AssertionError: If the matching form rejects the data.
+    """
+    if str_reps_or_dict is None or isinstance(str_reps_or_dict, Mapping):
+        if str_rep_to_enum_dict is None:
+            if isinstance(source, Mapping):
+                return _strings_to_enum_from_map(source, str_reps_or_dict)
+            return _strings_to_enum_from_pairs(source, str_reps_or_dict)
+    elif not isinstance(source, Mapping):
+        return _strings_to_enum_from_lists(source, str_reps_or_dict, str_rep_to_enum_dict)
+    raise TypeError("make_string_to_enum_dict() got arguments that match none of its forms.")
 
 def make_enum_and_str_rep_dicts(
-    enum_class: EnumType
+    enum_class: EnumType,
+    
 ) -> tuple[EnumToStrRepsDict[EnumType], StrRepToEnumDict[EnumType]]:
     """
     Create both string-to-enum and enum-to-string representation(s) dictionaries.
@@ -744,3 +903,19 @@ def make_enum_and_str_rep_dicts(
     Raises:
         AssertionError: If the Enum class is not valid or does not have string representation(s).
     """
+    enum_to_str_reps_dict: EnumToStrRepsDict[EnumType] = {
+        enum: _member_str_reps(enum) for enum in enum_class
+    }
+    str_rep_to_enum_dict: StrRepToEnumDict[EnumType] = {
+        str_rep: enum
+        for enum, str_reps in enum_to_str_reps_dict.items()
+        for str_rep in str_reps
+    }
+
+    if len(str_rep_to_enum_dict) != sum(map(len, enum_to_str_reps_dict.values())):
+        # A string was repeated; rebuild one member at a time to report which one.
+        str_rep_to_enum_dict = {}
+        for enum, str_reps in enum_to_str_reps_dict.items():
+            _process_enum_set(enum, str_reps, str_rep_to_enum_dict)
+
+    return enum_to_str_reps_dict, str_rep_to_enum_dict
@@ -13,7 +13,8 @@ This class is a base class for mapping enum members to string representations.
 It is intended for the use case where there are a relatively small number of string variations
 per enum member, and it provides methods for checking and converting strings to enum members.
 
-If a much broader set of string variations is needed, consider using `EnumRegex` instead.
+Lookups are single dictionary hits on the listed strings (after stripping surrounding
+whitespace), so every accepted spelling must be listed.
 
 ### Example Usage
 
@@ -37,7 +38,8 @@ Copyright 2025 Daniel Robert Jackson
 Standard Libraries
 """
 from enum   import Enum
-from typing import  Optional, Self
+from types  import MappingProxyType
+from typing import Mapping, Optional, Self
 
 """
 Project Libraries
@@ -78,7 +80,8 @@ class MappedEnum(Enum):
     which is returned when the enum member is converted to a string. This is useful for
     displaying the enum member in a user-friendly way.
 
-    If a much broader set of string variations is needed, consider using `EnumRegex` instead.
+    Lookups are single dictionary hits on the listed strings (after stripping surrounding
+    whitespace), so every accepted spelling must be listed.
 
     Warning: Strings should never be duplicated.
 
@@ -96,47 +99,40 @@ class MappedEnum(Enum):
     ```
     """
 
-    _ENUMS_TO_STRINGS: EnumToStrRepsDict[Self]
+    _ENUMS_TO_STRINGS: Mapping[Self, StrReps]
     """
-    ### Mapping of all Enum members to their string representations
+    ### Read-only mapping of all Enum members to their string representations
 
     *Enums and strings ordered by preference*
     """
 
-    _STRINGS_TO_ENUMS: StrRepToEnumDict[Self]
-    """Mapping of all string representations to their corresponding Enum members."""
+    _STRINGS_TO_ENUMS: Mapping[str, Self]
+    """Read-only mapping of all string representations to their corresponding Enum members."""
 
-    def __new__(cls, value: StrRepOrReps) -> Self:
+    def __new__(cls, *str_reps: str) -> Self:
         """
         Create a new instance of the enum with the given string representations.
 
-        This method is called when a new enum member is created. It initializes the
-        enum member with the provided string representations and sets the value.
+        This method is called when a new enum member is created. `Enum` unpacks a tuple value
+        into separate arguments, so a member defined as `("BMP", "bmp")` arrives here as two
+        strings, and a member defined as a single string arrives as one.
+
+        The value of the member is the tuple of its string representations; the display
+        string is read from it rather than stored separately on each member.
 
         Args:
-            value: A tuple of strings representing the enum member.
+            str_reps: The strings representing the enum member, in order of preference.
 
         Returns:
             An instance of the enum with the given string representations.
 
         Raises:
-            ValueError: If the value is empty or does not contain valid strings.
+            AssertionError: If there are no strings, or any string is empty or duplicated.
         """
-        assert_str_reps_valid(value, Self)
+        assert_str_reps_valid(str_reps, description=cls.__name__)
 
         obj = object.__new__(cls)
-
-        if isinstance(value, str):
-            # If a single string is provided, convert it to a tuple for consistency.
-            obj._value_  = value
-            obj.str_reps = (value,)  # Store the single string as a tuple.
-        elif not isinstance(value, tuple):
-            obj._value_  = value[0] # The first string is the primary value of the enum member.
-            obj.str_reps = value   # Store all string representations for the enum member.
-
-        # Use the subclass-specific display string.
-        obj._display_ = obj._value_
-
+        obj._value_ = str_reps
         return obj
 
     def __str__(self) -> str:
@@ -146,20 +142,21 @@ class MappedEnum(Enum):
         This method is called when the enum member is converted to a string.
 
         Returns:
-            The display string of the enum member as defined in the subclass.
+            The display string of the enum member: its first (preferred) string representation.
         """
-        return self._display_
+        return self._value_[0]
 
     def get_str_reps(self) -> StrReps:
         """
         Get the string representations of the enum member.
 
-        This method returns the tuple of strings that represent the enum member.
+        This method returns the tuple of strings that represent the enum member, from the
+        mapping built when the subclass was created.
 
         Returns:
             A tuple of strings representing the enum member.
         """
-        return self._str_reps
+        return self._ENUMS_TO_STRINGS[self]
 
     @classmethod
     def __init_subclass__(cls) -> None:
@@ -180,14 +177,17 @@ class MappedEnum(Enum):
         """
         super().__init_subclass__()
 
-        cls._ENUMS_TO_STRINGS, cls._STRINGS_TO_ENUMS = make_enum_and_str_rep_dicts(cls)
+        enums_to_strings, strings_to_enums = make_enum_and_str_rep_dicts(cls)
+        cls._ENUMS_TO_STRINGS = MappingProxyType(enums_to_strings)
+        cls._STRINGS_TO_ENUMS = MappingProxyType(strings_to_enums)
 
     @classmethod
     def is_valid_str(cls, string: str, self = None) -> bool:
         """
         Check if the given string is a valid representation of an enum member.
         This method checks if the provided string matches any of the string representations
-        defined for the enum member.
+        defined for the enum member. It ignores leading and trailing whitespace.
+        It is case-sensitive.
 
         Args:
             string: The string to check.
@@ -197,45 +197,44 @@ class MappedEnum(Enum):
         Returns:
             bool: True if the string is a valid representation of an enum member, False otherwise.
         """
-        return string in (cls._STRINGS_TO_ENUMS if self is None else cls._ENUMS_TO_STRINGS[self]._STRINGS_TO_ENUMS)
+        string = string.strip()
+        if self is None:
+            return string in cls._STRINGS_TO_ENUMS
+        return cls._STRINGS_TO_ENUMS.get(string) is self
 
     @classmethod
     def maybe_from_str(cls, string: str) -> Optional[Self]:
         """
-        Attempts to convert a string to a BooleanAlias instance if it matches known boolean representations.
+        Attempts to convert a string to an enum member if it matches one of the member's string
+        representations.
+
+        This is a single lookup in the string-to-member mapping built when the subclass was
+        created, rather than a search over the members. It ignores leading and trailing
+        whitespace.
 
         Args:
-            string (str): The input string to interpret as a boolean value.
+            string (str): The string representation to look up.
 
         Returns:
-            Optional[BooleanAlias]: Returns BooleanAlias.TRUE or BooleanAlias.FALSE if the string matches a known boolean alias,
-            otherwise returns None.
+            Optional[Self]: The enum member with that string representation, otherwise None.
         """
-        if cls.is_true(string):
-            return cls._get_true_member()
-        elif cls.is_false(string):
-            return cls._get_false_member()
-        else:
-            return None
+        return cls._STRINGS_TO_ENUMS.get(string.strip())
 
     @classmethod
     def from_str(cls, string: str) -> Self:
         """
-        Converts a string to a BooleanAlias instance.
-
-        Attempts to interpret the given string as a boolean value. If the string cannot be
-        interpreted as a boolean, raises a ValueError.
+        Converts a string to an enum member, ignoring leading and trailing whitespace.
 
         Args:
-            string (str): The string to convert to a BooleanAlias instance.
+            string (str): The string representation to look up.
 
         Returns:
-            BooleanAlias: The BooleanAlias instance corresponding to the input string.
+            Self: The enum member with that string representation.
 
         Raises:
-            ValueError: If the input string cannot be interpreted as a boolean.
+            ValueError: If the string is not a representation of any enum member.
         """
-        result = cls.maybe_from_str(string)
-        if result is None:
-            raise ValueError(f"Invalid Boolean value: {string}")
-        return result
+        try:
+            return cls._STRINGS_TO_ENUMS[string.strip()]
+        except KeyError:
+            raise ValueError(f"Invalid {cls.__name__} value: {string}") from None
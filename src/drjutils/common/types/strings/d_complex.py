@@ -8,35 +8,40 @@ Copyright 2025 Daniel Robert Jackson
 
 ### Constants:
 
-| Constant       | Type         | Description                            |
-|----------------|--------------|----------------------------------------|
-| `INF`          | `float`      | Infinity                               |
-| `NEG_INF`      | `float`      | Negative Infinity                      |
-| `NAN`          | `float`      | Not a Number                           |
-| `BOOL_RGX`     | `re.Pattern` | Boolean Regex                          |
-| `BOOL_RXS`     | `str`        | Boolean Regex String                   |
-| `COMPLEX_RGX`  | `re.Pattern` | Complex Number Regex                   |
-| `COMPLEX_RXS`  | `str`        | Complex Number Regex String            |
-| `FRACTION_RGX` | `re.Pattern` | Fraction Regex                         |
-| `FRACTION_RXS` | `str`        | Fraction Regex String                  |
-| `INT_RGX`      | `re.Pattern` | Integer Regex                          |
-| `INT_RXS`      | `str`        | Integer Regex String                   |
-| `INT_DEC_RGX`  | `re.Pattern` | Decimal (Base-10) Integer Regex        |
-| `INT_DEC_RXS`  | `str`        | Decimal (Base-10) Integer Regex String |
-| `INT_BIN_RGX`  | `re.Pattern` | Binary Integer Regex                   |
-| `INT_BIN_RXS`  | `str`        | Binary Integer Regex String            |
-| `INT_HEX_RGX`  | `re.Pattern` | Hexadecimal Integer Regex              |
-| `INT_HEX_RXS`  | `str`        | Hexadecimal Integer Regex String       |
-| `INT_OCT_RGX`  | `re.Pattern` | Octal Integer Regex                    |
-| `INT_OCT_RXS`  | `str`        | Octal Integer Regex String             |
-| `REAL_RGX`     | `re.Pattern` | Real Regex                             |
-| `REAL_RXS`     | `str`        | Real Regex String                      |
-| `REAL_BSC_RGX` | `re.Pattern` | Basic Real Regex                       |
-| `REAL_BSC_RXS` | `str`        | Basic Real Regex String                |
-| `REAL_SCI_RGX` | `re.Pattern` | Scientific Notation Real Regex         |
-| `REAL_SCI_RXS` | `str`        | Scientific Notation Real Regex String  |
-| `NUM_RGX`      | `re.Pattern` | Number Regex                           |
-| `NUM_RXS`      | `str`        | Number Regex String                    |
+| Constant           | Type         | Description                            |
+|--------------------|--------------|----------------------------------------|
+| `INF`              | `float`      | Infinity                               |
+| `NEG_INF`          | `float`      | Negative Infinity                      |
+| `NAN`              | `float`      | Not a Number                           |
+| `BOOL_RGX`         | `re.Pattern` | Boolean Regex                          |
+| `BOOL_RXS`         | `str`        | Boolean Regex String                   |
+| `BOOL_CORE_RGX`    | `re.Pattern` | Boolean Regex (stripped input)         |
+| `BOOLISH_CORE_RGX` | `re.Pattern` | Booleanish Regex (stripped input)      |
+| `COMPLEX_RGX`      | `re.Pattern` | Complex Number Regex                   |
+| `COMPLEX_RXS`      | `str`        | Complex Number Regex String            |
+| `FRACTION_RGX`     | `re.Pattern` | Fraction Regex                         |
+| `FRACTION_RXS`     | `str`        | Fraction Regex String                  |
+| `INT_RGX`          | `re.Pattern` | Integer Regex                          |
+| `INT_RXS`          | `str`        | Integer Regex String                   |
+| `INT_DEC_RGX`      | `re.Pattern` | Decimal (Base-10) Integer Regex        |
+| `INT_DEC_RXS`      | `str`        | Decimal (Base-10) Integer Regex String |
+| `INT_BIN_RGX`      | `re.Pattern` | Binary Integer Regex                   |
+| `INT_BIN_RXS`      | `str`        | Binary Integer Regex String            |
+| `INT_HEX_RGX`      | `re.Pattern` | Hexadecimal Integer Regex              |
+| `INT_HEX_RXS`      | `str`        | Hexadecimal Integer Regex String       |
+| `INT_OCT_RGX`      | `re.Pattern` | Octal Integer Regex                    |
+| `INT_OCT_RXS`      | `str`        | Octal Integer Regex String             |
+| `REAL_RGX`         | `re.Pattern` | Real Regex                             |
+| `REAL_RXS`         | `str`        | Real Regex String                      |
+| `REAL_BSC_RGX`     | `re.Pattern` | Basic Real Regex                       |
+| `REAL_BSC_RXS`     | `str`        | Basic Real Regex String                |
+| `REAL_SCI_RGX`     | `re.Pattern` | Scientific Notation Real Regex         |
+| `REAL_SCI_RXS`     | `str`        | Scientific Notation Real Regex String  |
+| `NUM_RGX`          | `re.Pattern` | Number Regex                           |
+| `NUM_RXS`          | `str`        | Number Regex String                    |
+
+The `*_RGX` patterns are anchored and allow surrounding whitespace. The `*_CORE_RGX`
+patterns match the bare word only, so strip the string before matching it.
 
 ### Functions:
 
@@ -94,6 +99,8 @@ __all__ = [
     "NAN",                  # Not a Number
     "BOOL_RGX",             # Boolean Regex
     "BOOL_RXS",             # Boolean Regex String
+    "BOOL_CORE_RGX",        # Boolean Regex (stripped input)
+    "BOOLISH_CORE_RGX",     # Booleanish Regex (stripped input)
     "COMPLEX_RGX",          # Complex Number Regex
     "COMPLEX_RXS",          # Complex Number Regex String
     "FRACTION_RGX",         # Fraction Regex
@@ -1206,7 +1213,7 @@ See also:
     *   `BOOL_EXT_RXS`, `BOOL_EXT_RGX`
 """
 
-BOOL_TRUE_RGX: Final[Pattern] = compile(rf"^\s*({BOOL_TRUE_EXT_RXS})\s*$", flags=IGNORECASE)
+BOOL_TRUE_EXT_RGX: Final[Pattern] = compile(rf"^\s*({BOOL_TRUE_EXT_RXS})\s*$", flags=IGNORECASE)
 r"""
 ### True Boolean Regex Pattern
 
@@ -1216,7 +1223,7 @@ r"""
     *   YES:    `y`, `Y`, `yes`, `Yes`, `YES`, etc.
     *   ON:     `o`, `O`, `on`, `On`, `ON`, etc.
     *   ENABLE: `e`, `E`, `enable`, `Enable`, `ENABLE`, etc.
-*   Usage: `re.compile(BOOL_TRUE_EXT_RGX, flags=re.IGNORECASE)`
+*   Usage: `BOOL_TRUE_EXT_RGX.match("yes")`
 
 ### Pattern: `^\s*t(?:rue)?|y(?:es)?|on?|e(?:nable)?\s*$`
 
@@ -1394,6 +1401,35 @@ r"""
     *   `$`                     <br/>End
 """
 
+BOOL_CORE_RGX: Final[Pattern] = compile(rf"\A(?:{BOOL_RXS})\Z", flags=IGNORECASE)
+r"""
+### Boolean Core Regex
+
+*   `BOOL_RXS` with no whitespace allowance.
+*   Usage: `BOOL_CORE_RGX.match(string.strip())`
+
+### Pattern: `\A(?:t(?:rue)?|f(?:alse)?)\Z`
+
+See also:
+    *   `BOOL_RXS`, `BOOL_RGX`
+    *   `BOOLISH_CORE_RGX`
+"""
+
+BOOLISH_CORE_RGX: Final[Pattern] = compile(rf"\A(?:{BOOL_EXT_RXS})\Z", flags=IGNORECASE)
+r"""
+### Booleanish Core Regex
+
+*   `BOOL_EXT_RXS` with no whitespace allowance.
+*   e.g.: `t`, `false`, `Yes`, `no`, `ON`, `off`, `enable`, `Disable`, etc.
+*   Usage: `BOOLISH_CORE_RGX.match(string.strip())`
+
+### Pattern: `\A(?:t(?:rue)?|f(?:alse)?|y(?:es)?|n(?:o)?|on?|o(ff)?|e(?:nable)?|d(?:isable)?)\Z`
+
+See also:
+    *   `BOOL_EXT_RXS`
+    *   `BOOL_CORE_RGX`
+"""
+
 ### Complex Numbers ###
 
 COMPLEX_RXS: Final[str] = rf"[+-]?(?:{__REAL_NON_SPEC_RXS})[+-]{__REAL_NON_SPEC_RXS}j"
@@ -2104,6 +2140,6 @@ def to_number(num: Union[str, Number]) -> Number:
     if is_real(num):
         return float(num)
     elif is_int(num):
-        return int(num) if is_int_dec(num) else 
+        return int(num) if is_int_dec(num) else int(num, 0)
 
     raise ValueError(f"Invalid number format: {num}")
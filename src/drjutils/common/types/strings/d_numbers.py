@@ -62,11 +62,13 @@ Copyright 2025 Daniel Robert Jackson
 | `is_int_bin`         | Indicate if a string represents a binary integer              |
 | `is_int_hex`         | Indicate if a string represents a hexadecimal integer         |
 | `is_int_oct`         | Indicate if a string represents an octal integer              |
+| `is_int_non_dec`     | Indicate if a string represents a non-decimal integer         |
 | `is_real`            | Indicate if a value represents a float                        |
 | `is_real_basic`      | Indicate if a string represents a basic float                 |
 | `is_real_scinot`     | Indicate if a string represents in scientific notation        |
 | `is_number`          | Indicate if a string represents a number of any type          |
 | `to_number`          | Convert a string to a number of the appropriate type          |
+| `to_numbers`         | Convert many strings to numbers of the appropriate types      |
 | `to_bool_str`        | Create a string toted_str as a boolean                        |
 | `to_complex_str`     | Create a string toted_str as a complex number                 |
 | `to_fraction_str`    | Create a string toted_str as a fraction                       |
@@ -78,14 +80,17 @@ Copyright 2025 Daniel Robert Jackson
 | `to_real_basic_str`  | Create a string toted_str as a basic real number (not scinot) |
 | `to_real_scinot_str` | Create a string toted_str in scientific notation              |
 | `to_number_str`      | Create a string toted_str appropriately for the type          |
+| `format_number`      | Format a number compactly (integral floats without `.0`)      |
+| `format_numbers`     | Format many numbers compactly                                 |
 """
 
 """
 Standard Libraries
 """
-from numbers import Complex, Fraction, Integral, Real
-from re import compile, IGNORECASE
-from typing import Final, Pattern, Union
+from fractions import Fraction
+from numbers import Complex, Integral, Number, Real
+from re import ASCII, compile
+from typing import Final, Iterable, Pattern, Union
 
 __all__ = [
     # Constants #
@@ -137,11 +142,13 @@ __all__ = [
     "is_int_bin",           # Indicate if the string represents a binary integer
     "is_int_hex",           # Indicate if the string represents a hexadecimal integer
     "is_int_oct",           # Indicate if the string represents an octal integer
+    "is_int_non_dec",       # Indicate if the string represents a non-decimal integer
     "is_real",              # Indicate if the value represents a float (any valid real format)
     "is_real_basic",        # Indicate if the string represents a basic real number (not scinot)
     "is_real_scinot",       # Indicate if the string represents a real number in scientific notation
     "is_number",            # Indicate if the value represents a number of any type
     "to_number",            # Convert to a number of the appropriate type
+    "to_numbers",           # Convert many values to numbers of the appropriate types
     "to_bool_str",          # Create a string toted_str as a boolean
     "to_complex_str",       # Create a string toted_str as a complex number
     "to_fraction_str",      # Create a string toted_str as a fraction
@@ -152,7 +159,9 @@ __all__ = [
     "to_real_str",          # Create a string toted_str as a real (float) number
     "to_real_basic_str",    # Create a string toted_str as a basic real number (not scinot)
     "to_real_scinot_str",   # Create a string toted_str in scientific notation
-    "to_number_str"         # Create a string toted_str appropriately for the type of number
+    "to_number_str",        # Create a string toted_str appropriately for the type of number
+    "format_number",        # Format a number compactly (integral floats without `.0`)
+    "format_numbers",       # Format many numbers compactly
 ]
 
 ########## Constants ##########
@@ -232,7 +241,7 @@ See also:
     *   `INT_RXS`, `INT_RGX`
 """
 
-INT_DEC_RGX: Final[Pattern] = compile(rf"^\s*{INT_DEC_RXS}\s*$")
+INT_DEC_RGX: Final[Pattern] = compile(rf"^\s*{INT_DEC_RXS}\s*$", flags=ASCII)
 r"""
 ### Signed Decimal Integer (Base-10) Regex
 
@@ -272,20 +281,20 @@ See also:
     *   `INT_RXS`, `INT_RGX`
 """
 
-INT_BIN_MAG_RXS: Final[str] = f"0b{INT_BIN_MAG_DGT_RXS}"
+INT_BIN_MAG_RXS: Final[str] = f"0[bB]{INT_BIN_MAG_DGT_RXS}"
 """
 ### Unsigned Binary Integer Regex String
 
 *   e.g.: `0b0`, `0B1`, `0dec`, `0B11`, `0dec10`, `0B11010110`, etc.
-*   Usage: `re.compile(INT_BIN_MAG_RXS, flags=re.IGNORECASE)`
+*   Usage: `re.compile(INT_BIN_MAG_RXS)`
 
-### Pattern: `0b[01]+`
+### Pattern: `0[bB][01]+`
 
 #### Unsigned Binary Integer Regex Structure:
 
 | Base | Digits  |
 |-----:|:--------|
-| `0b` | `[01]+` |
+| `0[bB]` | `[01]+` |
 
 See also:
     *   `INT_BIN_MAG_DGT_RXS`
@@ -301,15 +310,15 @@ INT_BIN_RXS: Final[str] = f"{SIGN_OPT_RXS}{INT_BIN_MAG_RXS}"
 ### Signed Binary Integer Regex String
 
 *   e.g.: `0b0`, `+0B0`, `-0b0`, `0B1`, `+0dec`, `-0B1011`, `0b11010110`, etc.
-*   Usage: `re.compile(INT_BIN_RXS, flags=re.IGNORECASE)`
+*   Usage: `re.compile(INT_BIN_RXS)`
 
-### Pattern: `[+-]?0b[01]+`
+### Pattern: `[+-]?0[bB][01]+`
 
 #### Signed Binary Integer Regex Structure:
 
 |   Sign? | Base | Digits  |
 |--------:|:----:|:--------|
-| `[+-]?` | `0b` | `[01]+` |
+| `[+-]?` | `0[bB]` | `[01]+` |
 
 See also:
     *   `INT_BIN_MAG_RXS`
@@ -318,20 +327,20 @@ See also:
     *   `INT_RXS`, `INT_RGX`
 """
 
-INT_BIN_RGX: Final[Pattern] = compile(rf"^\s*{INT_BIN_RXS}\s*$", flags=IGNORECASE)
+INT_BIN_RGX: Final[Pattern] = compile(rf"^\s*{INT_BIN_RXS}\s*$", flags=ASCII)
 r"""
 ### Signed Binary Integer Regex Pattern
 
 *   e.g.: `0b0`, `+0B0`, `-0b0`, `0B1`, `+0dec`, `-0B1011`, `0b11010110`, etc.
 *   Usage: INT_BIN_RGX.match("0dec10")
 
-### Pattern: `^\s*[+-]?0b[01]+\s*$`
+### Pattern: `^\s*[+-]?0[bB][01]+\s*$`
 
 #### Signed Binary Integer Regex Structure:
 
 | Prefix? |  Sign?  | Base |  Digits | Suffix? |
 |--------:|:-------:|:----:|:-------:|:--------|
-|  `^\s*` | `[+-]?` | `0b` | `[01]+` | `\s*$`  |
+|  `^\s*` | `[+-]?` | `0[bB]` | `[01]+` | `\s*$`  |
 
 See also:
     *   `INT_BIN_RXS`
@@ -341,14 +350,14 @@ See also:
 
 ## Hexadecimal Integer Regexes ##
 
-INT_HEX_MAG_DGT_RXS: Final[str] = r"[\da-f]+"
+INT_HEX_MAG_DGT_RXS: Final[str] = r"[\da-fA-F]+"
 r"""
 ### Unsigned Hexadecimal Integer Digits Regex String
 
 *   e.g.: `0`, `1`, `A`, `f`, `20`, `3B4C`, `5d6E7F89`, etc.
-*   Usage: `re.compile(INT_HEX_MAG_DGT_RXS, flags=re.IGNORECASE)`
+*   Usage: `re.compile(INT_HEX_MAG_DGT_RXS)`
 
-### Pattern: `[\da-f]+`
+### Pattern: `[\da-fA-F]+`
 
 See also:
     *   `INT_HEX_MAG_RXS`
@@ -359,20 +368,20 @@ See also:
     *   `INT_RXS`, `INT_RGX`
 """
 
-INT_HEX_MAG_RXS: Final[str] = f"0x{INT_HEX_MAG_DGT_RXS}"
+INT_HEX_MAG_RXS: Final[str] = f"0[xX]{INT_HEX_MAG_DGT_RXS}"
 r"""
 ### Unsigned Hexadecimal Integer Regex String
 
 *   e.g.: `0x0`, `0X1`, `0xA`, `0Xf`, `0x20`, `0X3B4C`, `0x5d6E7F89`, etc.
-*   Usage: `re.compile(INT_HEX_MAG_RXS, flags=re.IGNORECASE)`
+*   Usage: `re.compile(INT_HEX_MAG_RXS)`
 
-### Pattern: `0x[\da-f]+`
+### Pattern: `0[xX][\da-fA-F]+`
 
 ##### Unsigned Hexadecimal Integer Regex Structure:
 
 | Base | Digits     |
 |-----:|:-----------|
-| `0x` | `[\da-f]+` |
+| `0[xX]` | `[\da-fA-F]+` |
 
 See also:
     *   `INT_HEX_MAG_DGT_RXS`
@@ -388,15 +397,15 @@ r"""
 ### Signed Hexadecimal Integer Regex String
 
 *   e.g.: `0x0`, `+0X0`, `-0x0`, `0X1`, `+0xA`, `-0Xf`, `0x20`, `+0X3B4C`, `-0x5d6E7F89`, etc.
-*   Usage: `re.compile(INT_HEX_RXS, flags=re.IGNORECASE)`
+*   Usage: `re.compile(INT_HEX_RXS)`
 
-### Pattern: `[+-]?0x[\da-f]+`
+### Pattern: `[+-]?0[xX][\da-fA-F]+`
 
 #### Signed Hexadecimal Integer Regex Structure:
 
 |   Sign? | Base |  Digits    |
 |--------:|:----:|:-----------|
-| `[+-]?` | `0x` | `[\da-f]+` |
+| `[+-]?` | `0[xX]` | `[\da-fA-F]+` |
 
 See also:
     *   `INT_HEX_MAG_RXS`
@@ -405,20 +414,20 @@ See also:
     *   `INT_RXS`, `INT_RGX`
 """
 
-INT_HEX_RGX: Final[Pattern] = compile(rf"^\s*{INT_HEX_RXS}\s*$", flags=IGNORECASE)
+INT_HEX_RGX: Final[Pattern] = compile(rf"^\s*{INT_HEX_RXS}\s*$", flags=ASCII)
 r"""
 ### Signed Hexadecimal Integer Regex Pattern
 
 *   e.g.: `0x0`, `+0X0`, `-0x0`, `0X1`, `+0xA`, `-0Xf`, `0x20`, `+0X3B4C`, `-0x5d6E7F89`, etc.
 *   Usage: INT_HEX_RGX.match("0x20")
 
-### Pattern: `^\s*[+-]?0x[\da-f]+\s*$`
+### Pattern: `^\s*[+-]?0[xX][\da-fA-F]+\s*$`
 
 #### Signed Hexadecimal Integer Regex Structure:
 
 | Prefix? |  Sign?  | Base |   Digits   | Suffix? |
 |--------:|:-------:|:----:|:----------:|:--------|
-|  `^\s*` | `[+-]?` | `0x` | `[\da-f]+` | `\s*$`  |
+|  `^\s*` | `[+-]?` | `0[xX]` | `[\da-fA-F]+` | `\s*$`  |
 
 See also:
     *   `INT_HEX_RXS`
@@ -446,20 +455,20 @@ See also:
     *   `INT_RXS`, `INT_RGX`
 """
 
-INT_OCT_MAG_RXS: Final[str] = rf"0o{INT_OCT_MAG_DGT_RXS}"
+INT_OCT_MAG_RXS: Final[str] = rf"0[oO]{INT_OCT_MAG_DGT_RXS}"
 """
 ### Unsigned Octal Integer Regex String
 
 *   e.g.: `0o0`, `0O1`, `0o7`, `0O23`, `0o4567`, `0O01234567`, etc.
-*   Usage: `re.compile(INT_OCT_MAG_RXS, flags=re.IGNORECASE)`
+*   Usage: `re.compile(INT_OCT_MAG_RXS)`
 
-### Pattern: `0o[0-7]+`
+### Pattern: `0[oO][0-7]+`
 
 #### Unsigned Octal Digits Regex Structure:
 
 | Base | Digits   |
 |-----:|:---------|
-| `0o` | `[0-7]+` |
+| `0[oO]` | `[0-7]+` |
 
 See also:
     *   `INT_OCT_MAG_DGT_RXS`
@@ -475,15 +484,15 @@ INT_OCT_RXS: Final[str] = f"{SIGN_OPT_RXS}{INT_OCT_MAG_RXS}"
 ### Signed Octal Integer Regex String
 
 *   e.g.: `0o0`, `+0O0`, `-0o0`, `0O1`, `+0o7`, `-0O23`, `0o4567`, `+0O01234567`, etc.
-*   Usage: `re.compile(INT_OCT_RXS, flags=re.IGNORECASE)`
+*   Usage: `re.compile(INT_OCT_RXS)`
 
-### Pattern: `[+-]?0o[0-7]+`
+### Pattern: `[+-]?0[oO][0-7]+`
 
 #### Signed Octal Integer Regex Structure:
 
 |   Sign? | Base | Digits   |
 |--------:|:----:|:---------|
-| `[+-]?` | `0o` | `[0-7]+` |
+| `[+-]?` | `0[oO]` | `[0-7]+` |
 
 See also:
     *   `INT_OCT_MAG_RXS`
@@ -492,20 +501,20 @@ See also:
     *   `INT_RXS`, `INT_RGX`
 """
 
-INT_OCT_RGX: Final[Pattern] = compile(rf"^\s*{INT_OCT_RXS}\s*$", flags=IGNORECASE)
+INT_OCT_RGX: Final[Pattern] = compile(rf"^\s*{INT_OCT_RXS}\s*$", flags=ASCII)
 r"""
 ### Signed Octal Integer Regex Pattern
 
 *   e.g.: `0o0`, `+0O0`, `-0o0`, `0O1`, `+0o7`, `-0O23`, `0o4567`, `+0O01234567`, etc.
 *   Usage: INT_OCT_RGX.match("0o4567")
 
-### Pattern: `^\s*[+-]?0o[0-7]+\s*$`
+### Pattern: `^\s*[+-]?0[oO][0-7]+\s*$`
 
 #### Signed Octal Integer Regex Structure:
 
 | Prefix? |  Sign?  | Base |  Digits  | Suffix? |
 |--------:|:-------:|:----:|:--------:|:--------|
-|  `^\s*` | `[+-]?` | `0o` | `[0-7]+` | `\s*$`  |
+|  `^\s*` | `[+-]?` | `0[oO]` | `[0-7]+` | `\s*$`  |
 
 See also:
     *   `INT_OCT_RXS`
@@ -529,16 +538,16 @@ r"""
 *   Octal:
     *   `0o` followed by octal digits (`0-7`)
     *   e.g.: `0o123`, `0O4567`, `0o01234567`, etc.
-*   Usage: `re.compile(INT_NON_DEC_MAG_RXS, flags=re.IGNORECASE)`
+*   Usage: `re.compile(INT_NON_DEC_MAG_RXS)`
 
-### Pattern: `0x[\da-f]+|0b[01]+|0o[0-7]+`
+### Pattern: `0[xX][\da-fA-F]+|0[bB][01]+|0[oO][0-7]+`
 
 #### Numerical Base Option Series: `...|...`
  | Option | Base | Prefix | Digits     |
  |-------:|:----:|-------:|:-----------|
- |      1 |  Hex |   `0x` | `[\da-f]+` |
- |      2 |  Bin |   `0b` | `[01]+`    |
- |      3 |  Oct |   `0o` | `[0-7]+`   |
+ |      1 |  Hex | `0[xX]` | `[\da-fA-F]+` |
+ |      2 |  Bin | `0[bB]` | `[01]+`    |
+ |      3 |  Oct | `0[oO]` | `[0-7]+`   |
  
  See also:
     *   `INT_BIN_MAG_RXS`
@@ -563,9 +572,9 @@ r"""
 *   Octal:
     *   `0o` followed by octal digits (`0-7`)
     *   e.g.: `0o123`, `0O4567`, `0o01234567`, etc.
-*   Usage: `re.compile(INT_NON_DEC_RXS, flags=re.IGNORECASE)`
+*   Usage: `re.compile(INT_NON_DEC_RXS)`
 
-### Pattern: `[+-]?(?:0x[\da-f]+|0b[01]+|0o[0-7]+)`
+### Pattern: `[+-]?(?:0[xX][\da-fA-F]+|0[bB][01]+|0[oO][0-7]+)`
 
 #### Signed Non-Decimal Integer Regex Structure:
 
@@ -577,9 +586,9 @@ r"""
 
 | Option | Base | Prefix | Digits     |
 |-------:|:----:|-------:|:-----------|
-|      1 |  Hex |   `0x` | `[\da-f]+` |
-|      2 |  Bin |   `0b` | `[01]+`    |
-|      3 |  Oct |   `0o` | `[0-7]+`   |
+|      1 |  Hex | `0[xX]` | `[\da-fA-F]+` |
+|      2 |  Bin | `0[bB]` | `[01]+`    |
+|      3 |  Oct | `0[oO]` | `[0-7]+`   |
 
 See also:
     *   `INT_NON_DEC_MAG_RXS`
@@ -587,7 +596,7 @@ See also:
     *   `INT_RXS`, `INT_RGX`
 """
 
-INT_NON_DEC_RGX: Final[Pattern] = compile(rf"^\s*{INT_NON_DEC_RXS}\s*$", flags=IGNORECASE)
+INT_NON_DEC_RGX: Final[Pattern] = compile(rf"^\s*{INT_NON_DEC_RXS}\s*$", flags=ASCII)
 r"""
 ### Signed Non-Decimal Integer Regex String
 
@@ -603,7 +612,7 @@ r"""
     *   e.g.: `0o123`, `0O4567`, `0o01234567`, etc.
 *   Usage: INT_NON_DEC_RGX.match("0x1a")
 
-### Pattern: `^\s*[+-]?(?:0x[\da-f]+|0b[01]+|0o[0-7]+)\s*$`
+### Pattern: `^\s*[+-]?(?:0[xX][\da-fA-F]+|0[bB][01]+|0[oO][0-7]+)\s*$`
 
 #### Signed Non-Decimal Integer Regex Structure:
 
@@ -615,9 +624,9 @@ r"""
 
 | Option | Base | Prefix | Digits     |
 |-------:|:----:|-------:|:-----------|
-|      1 |  Hex |   `0x` | `[\da-f]+` |
-|      2 |  Bin |   `0b` | `[01]+`    |
-|      3 |  Oct |   `0o` | `[0-7]+`   |
+|      1 |  Hex | `0[xX]` | `[\da-fA-F]+` |
+|      2 |  Bin | `0[bB]` | `[01]+`    |
+|      3 |  Oct | `0[oO]` | `[0-7]+`   |
 
 See also:
     *   `INT_NON_DEC_RXS`
@@ -639,18 +648,18 @@ r"""
     *   e.g.: `0dec10`, `0B1101`, `0b1110`, etc.
 *   Octal:
     *   e.g.: `0o123`, `0O4567`, `0o01234567`, etc.
-*   Usage: `re.compile(INT_MAG_RXS, flags=re.IGNORECASE)`
+*   Usage: `re.compile(INT_MAG_RXS)`
 
-### Pattern: `\d+|0x[\da-f]+|0b[01]+|0o[0-7]+`
+### Pattern: `\d+|0[xX][\da-fA-F]+|0[bB][01]+|0[oO][0-7]+`
 
 #### Integer Option Series: `...|...`
 
 | Option | Base | Prefix | Digits     | Description         |
 |-------:|-----:|-------:|:-----------|:--------------------|
 |      1 |  Dec |        | `\d+`      | Decimal Integer     |
-|      2 |  Hex |   `0x` | `[\da-f]+` | Hexadecimal Integer |
-|      3 |  Bin |   `0b` | `[01]+`    | Binary Integer      |
-|      4 |  Oct |   `0o` | `[0-7]+`   | Octal Integer       |
+|      2 |  Hex | `0[xX]` | `[\da-fA-F]+` | Hexadecimal Integer |
+|      3 |  Bin | `0[bB]` | `[01]+`    | Binary Integer      |
+|      4 |  Oct | `0[oO]` | `[0-7]+`   | Octal Integer       |
 
 See also:
     *   `INT_DEC_MAG_RXS`
@@ -671,9 +680,9 @@ r"""
     *   e.g.: `0b0`, `+0B0`, `-0b0`, `0B1`, `+0dec`, `-0B1011`, `0b11010110`, etc.
 *   Octal:
     *   e.g.: `0o0`, `+0O0`, `-0o0`, `0O1`, `+0o7`, `-0O23`, `0o4567`, `+0O01234567`, etc.
-*   Usage: `re.compile(INT_RXS, flags=re.IGNORECASE)`
+*   Usage: `re.compile(INT_RXS)`
 
-### Pattern: `[+-]?(?:\d+|0x[\da-f]+|0b[01]+|0o[0-7]+)`
+### Pattern: `[+-]?(?:\d+|0[xX][\da-fA-F]+|0[bB][01]+|0[oO][0-7]+)`
 
 #### Signed Integer Regex Structure:
 |   Sign? | Options        |
@@ -685,16 +694,16 @@ r"""
 | Option | Base | Prefix | Digits     | Description         |
 |-------:|-----:|-------:|:-----------|:--------------------|
 |      1 |  Dec |        | `\d+`      | Decimal Integer     |
-|      2 |  Hex |   `0x` | `[\da-f]+` | Hexadecimal Integer |
-|      3 |  Bin |   `0b` | `[01]+`    | Binary Integer      |
-|      4 |  Oct |   `0o` | `[0-7]+`   | Octal Integer       |
+|      2 |  Hex | `0[xX]` | `[\da-fA-F]+` | Hexadecimal Integer |
+|      3 |  Bin | `0[bB]` | `[01]+`    | Binary Integer      |
+|      4 |  Oct | `0[oO]` | `[0-7]+`   | Octal Integer       |
 
 See also:
     *   `INT_MAG_RXS`
     *   `INT_RGX
 """
 
-INT_RGX: Final[Pattern] = compile(rf"^\s*{INT_RXS}\s*$", flags=IGNORECASE)
+INT_RGX: Final[Pattern] = compile(rf"^\s*{INT_RXS}\s*$", flags=ASCII)
 r"""
 ### Signed Integer Regex Pattern
 
@@ -709,7 +718,7 @@ r"""
     *   e.g.: `0o0`, `+0O0`, `-0o0`, `0O1`, `+0o7`, `-0O23`, `0o4567`, `+0O01234567`, etc.
 *   Usage: INT_RGX.match("0x1a")
 
-### Pattern: `^\s*[+-]?(?:\d+|0x[\da-f]+|0b[01]+|0o[0-7]+)\s*$`
+### Pattern: `^\s*[+-]?(?:\d+|0[xX][\da-fA-F]+|0[bB][01]+|0[oO][0-7]+)\s*$`
 
 #### Signed Integer Regex Structure:
 
@@ -722,9 +731,9 @@ r"""
 | Option | Base | Prefix | Digits     | Description         |
 |-------:|-----:|-------:|:-----------|:--------------------|
 |      1 |  Dec |        | `\d+`      | Decimal Integer     |
-|      2 |  Hex |   `0x` | `[\da-f]+` | Hexadecimal Integer |
-|      3 |  Bin |   `0b` | `[01]+`    | Binary Integer      |
-|      4 |  Oct |   `0o` | `[0-7]+`   | Octal Integer       |
+|      2 |  Hex | `0[xX]` | `[\da-fA-F]+` | Hexadecimal Integer |
+|      3 |  Bin | `0[bB]` | `[01]+`    | Binary Integer      |
+|      4 |  Oct | `0[oO]` | `[0-7]+`   | Octal Integer       |
 
 See also: `INT_RXS`
 """
@@ -756,7 +765,7 @@ See also:
     *   `REAL_SCINOT_OPT_RXS`, `REAL_SCINOT_OPT_RGX`
 """
 
-REAL_SCINOT_EXP_RXS: Final[str] = r"e[+-]?\d+"
+REAL_SCINOT_EXP_RXS: Final[str] = r"[eE][+-]?\d+"
 r"""
 ### Scientific Notation Exponent Regex String
 
@@ -766,9 +775,9 @@ r"""
     *   Optional Sign (`+` or `-`)
     *   Integer Exponent Value
 *   e.g.: `e0`, `e+0`, `e-0`, `e1`, `e+2`, `e-3`, `e456`, etc.
-*   Usage: `re.compile(REAL_SCINOT_EXP_RXS, flags=re.IGNORECASE)`
+*   Usage: `re.compile(REAL_SCINOT_EXP_RXS)`
 
-### Pattern: `e[+-]?\d+`
+### Pattern: `[eE][+-]?\d+`
 
 #### Exponent Regex Structure:
 
@@ -781,7 +790,7 @@ See also:
     *   `REAL_BSC_MAG_RXS`
 """
 
-REAL_SPEC_RXS: Final[str] = r"inf(?:inity)?|nan"
+REAL_SPEC_RXS: Final[str] = r"[iI][nN][fF](?:[iI][nN][iI][tT][yY])?|[nN][aA][nN]"
 r"""
 ### Special Real Regex String
 
@@ -789,16 +798,15 @@ r"""
 *   Values: `inf`, `infinity`, `nan`
 *   Notes:
     *   Used to build other regex strings
-    *   Compile this regex string with the `IGNORECASE` flag
 
-### Pattern: `inf(?:inity)?|nan`
+### Pattern: `[iI][nN][fF](?:[iI][nN][iI][tT][yY])?|[nN][aA][nN]`
 
 #### Special Real Values Option Series: `...|...`
 
 | Option |      Regex      |  Body | Suffix? | Description  |
 |-------:|-----------------|------:|:--------|:-------------|
-|      1 | `inf(?:inity)?` | `inf` | `inity` | Infinity     |
-|      2 | `nan`           | `nan` |         | Not a Number |
+|      1 | `[iI][nN][fF](?:[iI][nN][iI][tT][yY])?` | `inf` | `inity` | Infinity     |
+|      2 | `[nN][aA][nN]`         | `nan` |         | Not a Number |
 
 <small>\*: Optional Suffix is Non-Capturing</small>
 """
@@ -812,9 +820,9 @@ r"""
 *   Optional Exponent Sign (`+` or `-`)
 *   Does not include special values (e.g. `inf`, `nan`)
 *   e.g.: `0.0e0`, `1.2e+3`, `4.e-5`, `.6e7`, `89e+10`, etc.
-*   Usage: `re.compile(REAL_MAG_SCINOT_RXS, flags=re.IGNORECASE)`
+*   Usage: `re.compile(REAL_MAG_SCINOT_RXS)`
 
-### Pattern: `(?:\d+\.\d*|\.\d+|\d+)e[+-]?\d+`
+### Pattern: `(?:\d+\.\d*|\.\d+|\d+)[eE][+-]?\d+`
 
 #### Unsigned Scientific Notation Regex Structure:
 
@@ -848,9 +856,9 @@ r"""
     * `0.0`, `+0.0`, `-0.0`, `1.0`, `+23.456`, etc.
     * `0.0e0`, `+0.0e-0`, `-0.0e+0`, `1.0e+2`, `+23.456e-3`, etc.
     * `inf`, `-inf`, `infinity`, `-infinity`, `nan`
-*   Usage: `re.compile(REAL_SCINOT_RXS, flags=re.IGNORECASE)`
+*   Usage: `re.compile(REAL_SCINOT_RXS)`
 
-### Pattern: `[+-]?(?:(?:\d+\.\d*|\.\d+|\d+)e[+-]?\d+|inf(?:inity)?|nan)`
+### Pattern: `[+-]?(?:(?:\d+\.\d*|\.\d+|\d+)[eE][+-]?\d+|[iI][nN][fF](?:[iI][nN][iI][tT][yY])?|[nN][aA][nN])`
 
 #### Signed Scientific Notation Regex Structure:
 
@@ -863,8 +871,8 @@ r"""
 | Option |       Regex       | Body    | NC Suffix? | Description         |
 |-------:|-------------------|--------:|:-----------|:--------------------|
 |      1 | See Sci Not Table | Options | Exponent   | Scientific Notation |
-|      2 | `inf(?:inity)?`   |   `inf` | `inity`    | Infinity            |
-|      3 | `nan`             |   `nan` |            | Not a Number        |
+|      2 | `[iI][nN][fF](?:[iI][nN][iI][tT][yY])?`   |   `inf` | `inity`    | Infinity            |
+|      3 | `[nN][aA][nN]`           |   `nan` |            | Not a Number        |
 
 #### Signed Scientific Notation Regex Structure:
 
@@ -885,7 +893,7 @@ See also:
     *   `REAL_SCINOT_RGX`
 """
 
-REAL_SCINOT_RGX: Final[Pattern] = compile(rf"^\s*{REAL_SCINOT_RXS}\s*$", flags=IGNORECASE)
+REAL_SCINOT_RGX: Final[Pattern] = compile(rf"^\s*{REAL_SCINOT_RXS}\s*$", flags=ASCII)
 r"""
 ### Real Scientific Notation Regex Pattern
 
@@ -896,7 +904,7 @@ r"""
 *   e.g.: `0.0`, `+0.0`, `-0.0`, `1.0`, `+23.456`, `-7e+2`, `+1.0e-3`, etc.
 *   Usage: `REAL_SCINOT_RGX.match("1.0e-3")`
 
-### Pattern: `^\s*[+-]?(?:(?:\d+\.\d*|\.\d+|\d+)e[+-]?\d+|inf(?:inity)?|nan)\s*$`
+### Pattern: `^\s*[+-]?(?:(?:\d+\.\d*|\.\d+|\d+)[eE][+-]?\d+|[iI][nN][fF](?:[iI][nN][iI][tT][yY])?|[nN][aA][nN])\s*$`
 
 #### Signed Scientific Notation Regex Structure:
 | Prefix? |  Sign?  |  Sci Not Opts  | Suffix? |
@@ -908,8 +916,8 @@ r"""
 | Option |       Regex       | Body    | NC Suffix? | Description         |
 |-------:|-------------------|--------:|:-----------|:--------------------|
 |      1 | See Sci Not Table | Options | Exponent   | Scientific Notation |
-|      2 | `inf(?:inity)?`   |   `inf` | `inity`    | Infinity            |
-|      3 | `nan`             |   `nan` |            | Not a Number        |
+|      2 | `[iI][nN][fF](?:[iI][nN][iI][tT][yY])?`   |   `inf` | `inity`    | Infinity            |
+|      3 | `[nN][aA][nN]`           |   `nan` |            | Not a Number        |
 
 #### Signed Scientific Notation Regex Structure:
 
@@ -929,7 +937,7 @@ See also:
     *   `REAL_SCINOT_RXS`
 """
 
-REAL_MAG_SCINOT_OPT_DGT_RXS: Final[str] = rf"(?:{REAL_MAG_DGT_RXS}|\d+(?=e))(?:{REAL_SCINOT_EXP_RXS})?"
+REAL_MAG_SCINOT_OPT_DGT_RXS: Final[str] = rf"(?:{REAL_MAG_DGT_RXS}|\d+(?=[eE]))(?:{REAL_SCINOT_EXP_RXS})?"
 r"""
 ### Unsigned Real Number Regex String (Optional Scientific Notation)
 
@@ -942,7 +950,7 @@ r"""
 *   e.g.: `0.0`, `1.0`, `23.456`, `7e+2`, `1.0e-3`, etc.
 *   Usage: `re.compile(REAL_SCINOT_OPT_RXS)`
 
-### Pattern: `(?:\d+\.\d*|\.\d+|\d+(?=e))(?:e[+-]?\d+)?`
+### Pattern: `(?:\d+\.\d*|\.\d+|\d+(?=[eE]))(?:[eE][+-]?\d+)?`
 
 #### Unsigned Real Number Regex Structure:
 
@@ -956,7 +964,7 @@ r"""
 |-------:|------------|:---------------------------------------|
 |      1 | `\d+\.\d*` | Trailing Zero Optional                 |
 |      2 | `\.\d+`    | No Leading Zero                        |
-|      3 | `\d+(?=e)` | Integer (Scientific Notation Required) |
+|      3 | `\d+(?=[eE])` | Integer (Scientific Notation Required) |
 
 #### Optional Scientific Notation: `(?:...)?`
 
@@ -983,9 +991,9 @@ r"""
     *   Optional Exponent Sign (`+` or `-`)
 *   Does not include special values (e.g. `inf`, `nan`)
 *   e.g.: `0.0`, `+0.0`, `-0.0`, `1.0`, `+23.456`, `-7e+2`, `+1.0e-3`, etc.
-*   Usage: `re.compile(REAL_SCINOT_OPT_RXS, flags=re.IGNORECASE)`
+*   Usage: `re.compile(REAL_SCINOT_OPT_RXS)`
 
-### Pattern: `[+-]?(?:\d+\.\d*|\.\d+|\d+(?=e))(?:e[+-]?\d+)?`
+### Pattern: `[+-]?(?:\d+\.\d*|\.\d+|\d+(?=[eE]))(?:[eE][+-]?\d+)?`
 
 #### Signed Real Number Regex Structure:
 
@@ -999,7 +1007,7 @@ r"""
 |-------:|------------|:---------------------------------------|
 |      1 | `\d+\.\d*` | Trailing Zero Optional                 |
 |      2 | `\.\d+`    | No Leading Zero                        |
-|      3 | `\d+(?=e)` | Integer (Scientific Notation Required) |
+|      3 | `\d+(?=[eE])` | Integer (Scientific Notation Required) |
 
 #### Optional Scientific Notation: `(?:...)?`
 
@@ -1027,9 +1035,9 @@ r"""
 *   Supports Special Values:
     *   `inf`, `infinity`, `nan`
     *   e.g.: `inf`, `-inf`, `infinity`, `-infinity`, `nan`
-*   Usage: `re.compile(REAL_RXS, flags=re.IGNORECASE)`
+*   Usage: `re.compile(REAL_RXS)`
 
-### Pattern: `[+-]?(?:(?:\d+\.\d*|\.\d+|\d+(?=e))(?:e[+-]?\d+)?|inf(?:inity)?|nan)`
+### Pattern: `[+-]?(?:(?:\d+\.\d*|\.\d+|\d+(?=[eE]))(?:[eE][+-]?\d+)?|[iI][nN][fF](?:[iI][nN][iI][tT][yY])?|[nN][aA][nN])`
 
 #### Signed Real Regex Structure:
 
@@ -1042,8 +1050,8 @@ r"""
 | Option |       Regex        | Body    | NC Suffix? | Description  |
 |-------:|--------------------|--------:|:-----------|:-------------|
 |      1 | See Real Num Table | Options | Exponent   | Real Number  |
-|      2 | `inf(?:inity)?`    |   `inf` | `inity`    | Infinity     |
-|      3 | `nan`              |   `nan` |            | Not a Number |
+|      2 | `[iI][nN][fF](?:[iI][nN][iI][tT][yY])?`    |   `inf` | `inity`    | Infinity     |
+|      3 | `[nN][aA][nN]`            |   `nan` |            | Not a Number |
 
 #### Real Number Regex Structure:
 | Significand Opts | Sci Not?   |
@@ -1056,7 +1064,7 @@ r"""
 |-------:|------------|:---------------------------------------|
 |      1 | `\d+\.\d*` | Trailing Zero Optional                 |
 |      2 | `\.\d+`    | No Leading Zero                        |
-|      3 | `\d+(?=e)` | Integer (Scientific Notation Required) |
+|      3 | `\d+(?=[eE])` | Integer (Scientific Notation Required) |
 
 #### Optional Scientific Notation: `(?:...)?`
 
@@ -1070,7 +1078,7 @@ See also:
     *   `REAL_RGX`
 """
 
-REAL_RGX: Final[Pattern] = compile(rf"^\s*{REAL_RXS}\s*$", flags=IGNORECASE)
+REAL_RGX: Final[Pattern] = compile(rf"^\s*{REAL_RXS}\s*$", flags=ASCII)
 r"""
 ### Signed Real Regex Pattern
 
@@ -1087,7 +1095,7 @@ r"""
     *   e.g.: `inf`, `-inf`, `infinity`, `-infinity`, `nan`
 *   Usage: `REAL_RGX.match("1.0e-3")`
 
-### Pattern: `^\s*[+-]?(?:(?:\d+\.\d*|\.\d+|\d+(?=e))(?:e[+-]?\d+)?|inf(?:inity)?|nan)\s*$`
+### Pattern: `^\s*[+-]?(?:(?:\d+\.\d*|\.\d+|\d+(?=[eE]))(?:[eE][+-]?\d+)?|[iI][nN][fF](?:[iI][nN][iI][tT][yY])?|[nN][aA][nN])\s*$`
 
 #### Signed Real Regex Structure:
 
@@ -1100,8 +1108,8 @@ r"""
 | Option |       Regex        | Body    | NC Suffix? | Description  |
 |-------:|--------------------|--------:|:-----------|:-------------|
 |      1 | See Real Num Table | Options | Exponent   | Real Number  |
-|      2 | `inf(?:inity)?`    |   `inf` | `inity`    | Infinity     |
-|      3 | `nan`              |   `nan` |            | Not a Number |
+|      2 | `[iI][nN][fF](?:[iI][nN][iI][tT][yY])?`    |   `inf` | `inity`    | Infinity     |
+|      3 | `[nN][aA][nN]`            |   `nan` |            | Not a Number |
 
 #### Real Number Regex Structure:
 | Significand Opts | Sci Not?   |
@@ -1114,7 +1122,7 @@ r"""
 |-------:|------------|:---------------------------------------|
 |      1 | `\d+\.\d*` | Trailing Zero Optional                 |
 |      2 | `\.\d+`    | No Leading Zero                        |
-|      3 | `\d+(?=e)` | Integer (Scientific Notation Required) |
+|      3 | `\d+(?=[eE])` | Integer (Scientific Notation Required) |
 
 #### Optional Scientific Notation: `(?:...)?`
 
@@ -1151,7 +1159,7 @@ See also:
     *   `BOOL_EXT_RXS`, `BOOL_EXT_RGX`
 """
 
-BOOL_TRUE_RGX: Final[Pattern] = compile(rf"^\s*({BOOL_TRUE_RXS})\s*$", flags=IGNORECASE)
+BOOL_TRUE_RGX: Final[Pattern] = compile(rf"(?ai)^\s*({BOOL_TRUE_RXS})\s*$")
 r"""
 ### True Boolean Regex
 
@@ -1206,7 +1214,7 @@ See also:
     *   `BOOL_EXT_RXS`, `BOOL_EXT_RGX`
 """
 
-BOOL_TRUE_RGX: Final[Pattern] = compile(rf"^\s*({BOOL_TRUE_EXT_RXS})\s*$", flags=IGNORECASE)
+BOOL_TRUE_EXT_RGX: Final[Pattern] = compile(rf"(?ai)^\s*({BOOL_TRUE_EXT_RXS})\s*$")
 r"""
 ### True Boolean Regex Pattern
 
@@ -1216,7 +1224,7 @@ r"""
     *   YES:    `y`, `Y`, `yes`, `Yes`, `YES`, etc.
     *   ON:     `o`, `O`, `on`, `On`, `ON`, etc.
     *   ENABLE: `e`, `E`, `enable`, `Enable`, `ENABLE`, etc.
-*   Usage: `re.compile(BOOL_TRUE_EXT_RGX, flags=re.IGNORECASE)`
+*   Usage: `BOOL_TRUE_EXT_RGX.match("yes")`
 
 ### Pattern: `^\s*t(?:rue)?|y(?:es)?|on?|e(?:nable)?\s*$`
 
@@ -1266,7 +1274,7 @@ See also:
     *   `BOOL_EXT_RXS`, `BOOL_EXT_RGX`
 """
 
-BOOL_FALSE_RGX: Final[Pattern] = compile(rf"^\s*({BOOL_FALSE_RXS})\s*$", flags=IGNORECASE)
+BOOL_FALSE_RGX: Final[Pattern] = compile(rf"(?ai)^\s*({BOOL_FALSE_RXS})\s*$")
 r"""
 ### False Boolean Regex Pattern
 
@@ -1356,18 +1364,18 @@ r"""
             *   `isable`    <br/>Disable spelled out
 """
 
-BOOL_RGX: Final[Pattern] = compile(rf"^\s*({BOOL_RXS})\s*$", flags=IGNORECASE)
+BOOL_RGX: Final[Pattern] = compile(rf"(?ai)^\s*({BOOL_RXS})\s*$")
 r"""
 ### Boolean Regex
 
 *   Supports All Valid Boolean Formats
 *   Notes:
     *   This does not support 1 or 0 because they would be ambiguous with integers
-    *   Compile this regex string with the `IGNORECASE` flag
+    *   Case-insensitive, ASCII-only (inline `(?ai)` flags)
     *   Supported words: true, false, yes, no, enable, disable
 *   e.g.: `true`, `True`, `TRUE`, `false`, `False`, `FALSE`, etc.
 
-### Pattern: `^\s*(t(?:rue)?|f(?:alse)?|y(?:es)?|n(?:o)?|e(?:nable)?|d(?:isable)?)\s*$`
+### Pattern: `(?ai)^\s*(t(?:rue)?|f(?:alse)?|y(?:es)?|n(?:o)?|e(?:nable)?|d(?:isable)?)\s*$`
 
     *   `^`                     <br/>Start
     *   `\s*`                   <br/>Optional Whitespace
@@ -1396,7 +1404,9 @@ r"""
 
 ### Complex Numbers ###
 
-COMPLEX_RXS: Final[str] = rf"[+-]?(?:{__REAL_NON_SPEC_RXS})[+-]{__REAL_NON_SPEC_RXS}j"
+COMPLEX_RXS: Final[str] = (
+    rf"[+-]?(?:{REAL_MAG_SCINOT_OPT_DGT_RXS})[+-](?:{REAL_MAG_SCINOT_OPT_DGT_RXS})j"
+)
 r"""
 ### Complex Number Regex String
 
@@ -1431,7 +1441,7 @@ r"""
             *   `\d+`       <br/>Integer
         *   `j`             <br/>Imaginary Unit
 """
-COMPLEX_RGX: Final[Pattern] = compile(rf"^\s*({COMPLEX_RXS})\s*$", flags=IGNORECASE)
+COMPLEX_RGX: Final[Pattern] = compile(rf"(?ai)^\s*({COMPLEX_RXS})\s*$")
 r"""
 ### Complex Number Regex
 
@@ -1440,9 +1450,9 @@ r"""
 *   Leading Sign (optional `+` or `-`)
 *   Real and Imaginary Parts
     *   e.g.: `1+2j`, `-3.5-4.5j`, `0.0+0.0j`, `1e-3+2e+3j`, etc.
-*   Note: Compile this regex string with the `IGNORECASE` flag
+*   Note: Case-insensitive, ASCII-only (inline `(?ai)` flags)
 
-### Pattern: `^\s*([+-]?(?:\d+\.\d*|\.\d+|\d+(?=e))(?:e[+-]?\d+)?[+-](?:\d+\.\d*|\.\d+|\d+(?=e))(?:e[+-]?\d+)?j)\s*$`
+### Pattern: `(?ai)^\s*([+-]?(?:\d+\.\d*|\.\d+|\d+(?=e))(?:e[+-]?\d+)?[+-](?:\d+\.\d*|\.\d+|\d+(?=e))(?:e[+-]?\d+)?j)\s*$`
 
     *   `^`                     <br/>Start
     *   `\s*`                   <br/>Optional Whitespace
@@ -1479,7 +1489,7 @@ FRACTION_RXS: Final[str] = r"[+-]?{__BASE_REAL_NON_SPEC_RXS}/{__BASE_REAL_NON_SP
 
 ### Real Numbers ###
 
-REAL_RXS= r"[+-]?(?:(?:\d+\.\d*|\.\d+|\d+(?=e))(?:e[+-]?\d+)?|inf(?:inity)?|nan)"
+REAL_RXS= r"[+-]?(?:(?:\d+\.\d*|\.\d+|\d+(?=[eE]))(?:[eE][+-]?\d+)?|[iI][nN][fF](?:[iI][nN][iI][tT][yY])?|[nN][aA][nN])"
 r"""
 ### Real Number Regex String
 
@@ -1492,7 +1502,6 @@ r"""
 *   Special Cases:
     *   Infinity:       inf or infinity
     *   Not a Number:   nan
-*   Note: Compile this regex string with the `IGNORECASE` flag
 *   e.g.: `1.0`, `+0.2`, `-34.56`, `7.8e+0`, `-9.0E-1`, `2.3e4`, `56E67`, `inf`, `-Infinity`, `NaN`, etc.
 *   Pattern
     *   `[+-]?`                 <br/>Optional Sign
@@ -1502,7 +1511,7 @@ r"""
             *   `(?:...|...)`   <br/>Non-Capturing Option Group
                 *   `\d+\.\d*`  <br/>Real (trailing zero optional)
                 *   `\.\d+`     <br/>Real (no leading zero)
-                *   `\d+(?=e)`  <br/>Integer (only with Scientific Notation)
+                *   `\d+(?=[eE])`  <br/>Integer (only with Scientific Notation)
             *   `(?:...)?`      <br/>Optional Non-Capturing Element
                 *   `e`         <br/>Exponent Indicator
                 *   `[+-]?`     <br/>Optional Sign
@@ -1515,7 +1524,7 @@ r"""
             *   Not a Number:
                 *   `nan`       <br/>Not a Number
 """
-REAL_RGX= compile(rf"^\s*({REAL_RXS})\s*$",flags=IGNORECASE)
+REAL_RGX= compile(rf"^\s*({REAL_RXS})\s*$", flags=ASCII)
 r"""
 ### Real Number Regex
 
@@ -1528,10 +1537,9 @@ r"""
 *   Special Cases:
     *   Infinity:       inf or infinity
     *   Not a Number:   nan
-*   Note: Compile this regex string with the `IGNORECASE` flag
 *   e.g.: `1.0`, `+0.2`, `-34.56`, `7.8e+0`, `-9.0E-1`, `2.3e4`, `56E67`, `inf`, `-Infinity`, `NaN`, etc.
 
-### Pattern: `^\s*([+-]?(?:(?:\d+\.\d*|\.\d+|\d+(?=e))(?:e[+-]?\d+)?|inf(?:inity)?|nan))\s*$`
+### Pattern: `^\s*([+-]?(?:(?:\d+\.\d*|\.\d+|\d+(?=[eE]))(?:[eE][+-]?\d+)?|[iI][nN][fF](?:[iI][nN][iI][tT][yY])?|[nN][aA][nN]))\s*$`
 
     *   `^`                         <br/>Start
     *   `\s*`                       <br/>Optional Whitespace
@@ -1543,7 +1551,7 @@ r"""
                 *   `(?:...|...)`   <br/>Non-Capturing Option Group
                     *   `\d+\.\d*`  <br/>Real (trailing zero optional)
                     *   `\.\d+`     <br/>Real (no leading zero)
-                    *   `\d+(?=e)`  <br/>Integer (only with Scientific Notation)
+                    *   `\d+(?=[eE])`  <br/>Integer (only with Scientific Notation)
                 *   `(?:...)?`      <br/>Optional Non-Capturing Element
                     *   `e`         <br/>Exponent Indicator
                     *   `[+-]?`     <br/>Optional Sign
@@ -1573,7 +1581,7 @@ r"""
         *   `\d+\.\d*`  <br/>Real (trailing zero optional)
         *   `\.\d+`     <br/>Real (no leading zero)
 """
-REAL_BSC_RGX= compile(rf"^\s*({REAL_BSC_RXS})\s*$")
+REAL_BSC_RGX= compile(rf"^\s*({REAL_BSC_RXS})\s*$", flags=ASCII)
 r"""
 ### Basic Real Regex
 
@@ -1595,29 +1603,28 @@ r"""
     *   `$`             <br/>End
 """
 
-REAL_SCI_RXS= r"[+-]?(?:\d+\.?\d*|\.\d+)e[+-]?\d+"
+REAL_SCI_RXS= r"[+-]?(?:\d+\.?\d*|\.\d+)[eE][+-]?\d+"
 r"""
 ### Scientific Notation Only Regex String
 
 *   Sign (optional `+` or `-`)
 *   e.g.: `0.0e+1`, `1.0E-2`, `2.3e4`, `56E67`, etc.
-*   Note: Compile this regex string with the `IGNORECASE` flag
 *   Pattern
     *   `[+-]?`         <br/>Optional Sign
     *   Real or Integer
     *   `(?:...|...)`   <br/>Non-Capturing Option Group
         *   `\d+\.?\d*` <br/>Integer or Real (trailing zero optional)
         *   `\.\d+`     <br/>Real (no leading zero)
-    *   `e[+-]?\d+`     <br/>Scientific Notation
+    *   `[eE][+-]?\d+`     <br/>Scientific Notation
 """
-REAL_SCI_RGX= compile(rf"^\s*({REAL_SCI_RXS})\s*$",flags=IGNORECASE)
+REAL_SCI_RGX= compile(rf"^\s*({REAL_SCI_RXS})\s*$", flags=ASCII)
 r"""
 ### Scientific Notation Only Regex
 
 *   Sign (optional `+` or `-`)
 *   e.g.: `0.0e+1`, `1.0E-2`, `2.3e4`, `56E67`, etc.
 
-### Pattern: `^\s*([+-]?(?:\d+\.?\d*|\.\d+)e[+-]?\d+)\s*$`
+### Pattern: `^\s*([+-]?(?:\d+\.?\d*|\.\d+)[eE][+-]?\d+)\s*$`
 
     *   `^`                 <br/>Start
     *   `\s*`               <br/>Optional Whitespace
@@ -1627,7 +1634,7 @@ r"""
         *   `(?:...|...)`   <br/>Non-Capturing Option Group
             *   `\d+\.?\d*` <br/>Integer or Real (trailing zero optional)
             *   `\.\d+`     <br/>Real (no leading zero)
-        *   `e[+-]?\d+`     <br/>Scientific Notation
+        *   `[eE][+-]?\d+`     <br/>Scientific Notation
     *   `\s*`               <br/>Optional Whitespace
     *   `$`                 <br/>End
 """
@@ -1635,7 +1642,7 @@ r"""
 
 ### Real Numbers ###
 
-REAL_RXS= r"[+-]?(?:(?:\d+\.\d*|\.\d+|\d+(?=e))(?:e[+-]?\d+)?|inf(?:inity)?|nan)"
+REAL_RXS= r"[+-]?(?:(?:\d+\.\d*|\.\d+|\d+(?=[eE]))(?:[eE][+-]?\d+)?|[iI][nN][fF](?:[iI][nN][iI][tT][yY])?|[nN][aA][nN])"
 r"""
 ### Real Number Regex String
 
@@ -1648,7 +1655,6 @@ r"""
 *   Special Cases:
     *   Infinity:       inf or infinity
     *   Not a Number:   nan
-*   Note: Compile this regex string with the `IGNORECASE` flag
 *   e.g.: `1.0`, `+0.2`, `-34.56`, `7.8e+0`, `-9.0E-1`, `2.3e4`, `56E67`, `inf`, `-Infinity`, `NaN`, etc.
 *   Pattern
     *   `[+-]?`                 <br/>Optional Sign
@@ -1658,7 +1664,7 @@ r"""
             *   `(?:...|...)`   <br/>Non-Capturing Option Group
                 *   `\d+\.\d*`  <br/>Real (trailing zero optional)
                 *   `\.\d+`     <br/>Real (no leading zero)
-                *   `\d+(?=e)`  <br/>Integer (only with Scientific Notation)
+                *   `\d+(?=[eE])`  <br/>Integer (only with Scientific Notation)
             *   `(?:...)?`      <br/>Optional Non-Capturing Element
                 *   `e`         <br/>Exponent Indicator
                 *   `[+-]?`     <br/>Optional Sign
@@ -1671,7 +1677,7 @@ r"""
             *   Not a Number:
                 *   `nan`       <br/>Not a Number
 """
-REAL_RGX= compile(rf"^\s*({REAL_RXS})\s*$",flags=IGNORECASE)
+REAL_RGX= compile(rf"^\s*({REAL_RXS})\s*$", flags=ASCII)
 r"""
 ### Real Number Regex
 
@@ -1684,10 +1690,9 @@ r"""
 *   Special Cases:
     *   Infinity:       inf or infinity
     *   Not a Number:   nan
-*   Note: Compile this regex string with the `IGNORECASE` flag
 *   e.g.: `1.0`, `+0.2`, `-34.56`, `7.8e+0`, `-9.0E-1`, `2.3e4`, `56E67`, `inf`, `-Infinity`, `NaN`, etc.
 
-### Pattern: `^\s*([+-]?(?:(?:\d+\.\d*|\.\d+|\d+(?=e))(?:e[+-]?\d+)?|inf(?:inity)?|nan))\s*$`
+### Pattern: `^\s*([+-]?(?:(?:\d+\.\d*|\.\d+|\d+(?=[eE]))(?:[eE][+-]?\d+)?|[iI][nN][fF](?:[iI][nN][iI][tT][yY])?|[nN][aA][nN]))\s*$`
 
     *   `^`                         <br/>Start
     *   `\s*`                       <br/>Optional Whitespace
@@ -1699,7 +1704,7 @@ r"""
                 *   `(?:...|...)`   <br/>Non-Capturing Option Group
                     *   `\d+\.\d*`  <br/>Real (trailing zero optional)
                     *   `\.\d+`     <br/>Real (no leading zero)
-                    *   `\d+(?=e)`  <br/>Integer (only with Scientific Notation)
+                    *   `\d+(?=[eE])`  <br/>Integer (only with Scientific Notation)
                 *   `(?:...)?`      <br/>Optional Non-Capturing Element
                     *   `e`         <br/>Exponent Indicator
                     *   `[+-]?`     <br/>Optional Sign
@@ -1729,7 +1734,7 @@ r"""
         *   `\d+\.\d*`  <br/>Real (trailing zero optional)
         *   `\.\d+`     <br/>Real (no leading zero)
 """
-REAL_BSC_RGX= compile(rf"^\s*({FLT_BSC_RXS})\s*$")
+REAL_BSC_RGX= compile(rf"^\s*({REAL_BSC_RXS})\s*$", flags=ASCII)
 r"""
 ### Basic Real Regex
 
@@ -1751,29 +1756,28 @@ r"""
     *   `$`             <br/>End
 """
 
-REAL_SCI_RXS= r"[+-]?(?:\d+\.?\d*|\.\d+)e[+-]?\d+"
+REAL_SCI_RXS= r"[+-]?(?:\d+\.?\d*|\.\d+)[eE][+-]?\d+"
 r"""
 ### Scientific Notation Only Regex String
 
 *   Sign (optional `+` or `-`)
 *   e.g.: `0.0e+1`, `1.0E-2`, `2.3e4`, `56E67`, etc.
-*   Note: Compile this regex string with the `IGNORECASE` flag
 *   Pattern
     *   `[+-]?`         <br/>Optional Sign
     *   Real or Integer
     *   `(?:...|...)`   <br/>Non-Capturing Option Group
         *   `\d+\.?\d*` <br/>Integer or Real (trailing zero optional)
         *   `\.\d+`     <br/>Real (no leading zero)
-    *   `e[+-]?\d+`     <br/>Scientific Notation
+    *   `[eE][+-]?\d+`     <br/>Scientific Notation
 """
-REAL_SCI_RGX= compile(rf"^\s*({REAL_SCI_RXS})\s*$",flags=IGNORECASE)
+REAL_SCI_RGX= compile(rf"^\s*({REAL_SCI_RXS})\s*$", flags=ASCII)
 r"""
 ### Scientific Notation Only Regex
 
 *   Sign (optional `+` or `-`)
 *   e.g.: `0.0e+1`, `1.0E-2`, `2.3e4`, `56E67`, etc.
 
-### Pattern: `^\s*([+-]?(?:\d+\.?\d*|\.\d+)e[+-]?\d+)\s*$`
+### Pattern: `^\s*([+-]?(?:\d+\.?\d*|\.\d+)[eE][+-]?\d+)\s*$`
 
     *   `^`                 <br/>Start
     *   `\s*`               <br/>Optional Whitespace
@@ -1783,14 +1787,21 @@ r"""
         *   `(?:...|...)`   <br/>Non-Capturing Option Group
             *   `\d+\.?\d*` <br/>Integer or Real (trailing zero optional)
             *   `\.\d+`     <br/>Real (no leading zero)
-        *   `e[+-]?\d+`     <br/>Scientific Notation
+        *   `[eE][+-]?\d+`     <br/>Scientific Notation
     *   `\s*`               <br/>Optional Whitespace
     *   `$`                 <br/>End
 """
 
 ### Generic Numbers ###
 
-NUM_RXS: Final[str] = r"[+-]?(?:(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?|0(?:x[\da-f]+|b[01]+|o[0-7]+)|inf(?:inity)?|nan)"
+NUM_RXS: Final[str] = (
+    r"[+-]?(?:"
+    r"(?P<hex>0[xX][\da-fA-F]+)|(?P<bin>0[bB][01]+)|(?P<oct>0[oO][0-7]+)"
+    r"|(?P<real>(?:\d+\.\d*|\.\d+|\d+(?=[eE]))(?:[eE][+-]?\d+)?)"
+    r"|(?P<dec>\d+)"
+    r"|(?P<spec>[iI][nN][fF](?:[iI][nN][iI][tT][yY])?|[nN][aA][nN])"
+    r")"
+)
 r"""
 ### Number Regex String
 
@@ -1803,80 +1814,216 @@ r"""
     *   Hexadecimal:    `0x` followed by hex digits (`0-9`, `a-f`)
         *   e.g.: `0x1a`, `0X2F`, `0x3b`, etc.
     *   Binary:         `0b` followed by binary digits (`0-1`)
-        *   e.g.: `0dec10`, `0B1101`, `0b1110`, etc.
+        *   e.g.: `0b10`, `0B1101`, `0b1110`, etc.
     *   Octal:          `0o` followed by octal digits (`0-7`)
         *   e.g.: `0o12`, `0O34`, `0o56`, etc.
 *   Special Cases:
     *   Infinity:       inf or infinity
     *   Not a Number:   nan
-*   Note: Compile this regex string with the `IGNORECASE` flag
+*   Note: Contains named groups, so it can only be embedded once per pattern
 *   Pattern
-    *   `[+-]?`                     <br/>Optional Sign
-    *   Real or Integer
-    *   `(?:...|...)`               <br/>Non-Capturing Option Group
-        *   If Real or Base-10 Integer:
-            *   `(?:...|...)`       <br/>Non-Capturing Option Group
-                *   `\d+\.?\d*`     <br/>Integer or Real (trailing zero optional)
-                *   `\.\d+`         <br/>Real (no leading zero)
-                *   `(?:...)?`      <br/>Optional Non-Capturing Element
-                    *   `e[+-]?\d+` <br/>Scientific Notation
-        *   If Non-Decimal Bases:
-            *   `0`                 <br/>Leading Zero
-            *   `(?:...|...)`       <br/>Non-Capturing Option Group
-                *   `x[\da-f]+`     <br/>Hexadecimal
-                *   `b[01]+`        <br/>Binary
-                *   `o[0-7]+`       <br/>Octal
-        *   Special Cases:
-            *   Infinity:           <br/>`inf` or `infinity`
-            *   Not a Number:       <br/>`nan`
-"""
-NUM_RGX: Final[Pattern] = compile(rf"^\s*({NUM_RXS})\s*$", flags=IGNORECASE)
+    *   `[+-]?`                             <br/>Optional Sign
+    *   `(?:...|...)`                       <br/>Non-Capturing Option Group
+        *   `(?P<hex>0[xX][\da-fA-F]+)`           <br/>Hexadecimal Integer
+        *   `(?P<bin>0[bB][01]+)`              <br/>Binary Integer
+        *   `(?P<oct>0[oO][0-7]+)`             <br/>Octal Integer
+        *   `(?P<real>...)`                 <br/>Real
+            *   `(?:...|...|...)`           <br/>Non-Capturing Option Group
+                *   `\d+\.\d*`              <br/>Real (trailing zero optional)
+                *   `\.\d+`                 <br/>Real (no leading zero)
+                *   `\d+(?=[eE])`              <br/>Integer (only if followed by an exponent)
+            *   `(?:[eE][+-]?\d+)?`            <br/>Optional Scientific Notation
+        *   `(?P<dec>\d+)`                  <br/>Decimal Integer
+        *   `(?P<spec>[iI][nN][fF](?:[iI][nN][iI][tT][yY])?|[nN][aA][nN])`   <br/>Special Cases
+"""
+
+NUM_RGX: Final[Pattern] = compile(rf"^\s*{NUM_RXS}\s*$", flags=ASCII)
 r"""
 ### Number Regex
 
-*   Sign (optional `+` or `-`)
-*   Basic Floats or Integer
-    *   e.g.: `1`, `+2`, `-3`, `0`, `+0`, `-0`, `45`, `6.0`, `+7.8`, `-9.0`, `0.0`, `0.1`, `23.`, `.45`, etc.
-*   Scientific Notation Supported
-    *   e.g.: `0.0e+1`, `1.0E-2`, `2.3e4`, `56E67`, etc.
-*   Non-Decimal Bases Supported:
-    *   Hexadecimal:    `0x` followed by hex digits (`0-9`, `a-f`)
-        *   e.g.: `0x1a`, `0X2F`, `0x3b`, etc.
-    *   Binary:         `0b` followed by binary digits (`0-1`)
-        *   e.g.: `0dec10`, `0B1101`, `0b1110`, etc.
-    *   Octal:          `0o` followed by octal digits (`0-7`)
-        *   e.g.: `0o12`, `0O34`, `0o56`, etc.
-*   Special Cases:
-    *   Infinity:       inf or infinity
-    *   Not a Number:   nan
+*   Matches every number format in a single pass.
+*   The kind of number matched is given by `match.lastgroup`:
 
-### Pattern: `^\s*([+-]?(?:(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?|0(?:x[\da-f]+|b[01]+|o[0-7]+)|inf(?:inity)?|nan))\s*$`
+| `lastgroup` | Kind                                 |
+|:-----------:|:-------------------------------------|
+|   `"hex"`   | Hexadecimal Integer                  |
+|   `"bin"`   | Binary Integer                       |
+|   `"oct"`   | Octal Integer                        |
+|  `"real"`   | Real (basic or scientific notation)  |
+|   `"dec"`   | Decimal Integer                      |
+|  `"spec"`   | Special Real (`inf`, `nan`)          |
 
-    *   `^`                             <br/>Start
-    *   `\s*`                           <br/>Optional Whitespace
-    0.  `(...)`                         <br/>Capture Group 0
-        *   `[+-]?`                     <br/>Optional Sign
-        *   Real or Integer
-        *   `(?:...|...)`               <br/>Non-Capturing Option Group
-            *   If Real or Base-10 Integer:
-                *   `(?:...|...)`       <br/>Non-Capturing Option Group
-                    *   `\d+\.?\d*`     <br/>Integer or Real (trailing zero optional)
-                    *   `\.\d+`         <br/>Real (no leading zero)
-                    *   `(?:...)?`      <br/>Optional Non-Capturing Element
-                        *   `e[+-]?\d+` <br/>Scientific Notation
-            *   If Non-Decimal Bases:
-                *   `0`                 <br/>Leading Zero
-                *   `(?:...|...)`       <br/>Non-Capturing Option Group
-                    *   `x[\da-f]+`     <br/>Hexadecimal
-                    *   `b[01]+`        <br/>Binary
-                    *   `o[0-7]+`       <br/>Octal
-            *   Special Cases:
-                *   Infinity:           <br/>`inf` or `infinity`
-                *   Not a Number:       <br/>`nan`
-    *   `\s*`                           <br/>Optional Whitespace
-    *   `$`                             <br/>End
+*   Usage: `NUM_RGX.match(" -0x1F ").lastgroup == "hex"`
+
+### Pattern: `^\s*[+-]?(?:(?P<hex>...)|(?P<bin>...)|(?P<oct>...)|(?P<real>...)|(?P<dec>...)|(?P<spec>...))\s*$`
+
+    *   `^`                 <br/>Start
+    *   `\s*`               <br/>Optional Whitespace
+    *   `NUM_RXS`           <br/>Number (see `NUM_RXS`)
+    *   `\s*`               <br/>Optional Whitespace
+    *   `$`                 <br/>End
 """
 
+_NUM_CORE_RGX: Final[Pattern] = compile(rf"\s*{NUM_RXS}\s*", flags=ASCII)
+"""### `NUM_RGX` without its anchors, for `fullmatch` in `to_number_str`"""
+
+_NUM_REAL_GROUPS: Final[frozenset] = frozenset(("real", "spec"))
+"""### `NUM_RGX` Groups for Real Numbers"""
+
+########## Scanners ##########
+
+# The predicates below are hot (config parsing calls them once per token), and the grammars are
+# small enough that a hand-written state machine beats a regex match on every call.
+# The `*_RGX` constants above are kept as the documented reference for these grammars.
+
+_DEC_DIGITS: Final[str] = "0123456789"
+"""### Decimal (Base-10) Digits"""
+
+_ASCII_SPACES: Final[str] = " \t\n\r\f\v"
+r"""### ASCII Whitespace (what `\s` matches in the `ASCII` patterns)"""
+
+_INT_PREFIX_BASES: Final[dict] = {
+    "b": ( 2, "01"),
+    "B": ( 2, "01"),
+    "o": ( 8, "01234567"),
+    "O": ( 8, "01234567"),
+    "x": (16, "0123456789abcdefABCDEF"),
+    "X": (16, "0123456789abcdefABCDEF"),
+}
+"""### Non-Decimal Integer Prefix Character to `(base, digits)`"""
+
+_NON_DEC_PREFIXES: Final[tuple] = ("0b", "0B", "0o", "0O", "0x", "0X")
+"""### Non-Decimal Integer Prefixes"""
+
+_REAL_SPEC_WORDS: Final[frozenset] = frozenset(("inf", "infinity", "nan"))
+"""### Special Real Values (lowercase)"""
+
+_NUMERIC_CHARS_DELETE: Final[dict] = str.maketrans(
+    "", "", f"0123456789abcdefABCDEF+-.xXoOiInNtTyY{_ASCII_SPACES}",
+)
+"""### Translation Table Deleting Every Character That Can Appear in a Number String"""
+
+# Real Number Scanner States #
+_ST_START:   Final[int] = 0 # After the optional sign
+_ST_INT:     Final[int] = 1 # In the integer part:          `\d+`
+_ST_POINT:   Final[int] = 2 # Point with no integer part:   `\.`
+_ST_FRAC:    Final[int] = 3 # In the fractional part:       `\d+\.\d*` or `\.\d+`
+_ST_EXP:     Final[int] = 4 # After the exponent marker:    `e`
+_ST_EXP_SGN: Final[int] = 5 # After the exponent sign:      `e[+-]`
+_ST_EXP_DGT: Final[int] = 6 # In the exponent digits:       `e[+-]?\d+`
+_ST_REJECT:  Final[int] = -1
+
+# Real Number Scanner Character Classes #
+_CC_DGT: Final[int] = 0 # `\d`
+_CC_PNT: Final[int] = 1 # `\.`
+_CC_EXP: Final[int] = 2 # `e`
+_CC_SGN: Final[int] = 3 # `[+-]`
+
+_REAL_CHAR_CLASSES: Final[dict] = {
+    **{c: _CC_DGT for c in "0123456789"},
+    ".": _CC_PNT,
+    "e": _CC_EXP,
+    "E": _CC_EXP,
+    "+": _CC_SGN,
+    "-": _CC_SGN,
+}
+"""### Character to Real Number Scanner Character Class"""
+
+_REAL_TRANSITIONS: Final[tuple] = (
+    #  Digit         Point        Exponent     Sign
+    (_ST_INT,     _ST_POINT,  _ST_REJECT, _ST_REJECT ), # _ST_START
+    (_ST_INT,     _ST_FRAC,   _ST_EXP,    _ST_REJECT ), # _ST_INT
+    (_ST_FRAC,    _ST_REJECT, _ST_REJECT, _ST_REJECT ), # _ST_POINT
+    (_ST_FRAC,    _ST_REJECT, _ST_EXP,    _ST_REJECT ), # _ST_FRAC
+    (_ST_EXP_DGT, _ST_REJECT, _ST_REJECT, _ST_EXP_SGN), # _ST_EXP
+    (_ST_EXP_DGT, _ST_REJECT, _ST_REJECT, _ST_REJECT ), # _ST_EXP_SGN
+    (_ST_EXP_DGT, _ST_REJECT, _ST_REJECT, _ST_REJECT ), # _ST_EXP_DGT
+)
+"""### Real Number Scanner Transition Table: `_REAL_TRANSITIONS[state][char_class]`"""
+
+# Real Number Scanner Results #
+_REAL_NONE:   Final[int] = 0 # Not a number
+_REAL_INT:    Final[int] = 1 # Decimal integer:             `[+-]?\d+`
+_REAL_BASIC:  Final[int] = 2 # Basic real:                  `REAL_BSC_RXS`
+_REAL_SCINOT: Final[int] = 3 # Scientific notation real:    `REAL_SCI_RXS`
+_REAL_SPEC:   Final[int] = 4 # Special real:                `inf`, `infinity`, `nan`
+
+_REAL_ACCEPT: Final[tuple] = (
+    _REAL_NONE,     # _ST_START
+    _REAL_INT,      # _ST_INT
+    _REAL_NONE,     # _ST_POINT
+    _REAL_BASIC,    # _ST_FRAC
+    _REAL_NONE,     # _ST_EXP
+    _REAL_NONE,     # _ST_EXP_SGN
+    _REAL_SCINOT,   # _ST_EXP_DGT
+)
+"""### Real Number Scanner Final State to Result"""
+
+def _span(num: str) -> tuple[int, int]:
+    """
+    Find the bounds of the unsigned body of a numeric string.
+    Skips surrounding ASCII whitespace and a single leading sign.
+
+    Args:
+        num (str): The string to scan.
+
+    Returns:
+        tuple[int, int]: The start (after any sign) and end indices of the body.
+    """
+    end   = len(num.rstrip(_ASCII_SPACES))
+    start = len(num) - len(num.lstrip(_ASCII_SPACES)) if end else 0
+    if start < end and (num[start] == "+" or num[start] == "-"):
+        start += 1
+    return start, end
+
+def _scan_int(num: str) -> int:
+    """
+    Scan a string against the integer grammar (`INT_RXS`).
+
+    Args:
+        num (str): The string to scan.
+
+    Returns:
+        int: The base of the integer (`2`, `8`, `10`, or `16`), or `0` if it is not an integer.
+    """
+    i, end = _span(num)
+    if i >= end:
+        return 0
+    base, digits = 10, _DEC_DIGITS
+    if num[i] == "0" and i + 1 < end and num[i + 1] in _INT_PREFIX_BASES:
+        base, digits = _INT_PREFIX_BASES[num[i + 1]]
+        i += 2
+        if i >= end:
+            return 0
+    # Let `str.strip` run the digit loop in C: only valid digits leave nothing behind.
+    return 0 if num[i:end].strip(digits) else base
+
+def _scan_real(num: str) -> int:
+    """
+    Scan a string against the real number grammars (`REAL_RXS`, `REAL_BSC_RXS`, `REAL_SCI_RXS`).
+
+    Args:
+        num (str): The string to scan.
+
+    Returns:
+        int: One of `_REAL_NONE`, `_REAL_INT`, `_REAL_BASIC`, `_REAL_SCINOT`, or `_REAL_SPEC`.
+    """
+    i, end = _span(num)
+    if i >= end:
+        return _REAL_NONE
+    if num[i] in "iInN":
+        return _REAL_SPEC if num[i:end].lower() in _REAL_SPEC_WORDS else _REAL_NONE
+    state = _ST_START
+    while i < end:
+        char_class = _REAL_CHAR_CLASSES.get(num[i])
+        if char_class is None:
+            return _REAL_NONE
+        state = _REAL_TRANSITIONS[state][char_class]
+        if state == _ST_REJECT:
+            return _REAL_NONE
+        i += 1
+    return _REAL_ACCEPT[state]
+
 ########## Functions ##########
 
 def to_real_str(num: Union[Number, str]) -> str:
@@ -1919,12 +2066,55 @@ def to_number_str(num: Union[Number, str]) -> str:
     Returns:
         str: The toted_str number.
     """
-    if is_real(num):
+    if isinstance(num, str):
+        match = _NUM_CORE_RGX.fullmatch(num)
+        kind  = match.lastgroup if match is not None else None
+        if kind in _NUM_REAL_GROUPS:
+            return to_real_str(num)
+        elif kind == "dec":
+            return to_int_str(num)
+        elif kind is not None:
+            return str(int(num, 0))
+    elif isinstance(num, float):
         return to_real_str(num)
-    elif is_int(num):
+    elif type(num) == int:
         return to_int_str(num)
-    else:
-        raise ValueError(f"Invalid number: {num}")
+    raise ValueError(f"Invalid number: {num}")
+
+def format_number(num: Union[Number, str]) -> str:
+    """
+    Format a number compactly.
+    Integers and integral floats are written without a decimal point (e.g. `2.0` -> `2`),
+    everything else uses the default `str` representation.
+
+    Args:
+        num (Union[Number, str]): The number to format.
+
+    Returns:
+        str: The formatted number.
+    """
+    num_type = type(num)
+    if num_type is int:
+        return str(num)
+    if num_type is str:
+        num      = to_number(num)
+        num_type = type(num)
+    if num_type is float and num.is_integer():
+        return str(int(num))
+    return str(num)
+
+def format_numbers(nums: Iterable[Union[Number, str]]) -> list[str]:
+    """
+    Format many numbers compactly.
+    Equivalent to `[format_number(num) for num in nums]`.
+
+    Args:
+        nums (Iterable[Union[Number, str]]): The numbers to format.
+
+    Returns:
+        list[str]: The formatted numbers, in order.
+    """
+    return list(map(format_number, nums))
 
 def is_real(num: Union[Number, str]) -> bool:
     """
@@ -1948,7 +2138,7 @@ def is_real_str(num: str) -> bool:
     Returns:
         bool: True if the string represents a float number, False otherwise.
     """
-    return isinstance(num, str) and REAL_RGX.match(num)is not None
+    return isinstance(num, str) and _scan_real(num) > _REAL_INT
 
 def is_real_basic(num: str) -> bool:
     """
@@ -1960,7 +2150,7 @@ def is_real_basic(num: str) -> bool:
     Returns:
         bool: True if the string represents a basic float number, False otherwise.
     """
-    return REAL_BSC_RGX.match(num)is not None
+    return _scan_real(num) == _REAL_BASIC
 
 def is_real_scinot(num: str) -> bool:
     """
@@ -1972,7 +2162,8 @@ def is_real_scinot(num: str) -> bool:
     Returns:
         bool: True if the string represents a scientific notation number, False otherwise.
     """
-    return REAL_SCI_RGX.match(num)is not None
+    # No exponent marker means no scientific notation; skip the scan.
+    return ("e" in num or "E" in num) and _scan_real(num) == _REAL_SCINOT
 
 def is_real_in_to_scinot_range_str(num: Union[Number, str]) -> bool:
     """
@@ -2015,7 +2206,7 @@ def is_int_str(num: str) -> bool:
     Returns:
         bool: True if the string represents an integer number, False otherwise.
     """
-    return INT_RGX.match(num) is not None
+    return _scan_int(num) != 0
 
 def is_int_dec(num: str) -> bool:
     """
@@ -2027,7 +2218,7 @@ def is_int_dec(num: str) -> bool:
     Returns:
         bool: True if the string represents a decimal integer number, False otherwise.
     """
-    return INT_DEC_RGX.match(num) is not None
+    return _scan_int(num) == 10
 
 def is_int_bin(num: str) -> bool:
     """
@@ -2039,7 +2230,7 @@ def is_int_bin(num: str) -> bool:
     Returns:
         bool: True if the string represents a binary integer number, False otherwise.
     """
-    return INT_BIN_RGX.match(num) is not None
+    return _scan_int(num) == 2
 
 def is_int_hex(num: str) -> bool:
     """
@@ -2051,7 +2242,7 @@ def is_int_hex(num: str) -> bool:
     Returns:
         bool: True if the string represents a hexadecimal integer number, False otherwise.
     """
-    return INT_HEX_RGX.match(num) is not None
+    return _scan_int(num) == 16
 
 def is_int_oct(num: str) -> bool:
     """
@@ -2063,7 +2254,22 @@ def is_int_oct(num: str) -> bool:
     Returns:
         bool: True if the string represents an octal integer number, False otherwise.
     """
-    return INT_OCT_RGX.match(num) is not None
+    return _scan_int(num) == 8
+
+def is_int_non_dec(num: str) -> bool:
+    """
+    Determine if the passed string represents a non-decimal (binary, octal, or hexadecimal) integer.
+
+    Args:
+        num (str): The string to evaluate.
+
+    Returns:
+        bool: True if the string represents a non-decimal integer number, False otherwise.
+    """
+    body = num.lstrip(_ASCII_SPACES)
+    if body[:1] in ("+", "-"):
+        body = body[1:]
+    return body[:2] in _NON_DEC_PREFIXES and _scan_int(num) != 0
 
 def is_number(num: str) -> bool:
     """
@@ -2075,7 +2281,10 @@ def is_number(num: str) -> bool:
     Returns:
         bool: True if the string represents a number, False otherwise.
     """
-    return NUM_RGX.match(num) is not None
+    # Anything left after deleting the numeric characters can't be a number; skip both scans.
+    if num.translate(_NUMERIC_CHARS_DELETE):
+        return False
+    return _scan_real(num) != _REAL_NONE or _scan_int(num) != 0
 
 def to_float(num: Union[str, Number]) -> float:
     """
@@ -2100,10 +2309,45 @@ def to_number(num: Union[str, Number]) -> Number:
 
     Returns:
         Union[int, float]: The converted number.
-    """
-    if is_real(num):
-        return float(num)
-    elif is_int(num):
-        return int(num) if is_int_dec(num) else 
 
+    Raises:
+        ValueError: If the string does not represent a number.
+        TypeError: If the value is neither a string nor a number.
+    """
+    if not isinstance(num, str):
+        if isinstance(num, Number):
+            return num
+        raise TypeError(f"Not a number or string: {num!r}")
+    # Let the builtin parsers validate and convert in a single pass.
+    # `int(..., 0)` handles the `0b`/`0o`/`0x` prefixes but rejects zero-padded decimals.
+    # The builtins also take non-ASCII digits and `_` separators, which `is_number` rejects.
+    num = num.strip(_ASCII_SPACES)
+    if num.isascii() and "_" not in num:
+        try:
+            return int(num, 0)
+        except ValueError:
+            pass
+        if (num[1:] if num[:1] in "+-" else num).isdecimal():
+            return int(num, 10)
+        try:
+            return float(num)
+        except ValueError:
+            pass
     raise ValueError(f"Invalid number format: {num}")
+
+def to_numbers(nums: Iterable[Union[str, Number]]) -> list[Number]:
+    """
+    Convert many strings to numbers of the appropriate types (int or float).
+    Equivalent to `[to_number(num) for num in nums]`, for bulk parsing (e.g. CSV columns).
+
+    Args:
+        nums (Iterable[Union[str, Number]]): The strings to convert.
+
+    Returns:
+        list[Union[int, float]]: The converted numbers, in order.
+
+    Raises:
+        ValueError: If any string does not represent a number.
+        TypeError: If any value is neither a string nor a number.
+    """
+    return list(map(to_number, nums))
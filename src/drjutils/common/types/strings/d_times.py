@@ -36,18 +36,19 @@ def format_run_time(td: timedelta) -> str:
         >>> format_run_time(timedelta(days=1, hours=2, minutes=3, seconds=4.5))
         '1d 02h 03m 04.500s'
     """
-    days = td.days
-    hours, remainder = divmod(td.seconds, 3600)
-    minutes, seconds = divmod(remainder, 60)
-    seconds += td.microseconds / 1e6
+    days    = td.days
+    total   = td.seconds
+    hours   = total // 3600
+    minutes = (total // 60) % 60
+    # Always show seconds with 3 decimal places (milliseconds)
+    seconds = total % 60 + td.microseconds / 1e6
 
-    parts = []
+    # `%`-formatting takes a single C formatting call per string, which is cheaper than
+    # f-strings with format specs in tight logging loops.
     if days:
-        parts.append(f"{days}d")
-    if hours or days:
-        parts.append(f"{hours:02d}h")
-    if minutes or hours or days:
-        parts.append(f"{minutes:02d}m")
-    # Always show seconds with 3 decimal places (milliseconds)
-    parts.append(f"{seconds:06.3f}s")
-    return " ".join(parts)
+        return "%dd %02dh %02dm %06.3fs" % (days, hours, minutes, seconds)
+    if hours:
+        return "%02dh %02dm %06.3fs" % (hours, minutes, seconds)
+    if minutes:
+        return "%02dm %06.3fs" % (minutes, seconds)
+    return "%06.3fs" % seconds
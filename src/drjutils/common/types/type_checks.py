@@ -11,6 +11,8 @@ and setting names and docstrings for objects.
 ## Type Aliases
 
 - `T`: Type variable for generic objects.
+- `Many`: Type alias for collections that can contain many items.
+- `OneOrMany`: Type alias for a single item or a collection of items.
 
 ## Methods:
 
@@ -27,26 +29,31 @@ Copyright 2025 Daniel Robert Jackson
 """
 Standard Libraries
 """
-from typing import Optional
-from typing_extensions import TypeAlias, TypeAliasType, TypeVar
-
-"""
-Package Libraries
-"""
-from drjutils.common.types.type_utils import (
-    T,
-    set_name, set_name_if,
-    set_docstring, set_docstring_if,
-    set_name_and_doc, set_name_and_doc_if,
-    )
+from typing import Collection, Optional, Union
+from typing_extensions import TypeAlias, TypeVar
 
 __all__ = [
+    # Type Aliases
+    "T",
+    "Many",
+    "OneOrMany",
+    # Methods
+    "set_name",
+    "set_name_if",
+    "set_docstring",
+    "set_docstring_if",
+    "set_name_and_doc",
+    "set_name_and_doc_if",
 ]
 
-T = TypeVar("T")
+T = TypeVar("T", bound=object)
 """Type variable for generic objects."""
 
 Many: TypeAlias = Collection[T]
+"""Type variable for collections that can contain many items."""
+
+OneOrMany: TypeAlias = Union[T, Many[T]]
+"""Type variable for collections that can contain one or more items."""
 
 def set_name(
     obj:  T,
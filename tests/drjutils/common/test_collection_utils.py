@@ -0,0 +1,78 @@
+"""
+Unit tests for the collection_utils module.
+
+Copyright 2025 Daniel Robert Jackson
+"""
+
+# Standard Libraries
+import importlib
+
+# Test Libraries
+import pytest
+
+# Module Under Test
+from drjutils.common.types.collections import collection_utils
+
+@pytest.fixture
+def reload_with_level(monkeypatch):
+    """Reload `collection_utils` under a given `DRJUTILS_VALIDATION` level, restoring it after."""
+    def reload(level):
+        monkeypatch.setenv("DRJUTILS_VALIDATION", level)
+        return importlib.reload(collection_utils)
+    yield reload
+    monkeypatch.undo()
+    importlib.reload(collection_utils)
+
+class TestValidationLevel:
+    """Test suite for the `DRJUTILS_VALIDATION` switch."""
+
+    @pytest.mark.parametrize("level, expected", [
+        ("FULL", "FULL"),
+        ("none", "NONE"),   # Case insensitive
+        (" ", "FULL"),      # Blank means unset
+    ])
+    def test_level_read_from_environment(self, reload_with_level, level, expected):
+        """Test that the level is read from the environment at import time."""
+        assert reload_with_level(level).VALIDATION_LEVEL == expected
+
+    @pytest.mark.parametrize("level", ["MINIMAL", "NOEN", "FUL"])
+    def test_unknown_level_rejected(self, reload_with_level, level):
+        """Test that an unknown level fails at import instead of silently meaning `FULL`."""
+        with pytest.raises(ValueError, match="Unknown DRJUTILS_VALIDATION level"):
+            reload_with_level(level)
+
+    def test_default_level_is_full(self, reload_with_level, monkeypatch):
+        """Test that validation is on when the variable is unset."""
+        monkeypatch.delenv("DRJUTILS_VALIDATION", raising=False)
+        assert importlib.reload(collection_utils).VALIDATION_LEVEL == "FULL"
+
+    def test_none_returns_input_unchecked(self, reload_with_level):
+        """Test that the `check_*` functions return their input as-is when validation is off."""
+        module = reload_with_level("NONE")
+        full, empty = [1], []
+        assert module.check_empty(full) is full
+        assert module.check_not_empty(empty) is empty
+        assert module.check_not_empty(None) is None
+
+    def test_none_skips_assertions(self, reload_with_level):
+        """Test that the `assert_*` functions do not raise when validation is off."""
+        module = reload_with_level("NONE")
+        module.assert_not_empty([])
+        module.assert_lengths_match([1], [1, 2])
+        module.assert_keys({}, included_keys="missing")
+        module.assert_values({"a": 1}, included_values=2)
+        module.assert_contains({"a": 1}, "missing")
+
+    def test_full_raises(self, reload_with_level):
+        """Test that the `check_*` and `assert_*` functions still raise when validation is on."""
+        module = reload_with_level("FULL")
+        with pytest.raises(ValueError):
+            module.check_empty([1])
+        with pytest.raises(ValueError):
+            module.check_not_empty([])
+        with pytest.raises(AssertionError):
+            module.assert_not_empty([])
+        with pytest.raises(AssertionError):
+            module.assert_lengths_match([1], [1, 2])
+        with pytest.raises(AssertionError):
+            module.assert_contains({"a": 1}, "missing")
@@ -0,0 +1,242 @@
+"""
+Unit tests for the d_bools module.
+
+Copyright 2025 Daniel Robert Jackson
+"""
+
+# Standard Libraries
+import copy
+import pickle
+import re
+from re import IGNORECASE
+
+# Test Libraries
+import pytest
+
+# Module Under Test
+from drjutils.common.types.bools import d_bools
+from drjutils.common.types.bools.d_bools import (
+    YesNo,
+    classify_batch,
+    interpret_as_bool,
+    compile_cached,
+    get_bool_pattern,
+    BOOL_RXS,
+    check_bool, check_true, check_false,
+    check_yes, check_no, check_yes_no,
+    check_on, check_off, check_on_off,
+    check_enabled, check_disabled, check_enabled_disabled,
+    check_boolish, check_trueish, check_falseish,
+    check_true_val, check_false_val, check_boolish_val, check_trueish_val, check_falseish_val,
+)
+
+# Test Constants
+string_checks = [
+    # (validator,             accepted,    rejected,  message)
+    (check_bool,             " True ",    "yes",     "Not a boolean value"),
+    (check_true,             "t",         "false",   "Not a true value"),
+    (check_false,            "\tFALSE\n", "true",    "Not a false value"),
+    (check_yes,              " Y",        "no",      "Not a yes value"),
+    (check_no,               "NO ",       "yes",     "Not a no value"),
+    (check_yes_no,           " yes ",     "true",    "Not a yes/no value"),
+    (check_on,               "On",        "off",     "Not an on value"),
+    (check_off,              " OFF ",     "on",      "Not an off value"),
+    (check_on_off,           "off",       "o",       "Not an on/off value"),
+    (check_enabled,          " Enable ",  "disable", "Not an enabled value"),
+    (check_disabled,         "DISABLED",  "enabled", "Not a disabled value"),
+    (check_enabled_disabled, " enabled",  "enab",    "Not an enabled/disabled value"),
+    (check_boolish,          " No ",      "maybe",   "Not a booleanish value"),
+    (check_trueish,          "ON",        "off",     "Not a trueish value"),
+    (check_falseish,         " f ",       "yes",     "Not a falseish value"),
+]
+
+value_checks = [
+    # (validator,        accepted,  rejected, message)
+    (check_true_val,     True,      1,        "Not a true value"),
+    (check_false_val,    " false ", 0,        "Not a false value"),
+    (check_boolish_val,  " off ",   "maybe",  "Not a booleanish value"),
+    (check_trueish_val,  "enabled", 0,        "Not a trueish value"),
+    (check_falseish_val, False,     "on",     "Not a falseish value"),
+]
+
+class TestYesNo:
+    """Test suite for the YesNo singletons."""
+
+    @pytest.mark.parametrize("value", [YesNo.Yes, YesNo.No])
+    def test_copy_returns_singleton(self, value):
+        """Test that shallow and deep copies return the singleton itself."""
+        assert copy.copy(value) is value
+        assert copy.deepcopy(value) is value
+
+    @pytest.mark.parametrize("value", [YesNo.Yes, YesNo.No])
+    def test_pickle_round_trip_returns_singleton(self, value):
+        """Test that unpickling returns the singleton itself."""
+        assert pickle.loads(pickle.dumps(value)) is value
+
+    def test_copied_keys_still_hit(self):
+        """Test that dicts keyed by the singletons survive a deep copy."""
+        table = copy.deepcopy({YesNo.Yes: "y", YesNo.No: "n"})
+        assert table[YesNo.Yes] == "y"
+        assert table[YesNo.No] == "n"
+
+    @pytest.mark.parametrize("val, expected", [
+        (True, YesNo.Yes),
+        (0, YesNo.No),
+        (" yes ", YesNo.Yes),
+        ("N", YesNo.No),
+    ])
+    def test_interp(self, val, expected):
+        """Test interpreting values as Yes/No."""
+        assert YesNo.interp(val) is expected
+
+class TestCheckValidators:
+    """Test suite for the `check_*` validators."""
+
+    @pytest.mark.parametrize("check, accepted, rejected, message", string_checks)
+    def test_check_returns_stripped(self, check, accepted, rejected, message):
+        """Test that an accepted string is returned stripped of surrounding whitespace."""
+        assert check(accepted) == accepted.strip()
+
+    @pytest.mark.parametrize("check, accepted, rejected, message", string_checks)
+    def test_check_raises(self, check, accepted, rejected, message):
+        """Test that a rejected string raises ValueError quoting the input with `%r`."""
+        with pytest.raises(ValueError) as error:
+            check(rejected)
+        assert str(error.value) == "%s: %r" % (message, rejected)
+
+    @pytest.mark.parametrize("check, accepted, rejected, message", string_checks)
+    def test_check_quotes_unstripped_input(self, check, accepted, rejected, message):
+        """Test that the error message quotes the original, unstripped input."""
+        padded = f" {rejected} "
+        with pytest.raises(ValueError) as error:
+            check(padded)
+        assert str(error.value) == "%s: %r" % (message, padded)
+
+    @pytest.mark.parametrize("check, accepted, rejected, message", value_checks)
+    def test_check_val_returns_input(self, check, accepted, rejected, message):
+        """Test that an accepted value is returned unchanged."""
+        assert check(accepted) is accepted
+
+    @pytest.mark.parametrize("check, accepted, rejected, message", value_checks)
+    def test_check_val_raises(self, check, accepted, rejected, message):
+        """Test that a rejected value raises ValueError quoting the input with `%r`."""
+        with pytest.raises(ValueError) as error:
+            check(rejected)
+        assert str(error.value) == "%s: %r" % (message, rejected)
+
+class TestPatternHelpers:
+    """Test suite for `compile_cached` and `get_bool_pattern`."""
+
+    @pytest.mark.parametrize("name", ["compile_cached", "get_bool_pattern"])
+    def test_exported(self, name):
+        """Test that the helpers are listed in `__all__` and exported by a star import."""
+        assert name in d_bools.__all__
+        namespace = {}
+        exec("from drjutils.common.types.bools.d_bools import *", namespace)
+        assert name in namespace
+
+    def test_compile_cached_memoizes(self):
+        """Test that the same pattern and flags return the same compiled object."""
+        source  = rf"(?:{BOOL_RXS})=(?:{BOOL_RXS})"
+        pattern = compile_cached(source, IGNORECASE)
+        assert compile_cached(source, IGNORECASE) is pattern
+        assert compile_cached(source) is not pattern
+        assert pattern.fullmatch("True=f")
+
+    @pytest.mark.parametrize("name, rgx_name", [
+        ("bool", "BOOL_RGX"),
+        ("YES_NO", "YES_NO_RGX"),   # Case insensitive
+        ("boolish", "BOOLISH_RGX"),
+    ])
+    def test_get_bool_pattern(self, name, rgx_name):
+        """Test that a name resolves to the module's compiled pattern."""
+        assert get_bool_pattern(name) is getattr(d_bools, rgx_name)
+
+    @pytest.mark.parametrize("name", ["maybe", "", None, 3])
+    def test_get_bool_pattern_invalid(self, name):
+        """Test that an unknown or non-string name raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown boolean pattern"):
+            get_bool_pattern(name)
+
+class TestPatterns:
+    """Test suite for the anchored `*_RGX` and unanchored `*_CORE_RGX` patterns."""
+
+    @pytest.mark.parametrize("name, string, expected", [
+        ("TRUE_RGX",    " true ", True),
+        ("TRUE_RGX",    "T",      True),
+        ("TRUE_RGX",    "tomato", False),
+        ("TRUE_RGX",    "t rue",  False),
+        ("BOOL_RGX",    "\tF\n",  True),
+        ("BOOLISH_RGX", " Off",   True),
+        ("BOOLISH_RGX", "offish", False),
+    ])
+    def test_anchored_match(self, name, string, expected):
+        """Test that `match` on an anchored pattern checks the whole string."""
+        assert bool(getattr(d_bools, name).match(string)) is expected
+
+    @pytest.mark.parametrize("name, string, expected", [
+        ("BOOL_CORE_RGX",    "true",  True),
+        ("BOOL_CORE_RGX",    " true", False),
+        ("BOOLISH_CORE_RGX", "Off",   True),
+        ("BOOLISH_CORE_RGX", "maybe", False),
+    ])
+    def test_core_fullmatch(self, name, string, expected):
+        """Test that a core pattern matches the bare word only."""
+        assert bool(getattr(d_bools, name).fullmatch(string)) is expected
+
+    def test_dispatch_group(self):
+        """Test that the anchored dispatch pattern still names the word family."""
+        match = d_bools.BOOLISH_DISPATCH_RGX.match(" Off ")
+        assert d_bools.BOOLISH_GROUP_MAP[match.lastgroup] == ("Off", False)
+
+class TestAsciiOnly:
+    """Test suite for keeping the literal lookups to the language of the ASCII patterns."""
+
+    @pytest.mark.parametrize("string", [
+        "o\ufb00",     # "off" spelled with the ff ligature, which casefolds to "ff"
+        "ye\u017f",    # "yes" spelled with a long s, which casefolds to "s"
+        "\xa0true",    # No-break space
+        "on\u3000",    # Ideographic space
+        "\x1cno",      # File separator (str.isspace but not ASCII whitespace)
+    ])
+    def test_non_ascii_rejected(self, string):
+        """Test that the predicates, validators and interpreters reject what the patterns reject."""
+        assert not d_bools.BOOLISH_RGX.match(string)
+        assert not d_bools.is_boolish(string)
+        assert d_bools.interpret_as_bool(string) is None
+        assert classify_batch([string]) == [None]
+        with pytest.raises(ValueError):
+            check_boolish(string)
+
+class TestPublicNames:
+    """Test suite for the module's public names."""
+
+    def test_all_matches_documented_tables(self):
+        """Test that `__all__` lists exactly the names in the module docstring tables."""
+        documented = re.findall(r"^\| `(\w+)`", d_bools.__doc__, re.MULTILINE)
+        assert sorted(d_bools.__all__) == sorted(documented)
+
+    def test_all_names_resolve(self):
+        """Test that every name in `__all__` resolves, including the lazily compiled patterns."""
+        for name in d_bools.__all__:
+            assert getattr(d_bools, name) is not None
+
+class TestClassifyBatch:
+    """Test suite for `classify_batch`."""
+
+    def test_strings(self):
+        """Test interpreting a batch of strings."""
+        assert classify_batch([" Yes ", "off", "T", "maybe", ""]) == [True, False, True, None, None]
+
+    def test_iterator(self):
+        """Test that any iterable is accepted."""
+        assert classify_batch(iter(["on", "disabled"])) == [True, False]
+
+    @pytest.mark.parametrize("values", [
+        [1, 0, True, False, 2.5, 0.0],
+        ["yes", 1, "off", None, "maybe", False],
+        [object()],
+    ])
+    def test_matches_interpret_as_bool(self, values):
+        """Test that mixed batches agree with `interpret_as_bool` element by element."""
+        assert classify_batch(values) == [interpret_as_bool(value) for value in values]
@@ -0,0 +1,212 @@
+"""
+Unit tests for the d_numbers module.
+
+Copyright 2025 Daniel Robert Jackson
+"""
+
+# Standard Libraries
+from decimal   import Decimal
+from fractions import Fraction
+
+# Test Libraries
+import pytest
+
+# Module Under Test
+from drjutils.common.types.strings.d_numbers import (
+    format_number,
+    format_numbers,
+    is_int_bin,
+    is_int_dec,
+    is_int_hex,
+    is_int_non_dec,
+    is_int_oct,
+    is_int_str,
+    is_number,
+    is_real_basic,
+    is_real_scinot,
+    is_real_str,
+    to_number,
+    to_numbers,
+    INT_BIN_RGX,
+    INT_DEC_RGX,
+    INT_HEX_RGX,
+    INT_NON_DEC_RGX,
+    INT_OCT_RGX,
+    INT_RGX,
+    NUM_RGX,
+    REAL_BSC_RGX,
+    REAL_RGX,
+    REAL_SCI_RGX,
+)
+
+# Test Constants
+grammar_corpus = [
+    # Decimal integers and signs
+    "0", "+0", "-0", "42", "+123", "-17", "0012",
+    # Whitespace
+    " 42 ", "\t-17\n", " 0x1A ", " 1.0E+5 ",
+    # Non-ASCII whitespace and separators, which the ASCII patterns reject
+    "\xa05", "5\u3000", "\x1c5", "5\x1f", "\xa00x1a", "\u20031.5", "\x85inf",
+    # Non-decimal prefixes
+    "0x1a", "0X1A", "-0x1a", "+0xff", "0b101", "0B101", "-0b101", "0o755", "0O755",
+    # Incomplete or invalid non-decimal digits
+    "0x", "0xg", "0b", "0b102", "0o", "0o8",
+    # Basic reals
+    "3.14", "-17.5", "+0.2", ".7", "7.", ".",
+    # Exponents
+    "1.0e-5", "1.0E+5", "2.3e4", "56E67", ".5e1", "5.e1", "0e0", "1e", "e5", "1e+",
+    # Special reals
+    "inf", "INF", "+infinity", "-Infinity", "nan", "NaN", "-nan", "infinit",
+    # Junk and junk suffixes
+    "", "+", "-", "abc", "12abc", "42 abc", "1 2", "++1", "0x1a.5", "1.2.3", "1_000",
+]
+
+predicate_patterns = [
+    (is_int_str,     INT_RGX),
+    (is_int_dec,     INT_DEC_RGX),
+    (is_int_bin,     INT_BIN_RGX),
+    (is_int_hex,     INT_HEX_RGX),
+    (is_int_oct,     INT_OCT_RGX),
+    (is_int_non_dec, INT_NON_DEC_RGX),
+    (is_real_str,    REAL_RGX),
+    (is_real_basic,  REAL_BSC_RGX),
+    (is_real_scinot, REAL_SCI_RGX),
+    (is_number,      NUM_RGX),
+]
+
+class TestToNumber:
+    """Test suite for converting strings to numbers."""
+
+    @pytest.mark.parametrize("num_str, expected", [
+        ("0", 0),
+        (" 42 ", 42),     # Whitespace handling
+        ("-17", -17),
+        ("01", 1),        # Zero-padded decimal stays an int
+        ("+0012", 12),
+        ("0x1a", 26),     # Hexadecimal
+        ("-0b101", -5),   # Binary
+        ("0o755", 493),   # Octal
+        ("3.14", 3.14),
+        (".5", 0.5),      # No leading zero
+        ("5.", 5.0),      # No trailing digit
+        ("1e-10", 1e-10),
+        ("-6.78e+2", -678.0),
+    ])
+    def test_to_number(self, num_str, expected):
+        """Test conversion of valid number strings."""
+        result = to_number(num_str)
+        assert result == expected
+        assert type(result) is type(expected)
+
+    @pytest.mark.parametrize("num_str", [
+        "abc",
+        "",
+        "+",
+        "12abc",
+        "0x",
+        "1_000",          # Underscore separators
+        "0_1",
+        "0x_1",
+        "\u00b2",        # Superscript two (isdigit but not a decimal digit)
+        "\u0663",        # Arabic-Indic three
+        "\xa05",         # No-break space, which the ASCII patterns do not trim
+        "5\u3000",       # Ideographic space
+        "\x1c5",         # File separator (str.isspace but not ASCII whitespace)
+    ])
+    def test_to_number_invalid(self, num_str):
+        """Test that strings `is_number` rejects raise the documented ValueError."""
+        assert not is_number(num_str)
+        with pytest.raises(ValueError, match="Invalid number format"):
+            to_number(num_str)
+
+    @pytest.mark.parametrize("num_str", [
+        "0", "01", "-0b101", "0o755", "0x1A", "3.14", ".5", "5.", "1E+5",
+        "inf", "-Infinity", "nan", "NaN",
+    ])
+    def test_to_number_accepts_what_is_number_accepts(self, num_str):
+        """Test that every string `is_number` accepts converts without error."""
+        assert is_number(num_str)
+        to_number(num_str)
+
+    @pytest.mark.parametrize("num", [0, -3, 2.5, True, Fraction(1, 3), Decimal("1.5"), 1 + 2j])
+    def test_to_number_passes_numbers_through(self, num):
+        """Test that numbers are returned as-is."""
+        assert to_number(num) is num
+
+    @pytest.mark.parametrize("value", [None, [1], b"1", object()])
+    def test_to_number_rejects_other_types(self, value):
+        """Test that values that are neither strings nor numbers raise TypeError."""
+        with pytest.raises(TypeError, match="Not a number or string"):
+            to_number(value)
+
+    def test_to_number_passes_numbers_through(self):
+        """Test that non-string input is returned as-is."""
+        assert to_number(7) == 7
+        assert to_number(2.5) == 2.5
+
+class TestScanners:
+    """Test suite checking the hand-written scanners against the documented regex grammar."""
+
+    @pytest.mark.parametrize("num_str", grammar_corpus)
+    @pytest.mark.parametrize("predicate, pattern", predicate_patterns)
+    def test_predicate_matches_grammar(self, predicate, pattern, num_str):
+        """Test that each predicate accepts exactly what its `*_RGX` pattern matches."""
+        assert predicate(num_str) == (pattern.match(num_str) is not None)
+
+    @pytest.mark.parametrize("num_str, expected", [
+        ("0x1a", True),
+        (" 0X1A ", True),  # Whitespace handling
+        ("0b101", True),
+        ("0O755", True),
+        ("+0x1a", True),   # With positive sign
+        ("-0b101", True),  # With negative sign
+        ("0x", False),     # Incomplete prefix
+        ("0o8", False),    # Digit outside the base
+        ("42", False),     # Decimal integer
+        ("3.14", False),   # Real
+        ("", False),       # Empty string
+    ])
+    def test_is_int_non_dec(self, num_str, expected):
+        """Test non-decimal integer validation."""
+        assert is_int_non_dec(num_str) == expected
+
+class TestFormatNumbers:
+    """Test suite for the compact number formatters and bulk converters."""
+
+    @pytest.mark.parametrize("num, expected", [
+        (0, "0"),
+        (-17, "-17"),
+        (3.14, "3.14"),
+        (2.0, "2"),              # Integral float
+        (-0.005, "-0.005"),
+        (1e-10, "1e-10"),
+        (1000000.000001, "1000000.000001"),
+        ("2.0", "2"),            # Numeric string
+        (" 0x1a ", "26"),        # Non-decimal string
+        (float("inf"), "inf"),
+    ])
+    def test_format_number(self, num, expected):
+        """Test formatting a single number."""
+        assert format_number(num) == expected
+
+    def test_format_numbers(self):
+        """Test that bulk formatting matches formatting one at a time, in order."""
+        nums = [0, 2.0, "3.50", -0.005, "0b11"]
+        assert format_numbers(nums) == [format_number(num) for num in nums]
+        assert format_numbers(iter(nums)) == ["0", "2", "3.5", "-0.005", "3"]
+
+    def test_format_number_invalid(self):
+        """Test that a non-numeric string raises ValueError."""
+        with pytest.raises(ValueError):
+            format_number("abc")
+
+    def test_to_numbers(self):
+        """Test that bulk conversion matches converting one at a time, in order."""
+        nums = ["1", " 2.5 ", "0x10", 7, "-1e3"]
+        assert to_numbers(nums) == [1, 2.5, 16, 7, -1000.0]
+        assert to_numbers(iter([])) == []
+
+    def test_to_numbers_invalid(self):
+        """Test that one invalid string fails the whole batch with ValueError."""
+        with pytest.raises(ValueError, match="Invalid number format"):
+            to_numbers(["1", "two", "3"])
@@ -0,0 +1,116 @@
+"""
+Unit tests for the enum_utils module.
+
+Copyright 2025 Daniel Robert Jackson
+"""
+
+# Standard Libraries
+from enum import Enum
+
+# Test Libraries
+import pytest
+
+# Module Under Test
+from drjutils.common.types.enums.enum_utils import (
+    make_enum_to_strings_dict,
+    make_string_to_enum_dict,
+)
+
+# Test Constants
+class Color(Enum):
+    """A small enum for exercising the dictionary builders."""
+    RED   = 1
+    GREEN = 2
+
+ENUM_TO_STRS = {Color.RED: ("red", "r"), Color.GREEN: ("green",)}
+STR_TO_ENUM  = {"red": Color.RED, "r": Color.RED, "green": Color.GREEN}
+
+class TestMakeEnumToStringsDict:
+    """Test suite for the forms of `make_enum_to_strings_dict`."""
+
+    @pytest.mark.parametrize("args", [
+        ({Color.RED: ["red", "r"], Color.GREEN: ["green"]},),
+        ([(Color.RED, ["red", "r"]), (Color.GREEN, ["green"])],),
+        ([Color.RED, Color.GREEN], [["red", "r"], ["green"]]),
+        (STR_TO_ENUM,),
+    ])
+    def test_forms(self, args):
+        """Each form builds the same dictionary."""
+        assert make_enum_to_strings_dict(*args) == ENUM_TO_STRS
+
+    def test_str_keyed_updates_given_dict(self):
+        """A string-keyed mapping with a dictionary to update selects the string-map form."""
+        existing = {Color.GREEN: ("green",)}
+        result = make_enum_to_strings_dict({"red": Color.RED}, existing)
+        assert result is existing
+        assert existing == {Color.GREEN: ("green",), Color.RED: ("red",)}
+
+    def test_mixed_keys(self):
+        """A mapping keyed by both strings and Enum members is rejected, whatever the key order."""
+        with pytest.raises(TypeError, match="all strings or all Enum members"):
+            make_enum_to_strings_dict({Color.RED: ["red"], "green": Color.GREEN})
+        with pytest.raises(TypeError, match="all strings or all Enum members"):
+            make_enum_to_strings_dict({"green": Color.GREEN, Color.RED: ["red"]})
+
+    def test_empty_mapping(self):
+        """An empty mapping is rejected as empty."""
+        with pytest.raises(AssertionError, match="must not be empty"):
+            make_enum_to_strings_dict({})
+
+    def test_updates_given_dict(self):
+        """A given dictionary is updated and returned."""
+        existing = {Color.GREEN: ("green",)}
+        result = make_enum_to_strings_dict([(Color.RED, ["red"])], existing)
+        assert result is existing
+        assert existing == {Color.GREEN: ("green",), Color.RED: ("red",)}
+
+    def test_fresh_dict_per_call(self):
+        """Calls without a dictionary do not share one."""
+        first = make_enum_to_strings_dict([(Color.RED, ["red"])])
+        second = make_enum_to_strings_dict([(Color.GREEN, ["green"])])
+        assert first == {Color.RED: ("red",)}
+        assert second == {Color.GREEN: ("green",)}
+
+    @pytest.mark.parametrize("args", [
+        ({Color.RED: ["red"]}, {}),                 # An Enum-keyed map takes no dictionary
+        ([(Color.RED, ["red"])], None, {}),         # Pairs take a single dictionary
+        (1, 2, 3, 4),
+    ])
+    def test_no_matching_form(self, args):
+        """Arguments that match no form raise TypeError."""
+        with pytest.raises(TypeError):
+            make_enum_to_strings_dict(*args)
+
+class TestMakeStringToEnumDict:
+    """Test suite for the forms of `make_string_to_enum_dict`."""
+
+    @pytest.mark.parametrize("args", [
+        ({Color.RED: ["red", "r"], Color.GREEN: ["green"]},),
+        ([(Color.RED, ["red", "r"]), (Color.GREEN, ["green"])],),
+        ([Color.RED, Color.GREEN], [["red", "r"], ["green"]]),
+    ])
+    def test_forms(self, args):
+        """Each form builds the same dictionary."""
+        assert make_string_to_enum_dict(*args) == STR_TO_ENUM
+
+    def test_updates_given_dict(self):
+        """A given dictionary is updated and returned."""
+        existing = {"green": Color.GREEN}
+        result = make_string_to_enum_dict([(Color.RED, ["red"])], existing)
+        assert result is existing
+        assert existing == {"green": Color.GREEN, "red": Color.RED}
+
+    def test_duplicate_string(self):
+        """A string shared by two members is rejected."""
+        with pytest.raises(AssertionError):
+            make_string_to_enum_dict({Color.RED: ["x"], Color.GREEN: ["x"]})
+
+    @pytest.mark.parametrize("args", [
+        ({Color.RED: ["red"]}, [["red"]]),          # A map takes no string representations
+        ([(Color.RED, ["red"])], None, {}),         # Pairs take a single dictionary
+        (1, 2, 3, 4),
+    ])
+    def test_no_matching_form(self, args):
+        """Arguments that match no form raise TypeError."""
+        with pytest.raises(TypeError):
+            make_string_to_enum_dict(*args)